@@ -0,0 +1,43 @@
+"""add files tags gin index
+
+コンテンツ検索のタグフィルタ（tags @> '["タグ"]'）用に、
+filesテーブルのtags（JSONB）へGINインデックス（jsonb_path_ops、deleted_at IS NULL）を追加します。
+
+Revision ID: a2b3c4d5e6f7
+Revises: f1a2b3c4d5e6
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a2b3c4d5e6f7'
+down_revision = 'f1a2b3c4d5e6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    tagsのGINインデックスを追加
+    
+    タグ検索は包含演算子（@>）のみを使用するため、jsonb_opsより小さいjsonb_path_opsを使用します。
+    """
+    op.create_index(
+        'ix_files_tags_gin',
+        'files',
+        ['tags'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'tags': 'jsonb_path_ops'},
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    """
+    tagsのGINインデックスを削除
+    """
+    op.drop_index('ix_files_tags_gin', table_name='files')
@@ -0,0 +1,39 @@
+"""add files tenant/created_at/id index
+
+filesテーブルに(tenant_id, created_at DESC, id DESC)の部分インデックス（deleted_at IS NULL）を追加して、
+コンテンツ一覧の作成日時順取得とキーセットページネーションを高速化します。
+
+Revision ID: a5b6c7d8e9f0
+Revises: f4a5b6c7d8e9
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a5b6c7d8e9f0'
+down_revision = 'f4a5b6c7d8e9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    filesテーブルに一覧取得用の部分インデックスを追加
+    """
+    op.create_index(
+        'ix_files_tenant_created_id_active',
+        'files',
+        ['tenant_id', sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    """
+    部分インデックスを削除
+    """
+    op.drop_index('ix_files_tenant_created_id_active', table_name='files')
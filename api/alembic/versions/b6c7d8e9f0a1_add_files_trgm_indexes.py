@@ -0,0 +1,58 @@
+"""add files title/description trigram indexes
+
+filesテーブルのtitle/descriptionにpg_trgmのGINインデックス（deleted_at IS NULL）を追加して、
+コンテンツ一覧・検索の部分一致（ILIKE '%語%'）をシーケンシャルスキャンなしで実行できるようにします。
+
+Revision ID: b6c7d8e9f0a1
+Revises: a5b6c7d8e9f0
+Create Date: 2026-10-17 19:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b6c7d8e9f0a1'
+down_revision = 'a5b6c7d8e9f0'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    filesテーブルのtitle/descriptionにトライグラムインデックスを追加
+    
+    ILIKEの前方・後方ワイルドカード検索はB-treeインデックスを使えないため、
+    gin_trgm_opsのGINインデックスで3文字単位の候補絞り込みを行います。
+    （検索語が3文字未満の場合はインデックスを使わずに従来どおり検索されます）
+    """
+    # pg_trgm拡張が有効であることを確認
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    
+    op.create_index(
+        'ix_files_title_trgm',
+        'files',
+        ['title'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'title': 'gin_trgm_ops'},
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+    op.create_index(
+        'ix_files_description_trgm',
+        'files',
+        ['description'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'description': 'gin_trgm_ops'},
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    """
+    トライグラムインデックスを削除
+    """
+    op.drop_index('ix_files_description_trgm', table_name='files')
+    op.drop_index('ix_files_title_trgm', table_name='files')
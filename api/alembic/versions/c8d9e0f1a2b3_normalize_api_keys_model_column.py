@@ -0,0 +1,90 @@
+"""normalize api_keys model column
+
+api_keysテーブルのモデル列をmodel_nameに統一します。
+旧スキーマのmodel列が残っている環境では値をmodel_nameへ移し、model列を削除します。
+これによりアプリケーション側のカラム有無の判定とSQLの分岐が不要になります。
+
+Revision ID: c8d9e0f1a2b3
+Revises: b6c7d8e9f0a1
+Create Date: 2026-10-17 20:00:00.000000
+
+"""
+import logging
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c8d9e0f1a2b3'
+down_revision = 'b6c7d8e9f0a1'
+branch_labels = None
+depends_on = None
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+
+def _api_key_columns() -> set:
+    """
+    api_keysテーブルのカラム名を取得
+    """
+    return {c['name'] for c in sa.inspect(op.get_bind()).get_columns('api_keys')}
+
+
+def upgrade() -> None:
+    """
+    モデル列をmodel_nameに統一
+    
+    1. model_nameがない場合は追加し、modelの値（空でないもの）を優先してmodel_nameへ移す
+    2. 統一後に重複するアクティブなAPIキーは最新のもの以外を非アクティブにする
+    3. model列と、model列に作成されていた部分ユニークインデックスを削除し、model_nameで作り直す
+    """
+    columns = _api_key_columns()
+    if 'model' not in columns:
+        if 'model_name' not in columns:
+            op.add_column('api_keys', sa.Column('model_name', sa.String(length=100), nullable=False, server_default=''))
+            op.alter_column('api_keys', 'model_name', server_default=None)
+        return
+
+    if 'model_name' not in columns:
+        op.add_column('api_keys', sa.Column('model_name', sa.String(length=100), nullable=True))
+    op.execute("UPDATE api_keys SET model_name = COALESCE(NULLIF(model, ''), model_name, '')")
+    op.alter_column('api_keys', 'model_name', existing_type=sa.String(length=100), nullable=False)
+
+    op.execute("DROP INDEX IF EXISTS ux_api_keys_tenant_provider_model_active")
+    result = op.get_bind().execute(sa.text("""
+        UPDATE api_keys SET is_active = false, updated_at = NOW()
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, ROW_NUMBER() OVER (
+                    PARTITION BY tenant_id, provider, model_name
+                    ORDER BY created_at DESC
+                ) AS rn
+                FROM api_keys
+                WHERE is_active = true
+            ) ranked
+            WHERE ranked.rn > 1
+        )
+    """))
+    # 非アクティブ化はdowngradeで元に戻せないため、件数を記録する
+    logger.warning(f"api_keys: モデル列の統一で重複した有効なAPIキーを非アクティブ化しました: {result.rowcount}件")
+    op.drop_column('api_keys', 'model')
+    op.create_index(
+        'ux_api_keys_tenant_provider_model_active',
+        'api_keys',
+        ['tenant_id', 'provider', 'model_name'],
+        unique=True,
+        postgresql_where=sa.text('is_active'),
+    )
+
+
+def downgrade() -> None:
+    """
+    model列（NULL許可）を再作成し、model_nameの値で埋める
+    
+    upgradeで非アクティブ化した重複キーは区別できないため元に戻さない（件数はupgrade時のログを参照）
+    """
+    if 'model' in _api_key_columns():
+        return
+    op.add_column('api_keys', sa.Column('model', sa.String(length=100), nullable=True))
+    op.execute("UPDATE api_keys SET model = model_name")
@@ -0,0 +1,38 @@
+"""add api_keys tenant/provider/is_active index
+
+api_keysテーブルに(tenant_id, provider, is_active)の複合インデックスを追加して、
+プロバイダー別のアクティブAPIキー取得と重複チェックを高速化します。
+
+Revision ID: d2e3f4a5b6c7
+Revises: 9c0d1e2f3a4b
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd2e3f4a5b6c7'
+down_revision = '9c0d1e2f3a4b'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    api_keysテーブルに(tenant_id, provider, is_active)の複合インデックスを追加
+    """
+    op.create_index(
+        'ix_api_keys_tenant_provider_active',
+        'api_keys',
+        ['tenant_id', 'provider', 'is_active'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """
+    複合インデックスを削除
+    """
+    op.drop_index('ix_api_keys_tenant_provider_active', table_name='api_keys')
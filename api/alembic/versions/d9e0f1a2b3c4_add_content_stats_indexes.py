@@ -0,0 +1,50 @@
+"""add content stats indexes
+
+コンテンツ統計の集計用インデックスを追加します。
+- files: (tenant_id, status, file_type) INCLUDE (size_bytes) の部分インデックス（deleted_at IS NULL）
+  ステータス・ファイルタイプ別の件数とサイズ合計をインデックスのみのスキャンで集計できるようにします。
+- chunks: tenant_id のインデックス
+  テナント別のチャンク件数集計で全チャンクをスキャンしないようにします。
+
+Revision ID: d9e0f1a2b3c4
+Revises: c8d9e0f1a2b3
+Create Date: 2026-10-17 21:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd9e0f1a2b3c4'
+down_revision = 'c8d9e0f1a2b3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    コンテンツ統計の集計用インデックスを追加
+    """
+    op.create_index(
+        'ix_files_tenant_status_type_active',
+        'files',
+        ['tenant_id', 'status', 'file_type'],
+        unique=False,
+        postgresql_include=['size_bytes'],
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+    op.create_index(
+        'ix_chunks_tenant_id',
+        'chunks',
+        ['tenant_id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """
+    コンテンツ統計の集計用インデックスを削除
+    """
+    op.drop_index('ix_chunks_tenant_id', table_name='chunks')
+    op.drop_index('ix_files_tenant_status_type_active', table_name='files')
@@ -0,0 +1,43 @@
+"""add files idempotency key index
+
+アップロード時のIdempotency-Key照会（metadata->>'idempotency_key'）用に、
+filesテーブルへ(tenant_id, metadata->>'idempotency_key')の部分式インデックスを追加します。
+キーを持つ未削除ファイルのみを対象にするため、インデックスは小さく保たれます。
+
+Revision ID: e0f1a2b3c4d5
+Revises: d9e0f1a2b3c4
+Create Date: 2026-10-17 22:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e0f1a2b3c4d5'
+down_revision = 'd9e0f1a2b3c4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Idempotency-Key照会用の式インデックスを追加
+    
+    照会クエリの条件（deleted_at IS NULL かつ metadata->>'idempotency_key' = キー）から
+    部分インデックスの条件が導けるため、テナントのファイル全件を走査せずに照会できます。
+    """
+    op.create_index(
+        'ix_files_tenant_idempotency_key',
+        'files',
+        ['tenant_id', sa.text("(metadata ->> 'idempotency_key')")],
+        unique=False,
+        postgresql_where=sa.text("deleted_at IS NULL AND (metadata ->> 'idempotency_key') IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    """
+    Idempotency-Key照会用の式インデックスを削除
+    """
+    op.drop_index('ix_files_tenant_idempotency_key', table_name='files')
@@ -0,0 +1,83 @@
+"""reencrypt legacy api_keys with aes-gcm
+
+旧形式（Fernetトークンをさらにbase64化したもの）で保存されているAPIキーを
+AES-GCM形式（base64(nonce + 暗号文 + 認証タグ)）で暗号化し直します。
+二重のbase64エンコードがなくなるため、保存サイズも小さくなります。
+
+Revision ID: e3f4a5b6c7d8
+Revises: d2e3f4a5b6c7
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+import base64
+import hashlib
+import os
+
+from alembic import op
+import sqlalchemy as sa
+from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+from app.core.config import settings
+
+
+# revision identifiers, used by Alembic.
+revision = 'e3f4a5b6c7d8'
+down_revision = 'd2e3f4a5b6c7'
+branch_labels = None
+depends_on = None
+
+
+# ApiKeyServiceと同じ鍵・形式
+_NONCE_SIZE = 12
+_FERNET_TOKEN_PREFIX = b'gAAAAA'
+
+
+def _ciphers():
+    """AES-GCMと旧形式用Fernetの暗号化オブジェクトを生成"""
+    aead = AESGCM(hashlib.sha256(settings.SECRET_KEY.encode()).digest())
+    fernet = Fernet(base64.urlsafe_b64encode(settings.SECRET_KEY.encode()[:32].ljust(32, b'0')))
+    return aead, fernet
+
+
+def upgrade() -> None:
+    """
+    旧形式のAPIキーをAES-GCM形式で暗号化し直す
+    """
+    aead, fernet = _ciphers()
+    conn = op.get_bind()
+    rows = conn.execute(sa.text("SELECT id, api_key FROM api_keys")).fetchall()
+    for row_id, stored in rows:
+        token = base64.urlsafe_b64decode(stored.encode())
+        if not token.startswith(_FERNET_TOKEN_PREFIX):
+            continue
+        try:
+            plaintext = fernet.decrypt(token)
+        except InvalidToken:
+            # 先頭が偶然一致したAES-GCM形式のトークン
+            continue
+        nonce = os.urandom(_NONCE_SIZE)
+        reencrypted = base64.urlsafe_b64encode(nonce + aead.encrypt(nonce, plaintext, None)).decode()
+        conn.execute(
+            sa.text("UPDATE api_keys SET api_key = :api_key WHERE id = :id"),
+            {"api_key": reencrypted, "id": row_id}
+        )
+
+
+def downgrade() -> None:
+    """
+    AES-GCM形式のAPIキーを旧形式（Fernet + base64）に戻す
+    """
+    aead, fernet = _ciphers()
+    conn = op.get_bind()
+    rows = conn.execute(sa.text("SELECT id, api_key FROM api_keys")).fetchall()
+    for row_id, stored in rows:
+        token = base64.urlsafe_b64decode(stored.encode())
+        if token.startswith(_FERNET_TOKEN_PREFIX):
+            continue
+        plaintext = aead.decrypt(token[:_NONCE_SIZE], token[_NONCE_SIZE:], None)
+        legacy = base64.urlsafe_b64encode(fernet.encrypt(plaintext)).decode()
+        conn.execute(
+            sa.text("UPDATE api_keys SET api_key = :api_key WHERE id = :id"),
+            {"api_key": legacy, "id": row_id}
+        )
@@ -0,0 +1,41 @@
+"""add files tenant file name index
+
+アップロード時のファイル名重複チェック用に、
+filesテーブルへ(tenant_id, file_name)の部分インデックス（deleted_at IS NULL）を追加します。
+
+Revision ID: f1a2b3c4d5e6
+Revises: e0f1a2b3c4d5
+Create Date: 2026-10-17 23:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f1a2b3c4d5e6'
+down_revision = 'e0f1a2b3c4d5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    ファイル名重複チェック用のインデックスを追加
+    
+    既存データに同名の未削除ファイルが残っている可能性があるため、一意インデックスにはしません。
+    """
+    op.create_index(
+        'ix_files_tenant_file_name_active',
+        'files',
+        ['tenant_id', 'file_name'],
+        unique=False,
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    """
+    ファイル名重複チェック用のインデックスを削除
+    """
+    op.drop_index('ix_files_tenant_file_name_active', table_name='files')
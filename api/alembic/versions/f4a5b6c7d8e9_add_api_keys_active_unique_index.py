@@ -0,0 +1,73 @@
+"""add api_keys active unique index
+
+同一テナント・同一プロバイダー・同一モデルのアクティブなAPIキーを1件に制限する
+部分ユニークインデックスを追加します。APIキー作成時の重複チェックを
+INSERT ... ON CONFLICT DO NOTHING でDB側に任せ、プロセス間の競合も防ぎます。
+
+Revision ID: f4a5b6c7d8e9
+Revises: e3f4a5b6c7d8
+Create Date: 2026-10-17 17:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f4a5b6c7d8e9'
+down_revision = 'e3f4a5b6c7d8'
+branch_labels = None
+depends_on = None
+
+
+def _model_column() -> str:
+    """
+    重複判定に使用するモデル列名を取得（両方のカラムが存在する場合はmodelを優先）
+    """
+    conn = op.get_bind()
+    columns = {
+        row[0] for row in conn.execute(sa.text("""
+            SELECT column_name
+            FROM information_schema.columns
+            WHERE table_name = 'api_keys'
+            AND column_name IN ('model', 'model_name')
+        """))
+    }
+    return 'model' if 'model' in columns else 'model_name'
+
+
+def upgrade() -> None:
+    """
+    部分ユニークインデックスを追加
+    
+    既にアクティブな重複がある場合は、最新のもの以外を非アクティブにしてから作成します。
+    """
+    model_column = _model_column()
+    op.execute(f"""
+        UPDATE api_keys SET is_active = false, updated_at = NOW()
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, ROW_NUMBER() OVER (
+                    PARTITION BY tenant_id, provider, {model_column}
+                    ORDER BY created_at DESC
+                ) AS rn
+                FROM api_keys
+                WHERE is_active = true
+            ) ranked
+            WHERE ranked.rn > 1
+        )
+    """)
+    op.create_index(
+        'ux_api_keys_tenant_provider_model_active',
+        'api_keys',
+        ['tenant_id', 'provider', model_column],
+        unique=True,
+        postgresql_where=sa.text('is_active'),
+    )
+
+
+def downgrade() -> None:
+    """
+    部分ユニークインデックスを削除
+    """
+    op.drop_index('ux_api_keys_tenant_provider_model_active', table_name='api_keys')
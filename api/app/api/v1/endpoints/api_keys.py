@@ -35,6 +35,19 @@ from app.core.constants import ApiKeySettings
 router = APIRouter()
 
 
+# APIキー一覧取得SQL（モジュール読み込み時に一度だけ構築）
+# 一覧ではマスク表示のみのため、暗号化済みAPIキーは全体を取得せず先頭・末尾・長さだけ取得する
+_LIST_STMT = text("""
+    SELECT id, tenant_id, provider,
+           LEFT(api_key, 4) AS api_key_head, RIGHT(api_key, 4) AS api_key_tail,
+           COALESCE(LENGTH(api_key), 0) AS api_key_length,
+           model_name, is_active, created_at, updated_at
+    FROM api_keys
+    WHERE tenant_id = :tid
+    ORDER BY created_at DESC
+""")
+
+
 def translate_validation_error(errors: List[dict]) -> str:
     """
     Pydanticバリデーションエラーメッセージを日本語に変換
@@ -255,73 +268,21 @@ async def get_api_keys(
                 detail="テナントに所属していません"
             )
         
-        # model/model_nameカラムの存在をチェック
-        check_columns_query = text("""
-            SELECT column_name 
-            FROM information_schema.columns 
-            WHERE table_name = 'api_keys' 
-            AND column_name IN ('model', 'model_name')
-        """)
-        columns_check = await db.execute(check_columns_query)
-        existing_columns = {row[0] for row in columns_check.fetchall()}
-        has_model = 'model' in existing_columns
-        has_model_name = 'model_name' in existing_columns
-        
-        # カラムに応じてSELECT文を構築
-        if has_model and has_model_name:
-            # 両方のカラムが存在する場合、modelを優先
-            select_query = text("""
-                SELECT id, tenant_id, provider, api_key, model, is_active, created_at, updated_at
-                FROM api_keys
-                WHERE tenant_id = :tid
-                ORDER BY created_at DESC
-            """)
-        elif has_model:
-            # modelのみ存在する場合
-            select_query = text("""
-                SELECT id, tenant_id, provider, api_key, model, is_active, created_at, updated_at
-                FROM api_keys
-                WHERE tenant_id = :tid
-                ORDER BY created_at DESC
-            """)
-        elif has_model_name:
-            # model_nameのみ存在する場合
-            select_query = text("""
-                SELECT id, tenant_id, provider, api_key, model_name, is_active, created_at, updated_at
-                FROM api_keys
-                WHERE tenant_id = :tid
-                ORDER BY created_at DESC
-            """)
-        else:
-            # どちらも存在しない場合
-            select_query = text("""
-            SELECT id, tenant_id, provider, api_key, is_active, created_at, updated_at
-            FROM api_keys
-            WHERE tenant_id = :tid
-            ORDER BY created_at DESC
-            """)
-        
-        result = await db.execute(select_query, {"tid": str(current_user.tenant_id)})
-        rows = result.mappings().all()
+        result = await db.execute(_LIST_STMT, {"tid": str(current_user.tenant_id)})
         
+        # 行リストを一旦作らず、結果を走査しながらレスポンスを構築
         api_key_responses = []
-        for r in rows:
-            enc = r["api_key"]
-            masked = ApiKeyResponse.mask_api_key(enc if isinstance(enc, str) else str(enc or ''))
-            
-            # モデル値の取得（modelを優先、なければmodel_name、なければ空文字列）
-            model_value = ""
-            if 'model' in r:
-                model_value = r['model'] or ""
-            elif 'model_name' in r:
-                model_value = r['model_name'] or ""
+        for r in result.mappings():
+            masked = ApiKeyResponse.mask_api_key_parts(
+                r["api_key_head"] or "", r["api_key_tail"] or "", r["api_key_length"]
+            )
             
             api_key_responses.append(ApiKeyResponse(
                 id=str(r["id"]),
                 tenant_id=str(r["tenant_id"]),
                 provider=r["provider"],
                 api_key_masked=masked,
-                model=model_value,
+                model=r["model_name"] or "",
                 is_active=bool(r["is_active"]),
                 created_at=r["created_at"],
                 updated_at=r["updated_at"]
@@ -378,31 +339,12 @@ async def get_api_key(
         decrypted_key = api_key_service.get_decrypted_api_key(api_key)
         masked_key = ApiKeyResponse.mask_api_key(decrypted_key)
         
-        # modelカラムの存在をチェック
-        check_columns_query = text("""
-            SELECT column_name 
-            FROM information_schema.columns 
-            WHERE table_name = 'api_keys' 
-            AND column_name IN ('model', 'model_name')
-        """)
-        columns_check = await db.execute(check_columns_query)
-        existing_columns = {row[0] for row in columns_check.fetchall()}
-        has_model = 'model' in existing_columns
-        has_model_name = 'model_name' in existing_columns
-        
-        # model値の取得（modelを優先、なければmodel_name、なければ空文字列）
-        model_value = ""
-        if has_model:
-            model_value = getattr(api_key, 'model', '') or ''
-        elif has_model_name:
-            model_value = getattr(api_key, 'model_name', '') or ''
-        
         return ApiKeyResponse(
             id=str(api_key.id),
             tenant_id=str(api_key.tenant_id),
             provider=api_key.provider,
             api_key_masked=masked_key,
-            model=model_value,
+            model=api_key.model_name or "",
             is_active=api_key.is_active,
             created_at=api_key.created_at,
             updated_at=api_key.updated_at
@@ -473,31 +415,12 @@ async def update_api_key(
         decrypted_key = api_key_service.get_decrypted_api_key(api_key)
         masked_key = ApiKeyResponse.mask_api_key(decrypted_key)
         
-        # modelカラムの存在をチェック
-        check_columns_query = text("""
-            SELECT column_name 
-            FROM information_schema.columns 
-            WHERE table_name = 'api_keys' 
-            AND column_name IN ('model', 'model_name')
-        """)
-        columns_check = await db.execute(check_columns_query)
-        existing_columns = {row[0] for row in columns_check.fetchall()}
-        has_model = 'model' in existing_columns
-        has_model_name = 'model_name' in existing_columns
-        
-        # model値の取得（modelを優先、なければmodel_name、なければ空文字列）
-        model_value = ""
-        if has_model:
-            model_value = getattr(api_key, 'model', '') or ''
-        elif has_model_name:
-            model_value = getattr(api_key, 'model_name', '') or ''
-        
         return ApiKeyResponse(
             id=str(api_key.id),
             tenant_id=str(api_key.tenant_id),
             provider=api_key.provider,
             api_key_masked=masked_key,
-            model=model_value,
+            model=api_key.model_name or "",
             is_active=api_key.is_active,
             created_at=api_key.created_at,
             updated_at=api_key.updated_at
@@ -643,7 +566,7 @@ async def verify_api_key(
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="APIキーが見つかりません")
 
         decrypted = service.get_decrypted_api_key(api_key)
-        model_value = getattr(api_key, 'model', '') or getattr(api_key, 'model_name', '') or ''
+        model_value = api_key.model_name or ''
         result = await service.verify_api_key(api_key.provider, decrypted, model_value)
 
         BusinessLogger.log_user_action(
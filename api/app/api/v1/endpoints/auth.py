@@ -13,7 +13,7 @@
 - OAuth2認証
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Request, Body, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Body, Query, Response
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
@@ -40,6 +40,28 @@ router = APIRouter()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
 
+def _token_response(access_token: str, refresh_token: str) -> Response:
+    """
+    トークンレスポンスを生成
+    
+    サーバー側で生成した値のみを含むため、バリデーションを行わずに
+    直接JSONへシリアライズする（response_modelはOpenAPI定義用）
+    
+    引数:
+        access_token: アクセストークン
+        refresh_token: リフレッシュトークン
+    戻り値:
+        Response: JSONレスポンス
+    """
+    token = Token.model_construct(
+        access_token=access_token,
+        refresh_token=refresh_token,
+        token_type="bearer",
+        expires_in=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+    )
+    return Response(content=token.model_dump_json(), media_type="application/json")
+
+
 @router.post("/register", response_model=None)
 async def register(
     user_data: UserCreate,
@@ -116,16 +138,25 @@ async def register(
         
         # 確認メール送信
         confirmation_url = f"{settings.APP_URL or 'http://localhost:3000'}/verify-email?token={plain_token}"
-        email_sent = await EmailService.send_user_registration_email(
-            user.email, 
-            user.username, 
+        # 送信はバックグラウンドで行い、キューが使えない場合のみ直接送信する
+        if EmailService.enqueue_email(
+            EmailService.send_user_registration_email,
+            user.email,
+            user.username,
             confirmation_url
-        )
-        
-        if email_sent:
-            logger.info(f"確認メール送信完了: {user.email}")
+        ):
+            logger.info(f"確認メール送信をキューに登録: {user.email}")
         else:
-            logger.warning(f"確認メール送信失敗: {user.email}")
+            email_sent = await EmailService.send_user_registration_email(
+                user.email, 
+                user.username, 
+                confirmation_url
+            )
+            
+            if email_sent:
+                logger.info(f"確認メール送信完了: {user.email}")
+            else:
+                logger.warning(f"確認メール送信失敗: {user.email}")
             
         BusinessLogger.log_user_action(
             str(user.id),
@@ -271,12 +302,7 @@ async def login(
         request=request
     )
     
-    return {
-        "access_token": access_token,
-        "refresh_token": refresh_token,
-        "token_type": "bearer",
-        "expires_in": settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
-    }
+    return _token_response(access_token, refresh_token)
 
 
 @router.post("/login/oauth", response_model=Token)
@@ -334,12 +360,7 @@ async def login_oauth(
         request=request
     )
     
-    return {
-        "access_token": access_token,
-        "refresh_token": refresh_token,
-        "token_type": "bearer",
-        "expires_in": settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
-    }
+    return _token_response(access_token, refresh_token)
 
 
 @router.post("/refresh", response_model=Token)
@@ -396,12 +417,7 @@ async def refresh_token(
             request=request
         )
         
-        return {
-            "access_token": access_token,
-            "refresh_token": new_refresh_token,
-            "token_type": "bearer",
-            "expires_in": settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
-        }
+        return _token_response(access_token, new_refresh_token)
         
     except HTTPException:
         raise
@@ -688,16 +704,25 @@ async def register_tenant(
             
             # 確認メール送信
             confirmation_url = f"{settings.APP_URL or 'http://localhost:3000'}/verify-email?token={plain_token}"
-            email_sent = await EmailService.send_user_registration_email(
-                email_data["email"], 
-                email_data["username"], 
+            # 送信はバックグラウンドで行い、キューが使えない場合のみ直接送信する
+            if EmailService.enqueue_email(
+                EmailService.send_user_registration_email,
+                email_data["email"],
+                email_data["username"],
                 confirmation_url
-            )
-            
-            if email_sent:
-                logger.info(f"テナント管理者確認メール送信完了: {email_data['email']}")
+            ):
+                logger.info(f"テナント管理者確認メール送信をキューに登録: {email_data['email']}")
             else:
-                logger.warning(f"テナント管理者確認メール送信失敗: {email_data['email']}")
+                email_sent = await EmailService.send_user_registration_email(
+                    email_data["email"], 
+                    email_data["username"], 
+                    confirmation_url
+                )
+                
+                if email_sent:
+                    logger.info(f"テナント管理者確認メール送信完了: {email_data['email']}")
+                else:
+                    logger.warning(f"テナント管理者確認メール送信失敗: {email_data['email']}")
                 
         except Exception as e:
             logger.error(f"メール送信エラー: {str(e)}")
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File as FastAPIFile, Request, Form
+from fastapi.exceptions import RequestValidationError
 from fastapi.responses import StreamingResponse, Response
 from io import StringIO
 import csv
@@ -6,11 +7,14 @@ from datetime import datetime as dt
 from urllib.parse import quote
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
+from uuid import UUID
+from pydantic import ValidationError as PydanticValidationError
 from app.core.database import get_db
 from app.schemas.content import (
     Content, ContentCreate, ContentUpdate, ContentWithChunks,
-    Chunk, ChunkCreate, ChunkUpdate, ContentSearchParams,
-    ContentSearchResult
+    Chunk, ChunkCreate, ChunkUpdate, ContentSearchParams, ContentCursorParams,
+    ContentSearchResult, ContentInDB, ChunkInDBListAdapter,
+    ContentSearchResultListAdapter
 )
 from app.schemas.user import User
 from app.services.content_service import ContentService
@@ -28,18 +32,66 @@ from app.utils.common import PaginationUtils, ValidationUtils
 
 router = APIRouter()
 
+# 次ページのキーセットページネーション用カーソルを返すレスポンスヘッダー
+NEXT_CURSOR_CREATED_AT_HEADER = "X-Next-Cursor-Created-At"
+NEXT_CURSOR_ID_HEADER = "X-Next-Cursor-Id"
+
+
+def _set_next_cursor_headers(response: Response, items: list, limit: int) -> None:
+    """
+    次ページ取得用のカーソル（最後の要素のcreated_at/id）をレスポンスヘッダーに設定
+    
+    取得件数がlimitに満たない場合は最終ページのため設定しない
+    
+    引数:
+        response: レスポンス
+        items: 取得結果（created_at/idを持つ要素のリスト、作成日時の降順）
+        limit: 取得件数の上限
+    """
+    if not items or len(items) < limit:
+        return
+    last = items[-1]
+    response.headers[NEXT_CURSOR_CREATED_AT_HEADER] = last.created_at.isoformat()
+    response.headers[NEXT_CURSOR_ID_HEADER] = str(last.id)
+
+
+def _get_cursor_params(
+    cursor_created_at: Optional[dt] = Query(None, description="前ページ最後のコンテンツのcreated_at（キーセットページネーション）"),
+    cursor_id: Optional[UUID] = Query(None, description="前ページ最後のコンテンツのID（キーセットページネーション）"),
+) -> ContentCursorParams:
+    """
+    クエリパラメータのカーソルをContentCursorParamsで検証する（検索APIのボディと同じ検証を適用）
+    
+    例外:
+        RequestValidationError: cursor_created_at/cursor_idの片方のみが指定された場合（422）
+    """
+    try:
+        return ContentCursorParams(cursor_created_at=cursor_created_at, cursor_id=cursor_id)
+    except PydanticValidationError as e:
+        raise RequestValidationError([
+            {**error, "loc": ("query", *error["loc"])}
+            for error in e.errors(include_url=False, include_context=False)
+        ])
+
 
 @router.get("/", response_model=List[Content])
 async def get_contents(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     file_type: Optional[str] = Query(None),
     status: Optional[str] = Query(None),
     search: Optional[str] = Query(None),
+    cursor_params: ContentCursorParams = Depends(_get_cursor_params),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
-    """コンテンツ一覧取得"""
+    """
+    コンテンツ一覧取得
+    
+    次ページがある可能性がある場合（取得件数がlimitと同じ場合）は、次ページ取得用のカーソルを
+    X-Next-Cursor-Created-At / X-Next-Cursor-Id ヘッダーで返す
+    """
     if current_user.role == UserRole.PLATFORM_ADMIN:
         tenant_id = "system"  # Platform admin can access all tenants
     else:
@@ -75,30 +127,14 @@ async def get_contents(
         limit=limit,
         file_type=file_type_enum,
         status=status_enum,
-        search_query=search
+        search_query=search,
+        # キーセットページネーションのカーソル（指定時はskipを無視）
+        cursor=cursor_params.cursor
     )
     
-    # FileモデルをContentスキーマに変換
-    from app.schemas.content import Content
-    contents = []
-    for file in files:
-        content_dict = {
-            'id': str(file.id),
-            'tenant_id': str(file.tenant_id),
-            'title': file.title,
-            'content_type': file.file_type.value,
-            'description': file.description,
-            'tags': file.tags if file.tags else [],
-            'metadata': file.metadata_json if file.metadata_json else {},
-            'file_name': file.file_name,
-            'file_size': file.size_bytes,
-            'status': file.status.value,
-            'uploaded_at': file.uploaded_at,
-            'indexed_at': file.indexed_at,
-            'created_at': file.created_at,
-            'updated_at': file.updated_at,
-        }
-        contents.append(Content(**content_dict))
+    # DBから読み出した検証済みの行のため、バリデーションを省略してスキーマへ変換
+    contents = [ContentInDB.build_trusted(file) for file in files]
+    _set_next_cursor_headers(response, contents, limit)
     
     # コンテンツ一覧はダッシュボード表示用の参照系GETのため、監査ログには記録しない
     return contents
@@ -319,8 +355,7 @@ async def get_content(
     chunks = await content_service.get_content_chunks(content_id, tenant_id)
     
     # Pydanticスキーマ経由で安全に整形（__dict__の直接展開は関係属性を含み衝突の原因となる）
-    from app.schemas.content import ContentInDB
-    base = ContentInDB.from_orm(content).dict()
+    base = ContentInDB.build_trusted(content).model_dump()
     # チャンクはORMモデルの属性名をスキーマに合わせてマッピング
     chunk_items = []
     for c in chunks:
@@ -525,22 +560,10 @@ async def get_content_chunks(
         limit=limit
     )
     
-    # ORMモデルからスキーマへの明示的なマッピングを行う
+    # ORMモデルからスキーマへ一括変換する
     # - Chunkモデルのchunk_text -> スキーマのcontent
     # - metadata_json -> metadata
-    chunk_items: List[Chunk] = []
-    for ch in chunks:
-        chunk_items.append(
-            Chunk(
-                id=str(ch.id),
-                file_id=str(ch.file_id),
-                tenant_id=str(ch.tenant_id),
-                chunk_index=ch.chunk_index,
-                content=ch.chunk_text,
-                metadata=ch.metadata_json if getattr(ch, "metadata_json", None) else {},
-                created_at=ch.created_at,
-            )
-        )
+    chunk_items = ChunkInDBListAdapter.validate_python(chunks, from_attributes=True)
     
     # チャンク一覧取得は参照系GETのため、監査ログには記録しない
     return chunk_items
@@ -763,7 +786,13 @@ async def search_contents(
         tenant_id=tenant_id
     )
     
-    return results
+    # 検索結果は検証済みのため、レスポンス用の再検証を行わずにJSONへ直接シリアライズする
+    response = Response(
+        content=ContentSearchResultListAdapter.dump_json(results),
+        media_type="application/json"
+    )
+    _set_next_cursor_headers(response, results, search_params.limit)
+    return response
 
 
 @router.get("/stats/summary")
@@ -1,8 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from datetime import datetime, timedelta
-from app.core.database import get_db
+from app.core.database import get_db, get_pool_status
 from app.schemas.stats import (
     UsageStats, UsageTimeSeries, TopQuery, LLMUsageStats,
     FeedbackStats, StorageStats, DashboardStats, AlertRule,
@@ -96,7 +96,8 @@ async def get_usage_time_series(
     )
     
     # 利用統計の時系列データは参照系GETのため、監査ログには記録しない
-    return time_series
+    # 時系列は件数が多くなるため、検証済みモデルをpydantic-coreで直接JSON化して返す
+    return Response(content=time_series.model_dump_json(), media_type="application/json")
 
 
 @router.get("/top-queries", response_model=List[TopQuery])
@@ -377,6 +378,15 @@ async def get_system_health(
     return health
 
 
+@router.get("/health/db")
+async def get_db_pool_health(
+    current_user: User = Depends(require_admin_role())
+):
+    """DB接続プール状態取得（プールサイズ調整用）"""
+    # 参照系GETのため、監査ログには記録しない
+    return get_pool_status()
+
+
 @router.post("/metrics")
 async def log_metric(
     metric_name: str,
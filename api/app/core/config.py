@@ -14,11 +14,22 @@ Pydantic Settingsを使用して環境変数から設定値を読み込み、型
 
 from pydantic_settings import BaseSettings
 from pydantic import field_validator
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Union
 import os
 import logging
 
 
+# ENVIRONMENT別のDB接続プール既定値（DB_POOL_SIZE / DB_MAX_OVERFLOW / DB_POOL_TIMEOUT未設定時に使用）
+# ワーカー数を増やしてもPostgreSQLのmax_connectionsを超えにくいよう小さめにし、
+# 負荷の瞬間的な増加ではエラーにせず待機できるよう取得待機は長めにする
+DB_POOL_DEFAULTS: Dict[str, Dict[str, int]] = {
+    "production": {"pool_size": 10, "max_overflow": 10, "pool_timeout": 30},
+    "staging": {"pool_size": 5, "max_overflow": 5, "pool_timeout": 30},
+    "development": {"pool_size": 5, "max_overflow": 5, "pool_timeout": 30},
+    "test": {"pool_size": 5, "max_overflow": 5, "pool_timeout": 30},
+}
+
+
 class Settings(BaseSettings):
     """
     アプリケーション設定クラス
@@ -31,6 +42,7 @@ class Settings(BaseSettings):
         VERSION: アプリケーションバージョン
         API_V1_STR: APIバージョン文字列
         DATABASE_URL: データベース接続URL
+        DB_POOL_SIZE: DB接続プールのサイズ（0でプール無効、未設定時は環境別の既定値）
         BACKEND_CORS_ORIGINS: CORS許可オリジン
         SECRET_KEY: JWT署名用秘密鍵
         ALGORITHM: JWT署名アルゴリズム
@@ -50,6 +62,14 @@ class Settings(BaseSettings):
     DATABASE_URL: str = "postgresql+asyncpg://user:password@db:5432/ai_chatbot_db"
     ASYNC_DATABASE_URL: Optional[str] = None
     DATABASE_URL_SYNC: Optional[str] = None
+    # 接続プール（プロセス毎。PostgreSQLのmax_connectionsは
+    # (DB_POOL_SIZE + DB_MAX_OVERFLOW) × ワーカー数 以上が必要）
+    # DB_POOL_SIZE=0 の場合はプールを使用しない（外部のコネクションプーラー利用時など）
+    # 未設定の項目はENVIRONMENT別の既定値（DB_POOL_DEFAULTS）を使用する
+    DB_POOL_SIZE: Optional[int] = None
+    DB_MAX_OVERFLOW: Optional[int] = None
+    DB_POOL_TIMEOUT: Optional[int] = None  # プールから接続を取得する際の待機上限（秒）
+    DB_POOL_RECYCLE: int = 1800  # 接続を作り直すまでの秒数
     
     # CORS
     # 環境変数から読み込む際は、カンマ区切りの文字列として扱う
@@ -159,6 +179,20 @@ class Settings(BaseSettings):
         case_sensitive = True
         extra = "ignore"  # 未定義の環境変数を無視
 
+    def get_db_pool_settings(self) -> Dict[str, int]:
+        """
+        DB接続プールの設定値を返す（未設定の項目はENVIRONMENT別の既定値）
+        
+        戻り値:
+            Dict[str, int]: pool_size, max_overflow, pool_timeout
+        """
+        defaults = DB_POOL_DEFAULTS.get(self.ENVIRONMENT, DB_POOL_DEFAULTS["development"])
+        return {
+            "pool_size": defaults["pool_size"] if self.DB_POOL_SIZE is None else self.DB_POOL_SIZE,
+            "max_overflow": defaults["max_overflow"] if self.DB_MAX_OVERFLOW is None else self.DB_MAX_OVERFLOW,
+            "pool_timeout": defaults["pool_timeout"] if self.DB_POOL_TIMEOUT is None else self.DB_POOL_TIMEOUT,
+        }
+
     def validate_settings(self) -> bool:
         """
         設定値のバリデーション
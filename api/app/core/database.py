@@ -21,6 +21,7 @@ from app.core.config import settings
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
 import logging
 import os
+from typing import Any, Dict
 
 
 def _normalize_async_db_url(url: str) -> str:
@@ -204,11 +205,23 @@ if not os.getenv("ALEMBIC_MIGRATION"):
     print(f"[DB DEBUG] クリーンアップ後のURL: {async_db_url_clean}", flush=True)
     print(f"[DB DEBUG] SSL設定: {ssl_enabled}", flush=True)
 
+    # 接続プール設定（環境別の既定値を環境変数で上書き。プールサイズ0の場合はNullPoolで毎回接続）
+    db_pool_settings = settings.get_db_pool_settings()
+    if db_pool_settings["pool_size"] > 0:
+        pool_options = {
+            **db_pool_settings,
+            "pool_recycle": settings.DB_POOL_RECYCLE,
+            "pool_pre_ping": True,  # 切断済みの接続を払い出さない
+        }
+    else:
+        pool_options = {"poolclass": NullPool}
+
     engine = create_async_engine(
         async_db_url_clean,
         echo=settings.DEBUG,
         future=True,
-        poolclass=NullPool,  # 非同期エンジンではNullPoolを使用
+        **pool_options,
+        query_cache_size=1200,  # SQLコンパイルキャッシュの件数（既定500。クエリの種類が多いため拡張）
         connect_args={
             "command_timeout": 30,  # コマンドタイムアウト（30秒）
             "ssl": ssl_enabled,  # SSL接続を明示的に設定
@@ -239,6 +252,28 @@ else:
 Base = declarative_base()
 
 
+def get_pool_status() -> Dict[str, Any]:
+    """
+    DB接続プールの状態を取得（運用時のプールサイズ調整用）
+    
+    戻り値:
+        Dict[str, Any]: プール種別と、プール使用時は設定値・使用状況
+    """
+    if engine is None:
+        return {"pool": "none"}
+    pool = engine.pool
+    if not hasattr(pool, "size"):
+        return {"pool": type(pool).__name__}
+    return {
+        "pool": type(pool).__name__,
+        "size": pool.size(),
+        "max_overflow": settings.get_db_pool_settings()["max_overflow"],
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+    }
+
+
 async def get_db() -> AsyncSession:
     """
     データベースセッションの依存性注入関数
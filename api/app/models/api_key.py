@@ -13,7 +13,7 @@ LLMプロバイダー毎のAPIキーとモデル設定を管理します。
 from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 from app.core.database import Base
 
 
@@ -38,6 +38,14 @@ class ApiKey(Base):
     __table_args__ = (
         Index("ix_api_keys_tenant_id", "tenant_id"),
         Index("ix_api_keys_provider", "provider"),
+        Index("ix_api_keys_tenant_provider_active", "tenant_id", "provider", "is_active"),
+        # 同一テナント・プロバイダー・モデルのアクティブなAPIキーは1件のみ
+        Index(
+            "ux_api_keys_tenant_provider_model_active",
+            "tenant_id", "provider", "model_name",
+            unique=True,
+            postgresql_where=text("is_active"),
+        ),
     )
 
     id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
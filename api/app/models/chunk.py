@@ -43,6 +43,8 @@ class Chunk(Base):
     __tablename__ = "chunks"
     __table_args__ = (
         UniqueConstraint("file_id", "chunk_index", name="chunks_file_chunk_unique"),
+        # テナント別のチャンク件数集計用
+        Index("ix_chunks_tenant_id", "tenant_id"),
         Index(
             "idx_chunks_embedding_hnsw",
             "embedding",
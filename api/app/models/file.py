@@ -13,10 +13,10 @@
 - 処理状態の追跡
 """
 
-from sqlalchemy import Column, String, DateTime, Text, BigInteger, Integer, ForeignKey, Enum
+from sqlalchemy import Column, String, DateTime, Text, BigInteger, Integer, ForeignKey, Enum, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 from app.core.database import Base
 import enum
 
@@ -90,6 +90,57 @@ class File(Base):
         deleted_at: 削除日時（ソフトデリート用）
     """
     __tablename__ = "files"
+    __table_args__ = (
+        # 一覧取得（作成日時の降順・キーセットページネーション）用。ソフトデリート済みの行は含めない
+        Index(
+            "ix_files_tenant_created_id_active",
+            "tenant_id", text("created_at DESC"), text("id DESC"),
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        # テナント別のステータス・ファイルタイプ別集計（件数・サイズ）用。インデックスのみで集計できるようsize_bytesを含める
+        Index(
+            "ix_files_tenant_status_type_active",
+            "tenant_id", "status", "file_type",
+            postgresql_include=["size_bytes"],
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        # アップロード時のファイル名重複チェック用
+        Index(
+            "ix_files_tenant_file_name_active",
+            "tenant_id", "file_name",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        # アップロード時のIdempotency-Key照会（metadata->>'idempotency_key'）用の式インデックス
+        Index(
+            "ix_files_tenant_idempotency_key",
+            "tenant_id", text("(metadata ->> 'idempotency_key')"),
+            postgresql_where=text("deleted_at IS NULL AND (metadata ->> 'idempotency_key') IS NOT NULL"),
+        ),
+        # タグ検索（JSONBの包含演算子@>）用
+        Index(
+            "ix_files_tags_gin",
+            "tags",
+            postgresql_using="gin",
+            postgresql_ops={"tags": "jsonb_path_ops"},
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        # タイトル・説明の部分一致検索（ILIKE '%語%'）用のトライグラムインデックス（pg_trgm）
+        # 日本語は空白で単語分割できないため全文検索（tsvector）ではなく部分一致のまま高速化する
+        Index(
+            "ix_files_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_files_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid())
     tenant_id = Column(UUID(as_uuid=True), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False)
@@ -13,9 +13,12 @@ class BaseRepository:
         """Set current tenant id for RLS policies.
 
         NOTE: Call this at the beginning of a request/operation that relies on RLS.
+        The setting is transaction-local (is_local=true) so it is cleared on
+        commit/rollback and never leaks to the next user of a pooled connection.
+        Call it again after committing if further RLS queries follow.
         """
         await self.session.execute(
-            text("SELECT set_config('app.tenant_id', :tenant_id, false)").bindparams(tenant_id=tenant_id)
+            text("SELECT set_config('app.tenant_id', :tenant_id, true)").bindparams(tenant_id=tenant_id)
         )
 
     async def execute(self, sql: str, params: dict[str, Any] | None = None) -> None:
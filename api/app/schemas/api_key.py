@@ -10,7 +10,7 @@ LLMプロバイダー毎のAPIキー登録・更新・取得機能をサポー
 - プロバイダー・モデル選択のサポート
 """
 
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, validator, model_validator
 from typing import Optional, List
 from datetime import datetime
 from uuid import UUID
@@ -48,17 +48,13 @@ class ApiKeyCreate(BaseModel):
             raise ValueError('APIキーは500文字以内である必要があります')
         return v.strip()
     
-    @validator('model')
-    def validate_model(cls, v, values):
-        """モデルのバリデーション"""
-        provider = values.get('provider')
-        if provider and not ApiKeySettings.is_provider_supported(provider):
-            return v
-        
-        supported_models = ApiKeySettings.get_supported_models(provider)
-        if supported_models and v not in supported_models:
-            raise ValueError(f'プロバイダー {provider} でサポートされていないモデル: {v}')
-        return v
+    @model_validator(mode='after')
+    def validate_model(self):
+        """モデルのバリデーション（providerの検証後に実行）"""
+        supported_models = ApiKeySettings.get_supported_models(self.provider)
+        if supported_models and self.model not in supported_models:
+            raise ValueError(f'プロバイダー {self.provider} でサポートされていないモデル: {self.model}')
+        return self
 
 
 class ApiKeyUpdate(BaseModel):
@@ -124,9 +120,25 @@ class ApiKeyResponse(BaseModel):
         戻り値:
             str: マスクされたAPIキー
         """
-        if len(api_key) <= 8:
-            return "*" * len(api_key)
-        return api_key[:4] + "*" * (len(api_key) - 8) + api_key[-4:]
+        return cls.mask_api_key_parts(api_key[:4], api_key[-4:], len(api_key))
+
+    @classmethod
+    def mask_api_key_parts(cls, head: str, tail: str, length: int) -> str:
+        """
+        先頭4文字・末尾4文字・長さからマスクされたAPIキーを生成（mask_api_keyと同じ結果）
+        
+        値全体を取得せずにマスクを作る場合（一覧取得でSQL側で切り出す場合など）に使用します。
+        
+        引数:
+            head: 先頭4文字
+            tail: 末尾4文字
+            length: APIキーの長さ
+        戻り値:
+            str: マスクされたAPIキー
+        """
+        if length <= 8:
+            return "*" * length
+        return head + "*" * (length - 8) + tail
 
 
 class ApiKeyListResponse(BaseModel):
@@ -1,5 +1,6 @@
-from pydantic import BaseModel, validator
+from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
+from app.schemas.common import Temperature
 
 
 class ChatRequest(BaseModel):
@@ -9,13 +10,7 @@ class ChatRequest(BaseModel):
     max_tokens: Optional[int] = None
     top_k: Optional[int] = None
     session_id: Optional[str] = None
-    temperature: Optional[float] = None
-    
-    @validator('temperature')
-    def validate_temperature(cls, v):
-        if v is not None and (v < 0.0 or v > 2.0):
-            raise ValueError('temperatureは0.0-2.0の範囲である必要があります')
-        return v
+    temperature: Optional[Temperature] = None
 
 
 class ChatResponse(BaseModel):
@@ -0,0 +1,214 @@
+"""
+スキーマ共通型定義
+
+このファイルは複数のPydanticスキーマで共有する制約付き型を定義します。
+同じ範囲制約を各スキーマで個別のバリデータとして実装せず、
+Annotated型として一度だけ定義して再利用します。
+エラーメッセージは従来のバリデータと同じ日本語のメッセージを返します。
+
+主な機能:
+- チャンク設定（サイズ・オーバーラップ）の範囲制約
+- 件数・数値の非負制約
+- 比率（0-1）の範囲制約
+- 進捗率（0-100）・temperatureの範囲制約
+- ファイル内容（Base64）の最大サイズ
+- テナント識別子のパターン
+- テナント名・テナント識別子・ユーザー名の文字列制約（登録・テナント作成・更新で共通）
+- UUIDの文字列化
+- パスワード強度の共通バリデーション
+"""
+
+import re
+from typing import Annotated, Any, Optional
+from uuid import UUID
+from pydantic import AfterValidator, BeforeValidator
+
+
+def bounded(base: type, message: str, ge: Optional[float] = None, le: Optional[float] = None) -> Any:
+    """
+    範囲制約付きの型を生成する
+    
+    Field(ge/le)はpydantic標準の英語メッセージになるため、範囲外の場合は
+    指定した日本語メッセージでValueErrorを送出するバリデータを付与する
+    
+    引数:
+        base: 基底の型（int/float）
+        message: 範囲外の場合のエラーメッセージ
+        ge: 下限値（以上）
+        le: 上限値（以下）
+    戻り値:
+        Annotated型
+    """
+    def _check(v):
+        if (ge is not None and v < ge) or (le is not None and v > le):
+            raise ValueError(message)
+        return v
+    return Annotated[base, AfterValidator(_check)]
+
+
+def max_length_str(message: str, max_length: int) -> Any:
+    """
+    最大文字数の制約付き文字列型を生成する
+    
+    Field(max_length)はpydantic標準の英語メッセージになるため、超過した場合は
+    指定した日本語メッセージでValueErrorを送出するバリデータを付与する
+    
+    引数:
+        message: 最大文字数を超えた場合のエラーメッセージ
+        max_length: 最大文字数
+    戻り値:
+        Annotated型
+    """
+    def _check(v):
+        if len(v) > max_length:
+            raise ValueError(message)
+        return v
+    return Annotated[str, AfterValidator(_check)]
+
+
+def rate(label: str) -> Any:
+    """
+    0-1の範囲の比率型を生成する（評価率、いいね率など）
+    
+    引数:
+        label: エラーメッセージに使う項目名
+    戻り値:
+        Annotated型
+    """
+    return bounded(float, f'{label}は0-1の範囲である必要があります', ge=0.0, le=1.0)
+
+
+def non_negative_int(label: str) -> Any:
+    """
+    0以上の整数型を生成する（件数、トークン数など）
+    
+    引数:
+        label: エラーメッセージに使う項目名
+    戻り値:
+        Annotated型
+    """
+    return bounded(int, f'{label}は0以上である必要があります', ge=0)
+
+
+def non_negative_float(label: str) -> Any:
+    """
+    0以上の実数型を生成する（応答時間、コスト、サイズなど）
+    
+    引数:
+        label: エラーメッセージに使う項目名
+    戻り値:
+        Annotated型
+    """
+    return bounded(float, f'{label}は0以上である必要があります', ge=0.0)
+
+
+# チャンクサイズ（256-4096）
+ChunkSize = bounded(int, 'チャンクサイズは256-4096の範囲である必要があります', ge=256, le=4096)
+
+# チャンクオーバーラップ（0-512）
+ChunkOverlap = bounded(int, 'チャンクオーバーラップは0-512の範囲である必要があります', ge=0, le=512)
+
+# 0-100の範囲の進捗率
+Progress = bounded(int, '進捗は0-100の範囲である必要があります', ge=0, le=100)
+
+# LLMのtemperature（0.0-2.0）
+Temperature = bounded(float, 'temperatureは0.0-2.0の範囲である必要があります', ge=0.0, le=2.0)
+
+# Base64エンコードされたファイル内容（50MB上限）
+FileContent = max_length_str('ファイルサイズは50MB以内である必要があります', 50 * 1024 * 1024)
+
+
+
+def _uuid_to_str(v: Any) -> Any:
+    """UUIDを文字列に変換（それ以外はそのまま返す）"""
+    if isinstance(v, UUID):
+        return str(v)
+    return v
+
+
+# ORMのUUID列を文字列として受け取るID型
+UUIDStr = Annotated[str, BeforeValidator(_uuid_to_str)]
+
+
+# テナント識別子（英数字、ハイフン、アンダースコアのみ）
+TENANT_DOMAIN_RE = re.compile(r'\A[a-zA-Z0-9_-]+\Z')
+
+# ユーザー名（英数字、アンダースコアのみ。フロントエンドのZodスキーマと同じASCIIの文字クラス）
+USERNAME_RE = re.compile(r'\A[a-zA-Z0-9_]+\Z')
+
+
+def _check_length(s: str, label: str, min_length: int, max_length: int) -> None:
+    """
+    文字列長の共通チェック
+    
+    引数:
+        s: 前後の空白を除去した文字列
+        label: エラーメッセージに使う項目名
+        min_length: 最小文字数
+        max_length: 最大文字数
+    例外:
+        ValueError: 文字数が範囲外の場合
+    """
+    if len(s) < min_length:
+        raise ValueError(f'{label}は{min_length}文字以上である必要があります')
+    if len(s) > max_length:
+        raise ValueError(f'{label}は{max_length}文字以内である必要があります')
+
+
+def _check_tenant_name(v: str) -> str:
+    """テナント名のバリデーション（2-255文字）"""
+    s = v.strip()
+    _check_length(s, 'テナント名', 2, 255)
+    return s
+
+
+def _check_tenant_domain(v: str) -> str:
+    """テナント識別子のバリデーション（3-255文字、英数字・ハイフン・アンダースコアのみ、小文字に正規化）"""
+    s = v.strip()
+    _check_length(s, 'テナント識別子', 3, 255)
+    if not TENANT_DOMAIN_RE.match(s):
+        raise ValueError('テナント識別子は英数字、ハイフン、アンダースコアのみ使用可能です')
+    return s.lower()
+
+
+def _check_username(v: str) -> str:
+    """ユーザー名のバリデーション（3-100文字、英数字・アンダースコアのみ）"""
+    s = v.strip()
+    _check_length(s, 'ユーザー名', 3, 100)
+    if not USERNAME_RE.match(s):
+        raise ValueError('ユーザー名は英数字とアンダースコアのみ使用可能です')
+    return s
+
+
+# テナント名・テナント識別子・ユーザー名の文字列型（前後の空白を除去した上で検証する）
+# テナント登録とテナント作成・更新で同じ正規化になるよう、この定義のみを使用する
+TenantName = Annotated[str, AfterValidator(_check_tenant_name)]
+TenantDomain = Annotated[str, AfterValidator(_check_tenant_domain)]
+Username = Annotated[str, AfterValidator(_check_username)]
+
+# パスワードの文字種チェック用パターン（フロントエンドのZodスキーマと同じ文字クラス）
+_PASSWORD_UPPER_RE = re.compile(r'[A-Z]')
+_PASSWORD_LOWER_RE = re.compile(r'[a-z]')
+_PASSWORD_DIGIT_RE = re.compile(r'\d')
+
+
+def check_password_strength(v: str) -> str:
+    """
+    パスワード強度の共通バリデーション
+    
+    引数:
+        v: パスワード
+    戻り値:
+        str: 検証済みのパスワード
+    例外:
+        ValueError: 長さまたは文字種の要件を満たさない場合
+    """
+    if len(v) < 8:
+        raise ValueError('パスワードは8文字以上である必要があります')
+    if not _PASSWORD_UPPER_RE.search(v):
+        raise ValueError('パスワードには大文字を含める必要があります')
+    if not _PASSWORD_LOWER_RE.search(v):
+        raise ValueError('パスワードには小文字を含める必要があります')
+    if not _PASSWORD_DIGIT_RE.search(v):
+        raise ValueError('パスワードには数字を含める必要があります')
+    return v
@@ -1,11 +1,12 @@
-from pydantic import BaseModel, validator
-from typing import Optional, Dict, Any, List
+from pydantic import AliasChoices, BaseModel, Field, TypeAdapter, validator, model_validator
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
-from enum import Enum
+from enum import StrEnum
 from uuid import UUID
+from app.schemas.common import ChunkSize, ChunkOverlap, Progress, FileContent
 
 
-class FileType(str, Enum):
+class FileType(StrEnum):
     PDF = "PDF"
     HTML = "HTML"
     MD = "MD"
@@ -13,7 +14,7 @@ class FileType(str, Enum):
     TXT = "TXT"
 
 
-class FileStatus(str, Enum):
+class FileStatus(StrEnum):
     UPLOADED = "UPLOADED"
     PROCESSING = "PROCESSING"
     INDEXED = "INDEXED"
@@ -52,28 +53,10 @@ class ContentBase(BaseModel):
 
 
 class ContentCreate(ContentBase):
-    file_content: Optional[str] = None  # Base64 encoded content
+    file_content: Optional[FileContent] = None  # Base64 encoded content（50MB上限）
     file_url: Optional[str] = None
-    chunk_size: Optional[int] = None
-    chunk_overlap: Optional[int] = None
-    
-    @validator('file_content')
-    def validate_file_content(cls, v):
-        if v is not None and len(v) > 50 * 1024 * 1024:  # 50MB limit
-            raise ValueError('ファイルサイズは50MB以内である必要があります')
-        return v
-    
-    @validator('chunk_size')
-    def validate_chunk_size(cls, v):
-        if v is not None and (v < 256 or v > 4096):
-            raise ValueError('チャンクサイズは256-4096の範囲である必要があります')
-        return v
-    
-    @validator('chunk_overlap')
-    def validate_chunk_overlap(cls, v):
-        if v is not None and (v < 0 or v > 512):
-            raise ValueError('チャンクオーバーラップは0-512の範囲である必要があります')
-        return v
+    chunk_size: Optional[ChunkSize] = None
+    chunk_overlap: Optional[ChunkOverlap] = None
 
 
 class ContentUpdate(BaseModel):
@@ -111,8 +94,12 @@ class ContentUpdate(BaseModel):
 class ContentInDB(ContentBase):
     id: str
     tenant_id: str
+    # Fileモデルの属性名（file_type / metadata_json / size_bytes）からも直接検証できるよう別名を許可
+    content_type: FileType = Field(validation_alias=AliasChoices('content_type', 'file_type'))
+    # JSONBから読み出した値はキーが必ず文字列のため、キー型の検証を行わない素のdictとして扱う
+    metadata: dict = Field(default={}, validation_alias=AliasChoices('metadata_json', 'metadata'))
     file_name: str
-    file_size: int
+    file_size: int = Field(validation_alias=AliasChoices('file_size', 'size_bytes'))
     status: FileStatus
     uploaded_at: datetime
     indexed_at: Optional[datetime] = None
@@ -131,13 +118,10 @@ class ContentInDB(ContentBase):
             return str(v)
         return v
     
-    @validator('content_type', pre=True)
-    def map_file_type(cls, v):
-        """file_typeをcontent_typeにマッピング"""
-        # Fileモデルから来る場合はfile_type属性を読み取る
-        if hasattr(v, 'value'):
-            return v.value
-        return v
+    @validator('tags', pre=True)
+    def map_tags(cls, v):
+        """tagsがNULLの場合は空リストとして扱う"""
+        return v if v is not None else []
     
     @validator('metadata', pre=True)
     def map_metadata_json(cls, v):
@@ -162,13 +146,13 @@ class ContentInDB(ContentBase):
             'id': str(obj.id),
             'tenant_id': str(obj.tenant_id),
             'title': obj.title,
-            'content_type': obj.file_type.value if obj.file_type else None,
+            'content_type': obj.file_type,
             'description': obj.description,
             'tags': obj.tags if obj.tags else [],
             'metadata': obj.metadata_json if obj.metadata_json else {},
             'file_name': obj.file_name,
             'file_size': obj.size_bytes,
-            'status': obj.status.value if obj.status else None,
+            'status': obj.status,
             'uploaded_at': obj.uploaded_at,
             'indexed_at': obj.indexed_at,
             'created_at': obj.created_at,
@@ -176,8 +160,36 @@ class ContentInDB(ContentBase):
         }
         return cls(**data)
     
+    @classmethod
+    def build_trusted(cls, obj):
+        """
+        DBから読み出した検証済みのFileモデルをバリデーションなしで変換する
+        
+        引数:
+            obj: Fileモデル（書き込み時に検証済みのデータ）
+        戻り値:
+            ContentInDB: 変換後のスキーマ（参照系GETでのみ使用すること）
+        """
+        return cls.model_construct(
+            id=str(obj.id),
+            tenant_id=str(obj.tenant_id),
+            title=obj.title,
+            content_type=FileType(obj.file_type),
+            description=obj.description,
+            tags=obj.tags or [],
+            metadata=obj.metadata_json or {},
+            file_name=obj.file_name,
+            file_size=obj.size_bytes,
+            status=FileStatus(obj.status),
+            uploaded_at=obj.uploaded_at,
+            indexed_at=obj.indexed_at,
+            created_at=obj.created_at,
+            updated_at=obj.updated_at,
+        )
+    
     class Config:
         from_attributes = True
+        frozen = True
 
 
 class Content(ContentInDB):
@@ -234,6 +246,9 @@ class ChunkInDB(ChunkBase):
     id: str
     file_id: str
     tenant_id: str
+    # Chunkモデルの属性名（chunk_text / metadata_json）からも直接検証できるよう別名を許可
+    content: str = Field(validation_alias=AliasChoices('content', 'chunk_text'))
+    metadata: dict = Field(default={}, validation_alias=AliasChoices('metadata_json', 'metadata'))
     chunk_index: int
     created_at: datetime
     
@@ -255,8 +270,17 @@ class ChunkInDB(ChunkBase):
             return str(v)
         return v
     
+    @validator('metadata', pre=True)
+    def map_metadata_json(cls, v):
+        """metadata_jsonがNULLの場合は空辞書として扱う"""
+        return v if v is not None else {}
+    
     class Config:
         from_attributes = True
+        frozen = True
+
+
+ChunkInDBListAdapter = TypeAdapter(List[ChunkInDB])
 
 
 class Chunk(ChunkInDB):
@@ -276,14 +300,8 @@ class IndexingJobCreate(IndexingJobBase):
 
 class IndexingJobUpdate(BaseModel):
     status: Optional[str] = None
-    progress: Optional[int] = None
+    progress: Optional[Progress] = None
     error_message: Optional[str] = None
-    
-    @validator('progress')
-    def validate_progress(cls, v):
-        if v is not None and (v < 0 or v > 100):
-            raise ValueError('進捗は0-100の範囲である必要があります')
-        return v
 
 
 class IndexingJobInDB(IndexingJobBase):
@@ -295,13 +313,34 @@ class IndexingJobInDB(IndexingJobBase):
     
     class Config:
         from_attributes = True
+        frozen = True
 
 
 class IndexingJob(IndexingJobInDB):
     pass
 
 
-class ContentSearchParams(BaseModel):
+class ContentCursorParams(BaseModel):
+    # キーセットページネーション用（前ページ最後の結果のcreated_at/id。指定時はoffsetを無視）
+    cursor_created_at: Optional[datetime] = None
+    cursor_id: Optional[UUID] = None
+    
+    @model_validator(mode='after')
+    def validate_cursor_pair(self):
+        # 片方のみの指定は先頭ページの取得と区別できないため拒否する
+        if (self.cursor_created_at is None) != (self.cursor_id is None):
+            raise ValueError('cursor_created_atとcursor_idは両方指定する必要があります')
+        return self
+    
+    @property
+    def cursor(self) -> Optional[Tuple[datetime, UUID]]:
+        """キーセットページネーションのカーソル（未指定の場合はNone）"""
+        if self.cursor_id is None:
+            return None
+        return (self.cursor_created_at, self.cursor_id)
+
+
+class ContentSearchParams(ContentCursorParams):
     query: str
     file_types: Optional[List[FileType]] = None
     tags: Optional[List[str]] = None
@@ -343,3 +382,8 @@ class ContentSearchResult(BaseModel):
     
     class Config:
         from_attributes = True
+        frozen = True
+
+
+# 検索結果リストを1回の呼び出しでJSONへ直接シリアライズするためのアダプタ
+ContentSearchResultListAdapter = TypeAdapter(List[ContentSearchResult])
@@ -1,17 +1,18 @@
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, validator, model_validator
 from typing import Optional, Dict, Any, List
 from datetime import datetime, date
-from enum import Enum
+from enum import StrEnum
+from app.schemas.common import bounded, non_negative_int, non_negative_float, rate
 
 
-class TimeGranularity(str, Enum):
+class TimeGranularity(StrEnum):
     HOUR = "hour"
     DAY = "day"
     WEEK = "week"
     MONTH = "month"
 
 
-class MetricType(str, Enum):
+class MetricType(StrEnum):
     QUERIES = "queries"
     USERS = "users"
     RESPONSE_TIME = "response_time"
@@ -27,55 +28,30 @@ class StatsBase(BaseModel):
     start_date: datetime
     end_date: datetime
     
-    @validator('end_date')
-    def validate_date_range(cls, v, values):
-        if 'start_date' in values and v <= values['start_date']:
+    @model_validator(mode='after')
+    def validate_date_range(self):
+        if self.end_date <= self.start_date:
             raise ValueError('終了日は開始日より後である必要があります')
-        return v
+        return self
 
 
 class UsageStats(StatsBase):
-    total_queries: int = 0
-    unique_users: int = 0
-    avg_response_time_ms: float = 0.0
-    feedback_rate: float = 0.0
-    like_rate: float = 0.0
-    
-    @validator('total_queries')
-    def validate_total_queries(cls, v):
-        if v < 0:
-            raise ValueError('総質問数は0以上である必要があります')
-        return v
-    
-    @validator('unique_users')
-    def validate_unique_users(cls, v):
-        if v < 0:
-            raise ValueError('ユニークユーザー数は0以上である必要があります')
-        return v
-    
-    @validator('avg_response_time_ms')
-    def validate_response_time(cls, v):
-        if v < 0:
-            raise ValueError('平均応答時間は0以上である必要があります')
-        return v
-    
-    @validator('feedback_rate')
-    def validate_feedback_rate(cls, v):
-        if v < 0 or v > 1:
-            raise ValueError('評価率は0-1の範囲である必要があります')
-        return v
-    
-    @validator('like_rate')
-    def validate_like_rate(cls, v):
-        if v < 0 or v > 1:
-            raise ValueError('いいね率は0-1の範囲である必要があります')
-        return v
+    total_queries: non_negative_int('総質問数') = 0
+    unique_users: non_negative_int('ユニークユーザー数') = 0
+    avg_response_time_ms: non_negative_float('平均応答時間') = 0.0
+    feedback_rate: rate('評価率') = 0.0
+    like_rate: rate('いいね率') = 0.0
 
 
 class TimeSeriesData(BaseModel):
     timestamp: datetime
     value: float
-    metadata: Dict[str, Any] = {}
+    # サービス層で生成するメタデータのため、キー型の検証を行わない素のdictとして扱う
+    metadata: dict = {}
+    
+    class Config:
+        # 読み取り専用のレスポンスオブジェクトのため不変とする
+        frozen = True
 
 
 class UsageTimeSeries(BaseModel):
@@ -87,8 +63,8 @@ class UsageTimeSeries(BaseModel):
 
 class TopQuery(BaseModel):
     query: str
-    count: int
-    like_rate: float
+    count: non_negative_int('質問回数')
+    like_rate: rate('いいね率')
     avg_response_time_ms: float
     
     @validator('query')
@@ -97,45 +73,19 @@ class TopQuery(BaseModel):
             raise ValueError('質問文は500文字以内である必要があります')
         return v.strip()
     
-    @validator('count')
-    def validate_count(cls, v):
-        if v < 0:
-            raise ValueError('質問回数は0以上である必要があります')
-        return v
-    
-    @validator('like_rate')
-    def validate_like_rate(cls, v):
-        if v < 0 or v > 1:
-            raise ValueError('いいね率は0-1の範囲である必要があります')
-        return v
+    class Config:
+        # 読み取り専用のレスポンスオブジェクトのため不変とする
+        frozen = True
 
 
 class LLMUsageStats(BaseModel):
     tenant_id: str
     model: str
-    total_tokens_in: int = 0
-    total_tokens_out: int = 0
-    total_cost: float = 0.0
+    total_tokens_in: non_negative_int('入力トークン数') = 0
+    total_tokens_out: non_negative_int('出力トークン数') = 0
+    total_cost: non_negative_float('コスト') = 0.0
     request_count: int = 0
     avg_tokens_per_request: float = 0.0
-    
-    @validator('total_tokens_in')
-    def validate_tokens_in(cls, v):
-        if v < 0:
-            raise ValueError('入力トークン数は0以上である必要があります')
-        return v
-    
-    @validator('total_tokens_out')
-    def validate_tokens_out(cls, v):
-        if v < 0:
-            raise ValueError('出力トークン数は0以上である必要があります')
-        return v
-    
-    @validator('total_cost')
-    def validate_cost(cls, v):
-        if v < 0:
-            raise ValueError('コストは0以上である必要があります')
-        return v
 
 
 class LLMUsageTimeSeries(BaseModel):
@@ -148,29 +98,11 @@ class LLMUsageTimeSeries(BaseModel):
 
 class FeedbackStats(BaseModel):
     tenant_id: str
-    total_feedback: int = 0
-    positive_feedback: int = 0
-    negative_feedback: int = 0
+    total_feedback: non_negative_int('総評価数') = 0
+    positive_feedback: non_negative_int('ポジティブ評価数') = 0
+    negative_feedback: non_negative_int('ネガティブ評価数') = 0
     no_feedback: int = 0
     positive_rate: float = 0.0
-    
-    @validator('total_feedback')
-    def validate_total_feedback(cls, v):
-        if v < 0:
-            raise ValueError('総評価数は0以上である必要があります')
-        return v
-    
-    @validator('positive_feedback')
-    def validate_positive_feedback(cls, v):
-        if v < 0:
-            raise ValueError('ポジティブ評価数は0以上である必要があります')
-        return v
-    
-    @validator('negative_feedback')
-    def validate_negative_feedback(cls, v):
-        if v < 0:
-            raise ValueError('ネガティブ評価数は0以上である必要があります')
-        return v
 
 
 class FeedbackAnalysis(BaseModel):
@@ -181,51 +113,15 @@ class FeedbackAnalysis(BaseModel):
 
 class StorageStats(BaseModel):
     tenant_id: str
-    total_files: int = 0
-    total_size_mb: float = 0.0
-    total_chunks: int = 0
+    total_files: non_negative_int('総ファイル数') = 0
+    total_size_mb: non_negative_float('総サイズ') = 0.0
+    total_chunks: non_negative_int('総チャンク数') = 0
     storage_limit_mb: int = 100
     usage_percentage: float = 0.0
     # ステータス別件数
-    indexed_files: int = 0
-    processing_files: int = 0
-    failed_files: int = 0
-    
-    @validator('total_files')
-    def validate_total_files(cls, v):
-        if v < 0:
-            raise ValueError('総ファイル数は0以上である必要があります')
-        return v
-    
-    @validator('total_size_mb')
-    def validate_total_size(cls, v):
-        if v < 0:
-            raise ValueError('総サイズは0以上である必要があります')
-        return v
-    
-    @validator('total_chunks')
-    def validate_total_chunks(cls, v):
-        if v < 0:
-            raise ValueError('総チャンク数は0以上である必要があります')
-        return v
-
-    @validator('indexed_files')
-    def validate_indexed_files(cls, v):
-        if v < 0:
-            raise ValueError('インデックス済みファイル数は0以上である必要があります')
-        return v
-
-    @validator('processing_files')
-    def validate_processing_files(cls, v):
-        if v < 0:
-            raise ValueError('処理中ファイル数は0以上である必要があります')
-        return v
-
-    @validator('failed_files')
-    def validate_failed_files(cls, v):
-        if v < 0:
-            raise ValueError('失敗ファイル数は0以上である必要があります')
-        return v
+    indexed_files: non_negative_int('インデックス済みファイル数') = 0
+    processing_files: non_negative_int('処理中ファイル数') = 0
+    failed_files: non_negative_int('失敗ファイル数') = 0
 
 
 class DashboardStats(BaseModel):
@@ -243,7 +139,7 @@ class AlertRule(BaseModel):
     tenant_id: str
     name: str
     metric_type: MetricType
-    threshold: float
+    threshold: non_negative_float('閾値')
     operator: str  # "gt", "lt", "eq", "gte", "lte"
     is_active: bool = True
     notification_channels: List[str] = []
@@ -254,12 +150,6 @@ class AlertRule(BaseModel):
             raise ValueError('アラート名は1-100文字である必要があります')
         return v.strip()
     
-    @validator('threshold')
-    def validate_threshold(cls, v):
-        if v < 0:
-            raise ValueError('閾値は0以上である必要があります')
-        return v
-    
     @validator('operator')
     def validate_operator(cls, v):
         valid_operators = ["gt", "lt", "eq", "gte", "lte"]
@@ -301,19 +191,14 @@ class MonitoringConfig(BaseModel):
     alert_rules: List[AlertRule] = []
     notification_email: Optional[str] = None
     notification_webhook: Optional[str] = None
-    check_interval_minutes: int = 5
-    
-    @validator('check_interval_minutes')
-    def validate_check_interval(cls, v):
-        if v < 1 or v > 1440:  # 1分から24時間
-            raise ValueError('チェック間隔は1-1440分の範囲である必要があります')
-        return v
+    # 1分から24時間
+    check_interval_minutes: bounded(int, 'チェック間隔は1-1440分の範囲である必要があります', ge=1, le=1440) = 5
 
 
 class HealthCheck(BaseModel):
     service: str
     status: str  # "healthy", "degraded", "unhealthy"
-    response_time_ms: float
+    response_time_ms: non_negative_float('応答時間')
     last_check: datetime
     details: Dict[str, Any] = {}
     
@@ -324,11 +209,9 @@ class HealthCheck(BaseModel):
             raise ValueError(f'ステータスは{valid_statuses}のいずれかである必要があります')
         return v
     
-    @validator('response_time_ms')
-    def validate_response_time(cls, v):
-        if v < 0:
-            raise ValueError('応答時間は0以上である必要があります')
-        return v
+    class Config:
+        # 読み取り専用のレスポンスオブジェクトのため不変とする
+        frozen = True
 
 
 class SystemHealth(BaseModel):
@@ -1,49 +1,31 @@
 from pydantic import BaseModel, validator
 from typing import Optional, Dict, Any, List
 from datetime import datetime
-from enum import Enum
+from enum import StrEnum
 from uuid import UUID
-import re
+from app.schemas.common import ChunkSize, ChunkOverlap, Temperature, TenantName, TenantDomain, bounded, non_negative_int
 
 
-class TenantPlan(str, Enum):
+class TenantPlan(StrEnum):
     FREE = "FREE"
     BASIC = "BASIC"
     PRO = "PRO"
     ENTERPRISE = "ENTERPRISE"
 
 
-class TenantStatus(str, Enum):
+class TenantStatus(StrEnum):
     ACTIVE = "ACTIVE"
     SUSPENDED = "SUSPENDED"
     DELETED = "DELETED"
 
 
 class TenantBase(BaseModel):
-    name: str
-    domain: str
+    # テナント登録時と同じ検証・正規化（前後の空白除去、識別子は小文字化）
+    name: TenantName
+    domain: TenantDomain
     plan: TenantPlan = TenantPlan.FREE
     status: TenantStatus = TenantStatus.ACTIVE
     settings: Dict[str, Any] = {}
-    
-    @validator('name')
-    def validate_name(cls, v):
-        if len(v) < 2:
-            raise ValueError('テナント名は2文字以上である必要があります')
-        if len(v) > 255:
-            raise ValueError('テナント名は255文字以内である必要があります')
-        return v
-    
-    @validator('domain')
-    def validate_domain(cls, v):
-        if not v or len(v) < 3:
-            raise ValueError('テナント識別子は3文字以上である必要があります')
-        if len(v) > 255:
-            raise ValueError('テナント識別子は255文字以内である必要があります')
-        # 英数字、ハイフン、アンダースコアのみ許可
-        if not re.match(r'^[a-zA-Z0-9_-]+$', v):
-            raise ValueError('テナント識別子は英数字、ハイフン、アンダースコアのみ使用可能です')
-        return v.lower()
 
 
 class TenantCreate(TenantBase):
@@ -51,33 +33,13 @@ class TenantCreate(TenantBase):
 
 
 class TenantUpdate(BaseModel):
-    name: Optional[str] = None
-    domain: Optional[str] = None
+    name: Optional[TenantName] = None
+    domain: Optional[TenantDomain] = None
     plan: Optional[TenantPlan] = None
     status: Optional[TenantStatus] = None
     settings: Optional[Dict[str, Any]] = None
     # ウィジェット設置を許可するオリジン（CSV形式: "https://foo.com,https://bar.com"）
     allowed_widget_origins: Optional[str] = None
-    
-    @validator('name')
-    def validate_name(cls, v):
-        if v is not None:
-            if len(v) < 2:
-                raise ValueError('テナント名は2文字以上である必要があります')
-            if len(v) > 255:
-                raise ValueError('テナント名は255文字以内である必要があります')
-        return v
-    
-    @validator('domain')
-    def validate_domain(cls, v):
-        if v is not None:
-            if len(v) < 3:
-                raise ValueError('テナント識別子は3文字以上である必要があります')
-            if len(v) > 255:
-                raise ValueError('テナント識別子は255文字以内である必要があります')
-            if not re.match(r'^[a-zA-Z0-9_-]+$', v):
-                raise ValueError('テナント識別子は英数字、ハイフン、アンダースコアのみ使用可能です')
-        return v.lower() if v else v
 
 
 class TenantInDB(TenantBase):
@@ -97,6 +59,7 @@ class TenantInDB(TenantBase):
     
     class Config:
         from_attributes = True
+        frozen = True
 
 
 class Tenant(TenantInDB):
@@ -146,15 +109,15 @@ class TenantStats(BaseModel):
 class TenantSettings(BaseModel):
     default_model: Optional[str] = None
     embedding_model: Optional[str] = None
-    chunk_size: int = 1024
-    chunk_overlap: int = 200
-    max_queries_per_day: int = 1000
-    max_storage_mb: int = 100
+    chunk_size: ChunkSize = 1024
+    chunk_overlap: ChunkOverlap = 200
+    max_queries_per_day: non_negative_int('最大質問数') = 1000
+    max_storage_mb: non_negative_int('最大ストレージサイズ') = 100
     enable_api_access: bool = True
     enable_webhook: bool = True
     webhook_url: Optional[str] = None
-    temperature: float = 0.7
-    max_tokens: int = 500
+    temperature: Temperature = 0.7
+    max_tokens: bounded(int, 'max_tokensは1-4000の範囲である必要があります', ge=1, le=4000) = 500
     
     @validator('default_model')
     def validate_default_model(cls, v):
@@ -185,42 +148,6 @@ class TenantSettings(BaseModel):
         if v not in available_models:
             raise ValueError(f'サポートされていないモデル: {v}')
         return v
-    
-    @validator('temperature')
-    def validate_temperature(cls, v):
-        if v < 0.0 or v > 2.0:
-            raise ValueError('temperatureは0.0-2.0の範囲である必要があります')
-        return v
-    
-    @validator('max_tokens')
-    def validate_max_tokens(cls, v):
-        if v < 1 or v > 4000:
-            raise ValueError('max_tokensは1-4000の範囲である必要があります')
-        return v
-    
-    @validator('chunk_size')
-    def validate_chunk_size(cls, v):
-        if v < 256 or v > 4096:
-            raise ValueError('チャンクサイズは256-4096の範囲である必要があります')
-        return v
-    
-    @validator('chunk_overlap')
-    def validate_chunk_overlap(cls, v):
-        if v < 0 or v > 512:
-            raise ValueError('チャンクオーバーラップは0-512の範囲である必要があります')
-        return v
-    
-    @validator('max_queries_per_day')
-    def validate_max_queries(cls, v):
-        if v < 0:
-            raise ValueError('最大質問数は0以上である必要があります')
-        return v
-    
-    @validator('max_storage_mb')
-    def validate_max_storage(cls, v):
-        if v < 0:
-            raise ValueError('最大ストレージサイズは0以上である必要があります')
-        return v
 
 
 class TenantApiKey(BaseModel):
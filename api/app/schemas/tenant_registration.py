@@ -10,10 +10,10 @@
 - 統合的な登録フローのサポート
 """
 
-from pydantic import BaseModel, EmailStr, validator
+from pydantic import BaseModel, EmailStr, field_validator
 from typing import Optional
 from app.models.user import UserRole
-import re
+from app.schemas.common import TenantName, TenantDomain, Username, check_password_strength
 
 
 class TenantRegistrationData(BaseModel):
@@ -29,57 +29,17 @@ class TenantRegistrationData(BaseModel):
         admin_username: テナント管理者のユーザー名
         admin_password: テナント管理者のパスワード
     """
-    tenant_name: str
-    tenant_domain: str
+    tenant_name: TenantName
+    tenant_domain: TenantDomain
     admin_email: EmailStr
-    admin_username: str
+    admin_username: Username
     admin_password: str
     
-    @validator('tenant_name')
-    def validate_tenant_name(cls, v):
-        """テナント名のバリデーション"""
-        if not v or len(v.strip()) < 2:
-            raise ValueError('テナント名は2文字以上である必要があります')
-        if len(v) > 255:
-            raise ValueError('テナント名は255文字以内である必要があります')
-        return v.strip()
-    
-    @validator('tenant_domain')
-    def validate_tenant_domain(cls, v):
-        """テナント識別子のバリデーション"""
-        if not v or len(v.strip()) < 3:
-            raise ValueError('テナント識別子は3文字以上である必要があります')
-        if len(v) > 255:
-            raise ValueError('テナント識別子は255文字以内である必要があります')
-        # 英数字、ハイフン、アンダースコアのみ許可
-        if not re.match(r'^[a-zA-Z0-9_-]+$', v.strip()):
-            raise ValueError('テナント識別子は英数字、ハイフン、アンダースコアのみ使用可能です')
-        return v.strip().lower()
-    
-    @validator('admin_username')
-    def validate_admin_username(cls, v):
-        """管理者ユーザー名のバリデーション"""
-        if not v or len(v.strip()) < 3:
-            raise ValueError('ユーザー名は3文字以上である必要があります')
-        if len(v) > 100:
-            raise ValueError('ユーザー名は100文字以内である必要があります')
-        # 英数字とアンダースコアのみ許可
-        if not v.replace('_', '').isalnum():
-            raise ValueError('ユーザー名は英数字とアンダースコアのみ使用可能です')
-        return v.strip()
-    
-    @validator('admin_password')
+    @field_validator('admin_password')
+    @classmethod
     def validate_admin_password(cls, v):
         """管理者パスワードのバリデーション"""
-        if len(v) < 8:
-            raise ValueError('パスワードは8文字以上である必要があります')
-        if not any(c.isupper() for c in v):
-            raise ValueError('パスワードには大文字を含める必要があります')
-        if not any(c.islower() for c in v):
-            raise ValueError('パスワードには小文字を含める必要があります')
-        if not any(c.isdigit() for c in v):
-            raise ValueError('パスワードには数字を含める必要があります')
-        return v
+        return check_password_strength(v)
 
 
 class TenantRegistrationResponse(BaseModel):
@@ -1,8 +1,8 @@
-from pydantic import BaseModel, EmailStr, validator
+from pydantic import BaseModel, EmailStr, field_validator
 from typing import Optional, List
 from datetime import datetime
-from uuid import UUID
 from app.models.user import UserRole
+from app.schemas.common import UUIDStr, check_password_strength
 
 
 class UserBase(BaseModel):
@@ -15,26 +15,10 @@ class UserCreate(UserBase):
     password: str
     tenant_id: Optional[str] = None
     
-    @validator('password')
+    @field_validator('password')
+    @classmethod
     def validate_password(cls, v):
-        if len(v) < 8:
-            raise ValueError('パスワードは8文字以上である必要があります')
-        if not any(c.isupper() for c in v):
-            raise ValueError('パスワードには大文字を含める必要があります')
-        if not any(c.islower() for c in v):
-            raise ValueError('パスワードには小文字を含める必要があります')
-        if not any(c.isdigit() for c in v):
-            raise ValueError('パスワードには数字を含める必要があります')
-        return v
-    
-    @validator('role', pre=True)
-    def validate_role(cls, v):
-        if isinstance(v, str):
-            try:
-                return UserRole(v)
-            except ValueError:
-                raise ValueError(f'無効なロール: {v}')
-        return v
+        return check_password_strength(v)
 
 
 class UserUpdate(BaseModel):
@@ -44,40 +28,26 @@ class UserUpdate(BaseModel):
     role: Optional[UserRole] = None
     is_active: Optional[bool] = None
     
-    @validator('password')
+    @field_validator('password')
+    @classmethod
     def validate_password(cls, v):
-        if v is not None:
-            if len(v) < 8:
-                raise ValueError('パスワードは8文字以上である必要があります')
-            if not any(c.isupper() for c in v):
-                raise ValueError('パスワードには大文字を含める必要があります')
-            if not any(c.islower() for c in v):
-                raise ValueError('パスワードには小文字を含める必要があります')
-            if not any(c.isdigit() for c in v):
-                raise ValueError('パスワードには数字を含める必要があります')
-        return v
+        return check_password_strength(v) if v is not None else v
 
 
 class TenantInfo(BaseModel):
-    id: str
+    id: UUIDStr
     name: str
     domain: str
     plan: str
     status: str
     
-    @validator('id', pre=True)
-    def convert_uuid_to_str(cls, v):
-        if isinstance(v, UUID):
-            return str(v)
-        return v
-    
     class Config:
         from_attributes = True
 
 
 class UserInDB(UserBase):
-    id: str
-    tenant_id: Optional[str]
+    id: UUIDStr
+    tenant_id: Optional[UUIDStr]
     is_active: bool
     is_verified: bool
     last_login_at: Optional[datetime]
@@ -85,18 +55,6 @@ class UserInDB(UserBase):
     updated_at: Optional[datetime]
     tenant: Optional[TenantInfo] = None
 
-    @validator('id', pre=True)
-    def convert_uuid_to_str(cls, v):
-        if isinstance(v, UUID):
-            return str(v)
-        return v
-
-    @validator('tenant_id', pre=True)
-    def convert_tenant_uuid_to_str(cls, v):
-        if isinstance(v, UUID):
-            return str(v)
-        return v
-
     class Config:
         from_attributes = True
 
@@ -131,17 +89,10 @@ class PasswordResetConfirm(BaseModel):
     token: str
     new_password: str
     
-    @validator('new_password')
+    @field_validator('new_password')
+    @classmethod
     def validate_password(cls, v):
-        if len(v) < 8:
-            raise ValueError('パスワードは8文字以上である必要があります')
-        if not any(c.isupper() for c in v):
-            raise ValueError('パスワードには大文字を含める必要があります')
-        if not any(c.islower() for c in v):
-            raise ValueError('パスワードには小文字を含める必要があります')
-        if not any(c.isdigit() for c in v):
-            raise ValueError('パスワードには数字を含める必要があります')
-        return v
+        return check_password_strength(v)
 
 
 class EmailVerification(BaseModel):
@@ -13,10 +13,11 @@ APIキーのCRUD操作、暗号化・復号化、バリデーションなどの
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_, text
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import selectinload
 from typing import Optional, List
-from datetime import datetime
-from cryptography.fernet import Fernet
+from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from app.models.api_key import ApiKey
 from app.schemas.api_key import ApiKeyCreate, ApiKeyUpdate, ApiKeyResponse
 from app.core.exceptions import (
@@ -24,29 +25,250 @@ from app.core.exceptions import (
 )
 from app.utils.logging import SecurityLogger, BusinessLogger, ErrorLogger, logger
 from app.core.config import settings
+import asyncio
 import base64
+import binascii
+import hashlib
+import os
+import time
+from collections import OrderedDict
 from typing import Dict, Any
-from app.utils.common import RetryUtils
+from app.utils.common import RetryUtils, HTTP2_AVAILABLE
 
 try:
     from openai import AsyncOpenAI
 except Exception:
     AsyncOpenAI = None  # type: ignore
 
+# OpenAI SDKのaiohttpトランスポート（openai[aiohttp]導入時のみ利用可能）
+try:
+    from openai import DefaultAioHttpClient  # type: ignore
+except Exception:
+    DefaultAioHttpClient = None  # type: ignore
+
 # Google Generative AI SDK（同期APIのため to_thread で実行）
+# genai.configure はプロセス全体のグローバル設定のため、検証ではキーごとに低レベルクライアントを生成する
 try:
     import google.generativeai as genai  # type: ignore
+    import google.ai.generativelanguage as glm  # type: ignore
 except Exception:
     genai = None  # type: ignore
+    glm = None  # type: ignore
 
 # Anthropic SDK（非同期）
 try:
     from anthropic import AsyncAnthropic  # type: ignore
-    import httpx  # type: ignore
 except Exception:
     AsyncAnthropic = None  # type: ignore
+
+# 検証用SDKクライアントで共有するHTTPクライアント
+try:
+    import httpx  # type: ignore
+except Exception:
     httpx = None  # type: ignore
 
+# AES-GCMのnonce長（バイト）
+_AESGCM_NONCE_SIZE = 12
+
+# 旧形式のFernetトークン（バージョンバイト0x80をbase64化したもの）の先頭
+_FERNET_TOKEN_PREFIX = b'gAAAAA'
+
+# URLセーフbase64の変換テーブル（標準base64との相互変換用）
+_B64_TO_URLSAFE = bytes.maketrans(b'+/', b'-_')
+_B64_FROM_URLSAFE = bytes.maketrans(b'-_', b'+/')
+
+
+def _b64url_encode(data: bytes) -> str:
+    """
+    URLセーフbase64でエンコード（base64.urlsafe_b64encode と同じ出力）
+    
+    base64モジュールの引数処理と中間コピーを経由せず、binasciiで直接変換する
+    """
+    return binascii.b2a_base64(data, newline=False).translate(_B64_TO_URLSAFE).decode()
+
+
+def _b64url_decode(data: str) -> bytes:
+    """
+    URLセーフbase64をデコード（base64.urlsafe_b64decode と同じ結果）
+    """
+    return binascii.a2b_base64(data.encode().translate(_B64_FROM_URLSAFE))
+
+
+# 暗号化キーの生成（本番環境では環境変数から取得）
+# リクエスト毎のサービス生成で鍵スケジュールを作り直さないよう、一度だけ生成する
+_AEAD = AESGCM(hashlib.sha256(settings.SECRET_KEY.encode()).digest())
+
+# 既存データ（Fernet形式）の復号化用
+_LEGACY_CIPHER = Fernet(base64.urlsafe_b64encode(settings.SECRET_KEY.encode()[:32].ljust(32, b'0')))
+
+# 復号化済みAPIキーのキャッシュ（暗号文 -> (有効期限, 平文)）
+# 暗号化時にnonceをランダム生成するため、APIキー更新時は暗号文自体が変わり古いエントリは参照されない
+# 平文をメモリに長く残さないよう、件数とTTLの両方で制限する
+_DECRYPT_CACHE_MAX_SIZE = 1024
+_DECRYPT_CACHE_TTL_SECONDS = 300
+_decrypt_cache: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+
+# APIキー検証用SDKクライアントのプール（(プロバイダー, APIキーのハッシュ) -> クライアント）
+# 同じAPIキーの再検証ではTLS接続を再利用する
+# クライアントは共有のHTTPクライアントを使うため、プールから外す際にcloseは不要
+_CLIENT_POOL_MAX_SIZE = 64
+_client_pool: "OrderedDict[tuple[str, str], Any]" = OrderedDict()
+_shared_http_client: Optional["httpx.AsyncClient"] = None
+_openai_http_client: Optional["httpx.AsyncClient"] = None
+
+# APIキー検証結果のキャッシュ（(プロバイダー, APIキーのハッシュ, モデル) -> (有効期限, 結果)）
+# 画面表示毎の再検証などの短時間の重複呼び出しを1回の外部API呼び出しにまとめる
+# 一時的なエラー（レート制限・タイムアウト等）を固定しないよう、成功した結果のみ保持する
+_VERIFY_CACHE_MAX_SIZE = 256
+_VERIFY_CACHE_TTL_SECONDS = 60
+_verify_cache: "OrderedDict[tuple[str, str, str], tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+
+def _get_shared_http_client() -> "httpx.AsyncClient":
+    """
+    検証用SDKクライアントで共有するHTTPクライアントを取得（proxiesは明示的に除外）
+    
+    HTTP/2が利用可能な場合は同一ホストへの同時リクエストを1接続に多重化する
+    """
+    global _shared_http_client
+    if _shared_http_client is None or _shared_http_client.is_closed:
+        _shared_http_client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=30),
+        )
+    return _shared_http_client
+
+
+def _get_openai_http_client() -> "httpx.AsyncClient":
+    """
+    OpenAIクライアント用のHTTPクライアントを取得
+    
+    aiohttpトランスポートが利用可能な場合はそれを使用し（同時接続時のスループットが高い）、
+    利用できない場合は共有のhttpxクライアントにフォールバックする
+    """
+    global _openai_http_client
+    if DefaultAioHttpClient is None:
+        return _get_shared_http_client()
+    if _openai_http_client is None or _openai_http_client.is_closed:
+        try:
+            _openai_http_client = DefaultAioHttpClient(timeout=10.0)
+        except Exception:
+            # httpx-aiohttp が未インストールの場合
+            return _get_shared_http_client()
+    return _openai_http_client
+
+
+async def close_verify_http_clients() -> None:
+    """
+    検証用SDKクライアントで共有するHTTPクライアントを閉じる（アプリ終了時に呼び出す）
+    
+    プール内のSDKクライアントは閉じたHTTPクライアントを参照するため、プールも空にする
+    """
+    global _shared_http_client, _openai_http_client
+    _client_pool.clear()
+    for client in (_openai_http_client, _shared_http_client):
+        if client is not None and not client.is_closed:
+            await client.aclose()
+    _shared_http_client = _openai_http_client = None
+
+
+def _get_pooled_client(provider: str, api_key: str) -> Any:
+    """
+    プロバイダー・APIキー毎のSDKクライアントを取得（なければ生成してプールに追加）
+    
+    引数:
+        provider: プロバイダー名（openai / anthropic）
+        api_key: 平文APIキー
+    戻り値:
+        AsyncOpenAI または AsyncAnthropic クライアント
+    """
+    pool_key = (provider, hashlib.sha256(api_key.encode()).hexdigest())
+    client = _client_pool.get(pool_key)
+    if client is not None:
+        _client_pool.move_to_end(pool_key)
+        return client
+    
+    if provider == "openai":
+        client = AsyncOpenAI(api_key=api_key, timeout=10.0, http_client=_get_openai_http_client())
+    else:
+        client = AsyncAnthropic(api_key=api_key, http_client=_get_shared_http_client())
+    _client_pool[pool_key] = client
+    if len(_client_pool) > _CLIENT_POOL_MAX_SIZE:
+        _client_pool.popitem(last=False)
+    return client
+
+
+# APIキーの取得列（SELECT/RETURNING共通）
+_API_KEY_COLUMNS = "id, tenant_id, provider, api_key, model_name, is_active, created_at, updated_at"
+
+# 重複チェック付きINSERT文
+# 有効なキーの重複（同時実行を含む）は部分ユニークインデックス（tenant_id, provider, model_name WHERE is_active）と
+# ON CONFLICT DO NOTHINGのみで防ぐ（重複時は行が返らない）
+_INSERT_STMT = text(f"""
+    INSERT INTO api_keys (tenant_id, provider, api_key, model_name, is_active, created_at, updated_at)
+    VALUES (CAST(:tid AS uuid), :provider, :api_key, :model, true, NOW(), NOW())
+    ON CONFLICT DO NOTHING
+    RETURNING {_API_KEY_COLUMNS}
+""")
+_SELECT_BY_ID_STMT = text(f"""
+    SELECT {_API_KEY_COLUMNS}
+    FROM api_keys
+    WHERE id = :api_key_id AND tenant_id = :tid
+""")
+_SELECT_ACTIVE_BY_PROVIDER_STMT = text(f"""
+    SELECT {_API_KEY_COLUMNS}
+    FROM api_keys
+    WHERE tenant_id = :tid AND provider = :provider AND is_active = true
+    LIMIT 1
+""")
+_DELETE_STMT = text("""
+    DELETE FROM api_keys
+    WHERE id = :api_key_id AND tenant_id = :tid
+    RETURNING api_key, provider
+""")
+# APIキー検証エラーの分類ルール（上から順に評価し、最初に一致したものを採用）
+# 各ルールは「いずれかの語句の組が、組内の全語句を含めば一致」とする
+# (語句の組のタプル, エラーコード, ユーザー向けメッセージ)
+_VERIFY_ERROR_RULES: tuple[tuple[tuple[tuple[str, ...], ...], str, str], ...] = (
+    # 残高不足エラーの検出（優先度: 高）
+    (
+        (("credit balance",), ("credit", "too low"), ("credit", "insufficient")),
+        "insufficient_credits",
+        "APIキーの残高が不足しています。",
+    ),
+    (
+        (("unauthorized",), ("authentication", "failed")),
+        "unauthorized",
+        "APIキーが無効または認証に失敗しました。",
+    ),
+    (
+        (("rate", "limit"),),
+        "rate_limited",
+        "レート制限に達しました。しばらく待ってから再試行してください。",
+    ),
+    (
+        (("timeout",),),
+        "timeout",
+        "リクエストがタイムアウトしました。",
+    ),
+    (
+        (("invalid", "request"),),
+        "invalid_request",
+        "無効なリクエストです。",
+    ),
+    (
+        tuple(
+            (nf, target)
+            for nf in ("not_found", "not found", "404")
+            for target in ("model", "claude")
+        ),
+        "model_not_found",
+        "指定のAnthropicモデルが見つかりません。例: 'claude-3-5-sonnet-latest' や "
+        "'claude-3-haiku-20240307' を使用してください。",
+    ),
+)
+
 
 class ApiKeyService:
     """
@@ -57,7 +279,8 @@ class ApiKeyService:
     
     属性:
         db: データベースセッション（AsyncSession）
-        cipher: 暗号化オブジェクト（Fernet）
+        cipher: 旧形式の復号化用オブジェクト（Fernet）
+        _aead: 暗号化オブジェクト（AES-GCM）
     """
     
     def __init__(self, db: AsyncSession):
@@ -68,9 +291,9 @@ class ApiKeyService:
             db: データベースセッション
         """
         self.db = db
-        # 暗号化キーの生成（本番環境では環境変数から取得）
-        key = settings.SECRET_KEY.encode()[:32].ljust(32, b'0')
-        self.cipher = Fernet(base64.urlsafe_b64encode(key))
+        # 暗号化オブジェクトはモジュール読み込み時に生成したものを共有
+        self._aead = _AEAD
+        self.cipher = _LEGACY_CIPHER
 
     @RetryUtils.retry_on_exception(max_retries=1, delay=1.0)
     async def verify_api_key(self, provider: str, api_key: str, model: str) -> Dict[str, Any]:
@@ -84,174 +307,219 @@ class ApiKeyService:
         戻り値:
             { valid: bool, provider: str, model: str, message?: str, error_code?: str }
         """
+        verifier = self._VERIFIERS.get(provider.lower())
+        if verifier is None:
+            return {"valid": False, "provider": provider, "model": model, "error_code": "unsupported_provider", "message": "未サポートのプロバイダーです"}
+        
+        cache_key = (provider.lower(), hashlib.sha256(api_key.encode()).hexdigest(), model or "")
+        now = time.monotonic()
+        cached = _verify_cache.get(cache_key)
+        if cached is not None:
+            if cached[0] > now:
+                _verify_cache.move_to_end(cache_key)
+                return dict(cached[1])
+            del _verify_cache[cache_key]
+        
         try:
-            provider_l = provider.lower()
-            if provider_l == "openai":
-                if AsyncOpenAI is None:
-                    return {"valid": False, "provider": provider, "model": model, "error_code": "sdk_unavailable", "message": "OpenAI SDKが利用できません"}
-                client = AsyncOpenAI(api_key=api_key, timeout=10.0)
-                # Embeddings API で短文をテスト
-                test_model = model
-                # モデルがチャットモデルの場合でも通るよう、embedding系モデルにフォールバック（軽いマッピング）
-                if not test_model or "embedding" not in test_model:
-                    test_model = "text-embedding-3-small"
-                await client.embeddings.create(model=test_model, input="ping")
-                return {"valid": True, "provider": provider, "model": test_model, "message": "OK"}
-            elif provider_l == "google":
-                if genai is None:
-                    return {"valid": False, "provider": provider, "model": model, "error_code": "sdk_unavailable", "message": "Google Generative AI SDKが利用できません"}
-                # 同期APIをスレッドで実行
-                import asyncio
-                genai.configure(api_key=api_key)
-
-                # 優先候補（SDKの世代に合わせて順序付け）
-                candidate_models = []
-                if model:
-                    candidate_models.append(model)
-                candidate_models += [
-                    "gemini-1.5-flash-latest",
-                    "gemini-1.5-pro-latest",
-                    "gemini-1.5-flash",
-                    "gemini-1.5-pro",
-                    "gemini-pro",
-                ]
-
-                last_err: Exception | None = None
+            result = await verifier(self, provider, api_key, model)
+        except Exception as e:
+            return self._classify_verify_error(provider, model, e)
+        
+        if result.get("valid"):
+            _verify_cache[cache_key] = (now + _VERIFY_CACHE_TTL_SECONDS, dict(result))
+            if len(_verify_cache) > _VERIFY_CACHE_MAX_SIZE:
+                _verify_cache.popitem(last=False)
+        return result
+    
+    async def _verify_openai(self, provider: str, api_key: str, model: str) -> Dict[str, Any]:
+        """
+        OpenAIのAPIキーを検証
+        
+        引数・戻り値は verify_api_key と同じ。分類が必要なエラーは例外として送出する
+        """
+        if AsyncOpenAI is None or httpx is None:
+            return {"valid": False, "provider": provider, "model": model, "error_code": "sdk_unavailable", "message": "OpenAI SDKが利用できません"}
+        client = _get_pooled_client("openai", api_key)
+        # モデル情報取得API（課金なし・認証必須）で検証
+        test_model = model
+        # モデルがチャットモデルの場合でも通るよう、embedding系モデルにフォールバック（軽いマッピング）
+        if not test_model or "embedding" not in test_model:
+            test_model = "text-embedding-3-small"
+        await client.models.retrieve(test_model)
+        return {"valid": True, "provider": provider, "model": test_model, "message": "OK"}
+    
+    async def _verify_google(self, provider: str, api_key: str, model: str) -> Dict[str, Any]:
+        """
+        Google Generative AIのAPIキーを検証
+        
+        引数・戻り値は verify_api_key と同じ。分類が必要なエラーは例外として送出する
+        """
+        if genai is None or glm is None:
+            return {"valid": False, "provider": provider, "model": model, "error_code": "sdk_unavailable", "message": "Google Generative AI SDKが利用できません"}
+        # グローバル設定（genai.configure）を使わず、キーごとのクライアントで検証する
+        # これにより別キーの検証と並行して実行でき、プロセス全体のロックも不要になる
+        # クライアントはそれぞれgRPCチャネルを持つため、検証後に必ず閉じる
+        # （モデル一覧用のクライアントはフォールバック時のみ生成する）
+        client_options = {"api_key": api_key}
+        generative_client = glm.GenerativeServiceClient(client_options=client_options)
+        model_client = None
+        try:
+            # 優先候補（SDKの世代に合わせて順序付け）
+            candidate_models = []
+            if model:
+                candidate_models.append(model)
+            candidate_models += [
+                "gemini-1.5-flash-latest",
+                "gemini-1.5-pro-latest",
+                "gemini-1.5-flash",
+                "gemini-1.5-pro",
+                "gemini-pro",
+            ]
 
-                def _try_generate(mname: str):
-                    gm = genai.GenerativeModel(mname)
-                    return gm.generate_content("ping")
+            last_err: Exception | None = None
 
-                # 404やメソッド非対応は次候補へフォールバック
-                for mname in candidate_models:
-                    try:
-                        await asyncio.to_thread(_try_generate, mname)
-                        return {"valid": True, "provider": provider, "model": mname, "message": "OK"}
-                    except Exception as e:  # noqa: BLE001
-                        msg = str(e).lower()
-                        last_err = e
-                        if "not found" in msg or "not supported" in msg or "404" in msg:
-                            continue
-                        # その他は即時エラー
-                        raise
+            def _try_generate(mname: str):
+                name = mname if mname.startswith("models/") else f"models/{mname}"
+                return generative_client.generate_content(
+                    model=name,
+                    contents=[glm.Content(parts=[glm.Part(text="ping")])],
+                )
 
-                # モデル一覧から generateContent 対応を探索
+            # 生成リクエストは課金対象のため候補を1件ずつ試行し、最初の成功で打ち切る
+            # 404やメソッド非対応は次候補へフォールバック
+            for mname in dict.fromkeys(candidate_models):
                 try:
-                    def _list_models():
-                        return list(genai.list_models())
-                    models = await asyncio.to_thread(_list_models)
-                    # プロパティ名はSDKにより差異がある可能性があるため両対応
-                    def _supports_generate_content(md) -> bool:
-                        methods = getattr(md, "supported_generation_methods", None) or getattr(md, "generation_methods", None) or []
-                        return "generateContent" in methods or "generate_content" in methods
-                    for md in models:
-                        if _supports_generate_content(md):
-                            try:
-                                await asyncio.to_thread(_try_generate, getattr(md, "name", str(md)))
-                                return {"valid": True, "provider": provider, "model": getattr(md, "name", "unknown"), "message": "OK"}
-                            except Exception:  # noqa: BLE001
-                                continue
-                except Exception:
-                    # 無視して最後のエラーを返却
-                    pass
+                    await asyncio.to_thread(_try_generate, mname)
+                    return {"valid": True, "provider": provider, "model": mname, "message": "OK"}
+                except Exception as e:  # noqa: BLE001
+                    msg = str(e).lower()
+                    last_err = e
+                    if "not found" in msg or "not supported" in msg or "404" in msg:
+                        continue
+                    # その他は即時エラー
+                    raise
 
-                # ここまで失敗
-                msg = str(last_err) if last_err else "対応するモデルが見つかりません"
-                return {"valid": False, "provider": provider, "model": model, "error_code": "model_not_found", "message": msg}
-            elif provider_l == "anthropic":
-                if AsyncAnthropic is None or httpx is None:
-                    return {"valid": False, "provider": provider, "model": model, "error_code": "sdk_unavailable", "message": "Anthropic SDKが利用できません"}
-                # httpxクライアントを明示的に作成してproxiesを除外
-                http_client = httpx.AsyncClient(timeout=10.0)
-                client = AsyncAnthropic(api_key=api_key, http_client=http_client)
-                try:
-                    # モデル名のエイリアスを解決（Anthropicは日付付モデルIDや -latest を要求）
-                    alias_map = {
-                        # Claude 3.5 系
-                        "claude-3-5-sonnet": "claude-3-5-sonnet-latest",
-                        "claude-3-5-haiku": "claude-3-5-haiku-latest",
-                        # Claude 3 系（2024日付版）
-                        "claude-3-opus": "claude-3-opus-20240229",
-                        "claude-3-sonnet": "claude-3-sonnet-20240229",
-                        "claude-3-haiku": "claude-3-haiku-20240307",
-                    }
-                    raw_model = (model or "claude-3-haiku-20240307").strip()
-                    key = raw_model.lower()
-                    test_model = alias_map.get(key, raw_model)
+            # モデル一覧から generateContent 対応を探索
+            try:
+                model_client = glm.ModelServiceClient(client_options=client_options)
+                def _list_models():
+                    return list(genai.list_models(client=model_client))
+                models = await asyncio.to_thread(_list_models)
+                # プロパティ名はSDKにより差異がある可能性があるため両対応
+                def _supports_generate_content(md) -> bool:
+                    methods = getattr(md, "supported_generation_methods", None) or getattr(md, "generation_methods", None) or []
+                    return "generateContent" in methods or "generate_content" in methods
+                for md in models:
+                    if _supports_generate_content(md):
+                        try:
+                            await asyncio.to_thread(_try_generate, getattr(md, "name", str(md)))
+                            return {"valid": True, "provider": provider, "model": getattr(md, "name", "unknown"), "message": "OK"}
+                        except Exception:  # noqa: BLE001
+                            continue
+            except Exception:
+                # 無視して最後のエラーを返却
+                pass
+
+            # ここまで失敗
+            msg = str(last_err) if last_err else "対応するモデルが見つかりません"
+            return {"valid": False, "provider": provider, "model": model, "error_code": "model_not_found", "message": msg}
+        finally:
+            for client in (generative_client, model_client):
+                if client is not None:
+                    try:
+                        client.transport.close()
+                    except Exception as e:  # noqa: BLE001
+                        logger.warning(f"Google検証クライアントのクローズに失敗: {str(e)}")
+    
+    async def _verify_anthropic(self, provider: str, api_key: str, model: str) -> Dict[str, Any]:
+        """
+        AnthropicのAPIキーを検証
+        
+        引数・戻り値は verify_api_key と同じ。分類が必要なエラーは例外として送出する
+        """
+        if AsyncAnthropic is None or httpx is None:
+            return {"valid": False, "provider": provider, "model": model, "error_code": "sdk_unavailable", "message": "Anthropic SDKが利用できません"}
+        client = _get_pooled_client("anthropic", api_key)
+        # モデル名のエイリアスを解決（Anthropicは日付付モデルIDや -latest を要求）
+        alias_map = {
+            # Claude 3.5 系
+            "claude-3-5-sonnet": "claude-3-5-sonnet-latest",
+            "claude-3-5-haiku": "claude-3-5-haiku-latest",
+            # Claude 3 系（2024日付版）
+            "claude-3-opus": "claude-3-opus-20240229",
+            "claude-3-sonnet": "claude-3-sonnet-20240229",
+            "claude-3-haiku": "claude-3-haiku-20240307",
+        }
+        raw_model = (model or "claude-3-haiku-20240307").strip()
+        key = raw_model.lower()
+        test_model = alias_map.get(key, raw_model)
+        try:
+            await client.messages.create(
+                model=test_model,
+                max_tokens=1,
+                messages=[{"role": "user", "content": "ping"}],
+            )
+            return {"valid": True, "provider": provider, "model": test_model, "message": "OK"}
+        except Exception as e:  # noqa: BLE001
+            # 404/モデル未提供時はフォールバック候補で再試行
+            ml = str(e).lower()
+            if ("not_found" in ml or "not found" in ml or "404" in ml) and ("model" in ml or "claude" in ml):
+                fallback_candidates = [
+                    # できれば3.5系を優先
+                    "claude-3-5-sonnet-latest",
+                    "claude-3-5-haiku-latest",
+                    # 安定の3系
+                    "claude-3-haiku-20240307",
+                    "claude-3-sonnet-20240229",
+                ]
+                for cand in fallback_candidates:
                     try:
                         await client.messages.create(
-                            model=test_model,
+                            model=cand,
                             max_tokens=1,
                             messages=[{"role": "user", "content": "ping"}],
                         )
-                        return {"valid": True, "provider": provider, "model": test_model, "message": "OK"}
-                    except Exception as e:  # noqa: BLE001
-                        # 404/モデル未提供時はフォールバック候補で再試行
-                        ml = str(e).lower()
-                        if ("not_found" in ml or "not found" in ml or "404" in ml) and ("model" in ml or "claude" in ml):
-                            fallback_candidates = [
-                                # できれば3.5系を優先
-                                "claude-3-5-sonnet-latest",
-                                "claude-3-5-haiku-latest",
-                                # 安定の3系
-                                "claude-3-haiku-20240307",
-                                "claude-3-sonnet-20240229",
-                            ]
-                            for cand in fallback_candidates:
-                                try:
-                                    await client.messages.create(
-                                        model=cand,
-                                        max_tokens=1,
-                                        messages=[{"role": "user", "content": "ping"}],
-                                    )
-                                    return {"valid": True, "provider": provider, "model": cand, "message": "OK (fallback)"}
-                                except Exception:  # noqa: BLE001
-                                    continue
-                            # フォールバック全滅なら元の例外を投げ直し → 上位で分類
-                            raise
-                        # その他のエラーはそのまま上位で分類
-                        raise
-                finally:
-                    await http_client.aclose()
-            else:
-                return {"valid": False, "provider": provider, "model": model, "error_code": "unsupported_provider", "message": "未サポートのプロバイダーです"}
-        except Exception as e:
-            # 代表的なエラーの文言を簡易マッピング
-            msg = str(e)
-            code = "unknown_error"
-            ml = msg.lower()
-            
-            # 残高不足エラーの検出（優先度: 高）
-            if "credit balance" in ml or "credit" in ml and ("too low" in ml or "insufficient" in ml):
-                code = "insufficient_credits"
-                # エラーメッセージから詳細を抽出
-                if "Your credit balance is too low" in msg:
-                    user_msg = "Anthropic APIの残高が不足しています。Plans & Billingでクレジットを追加してください。"
-                else:
-                    user_msg = "APIキーの残高が不足しています。"
-            elif "unauthorized" in ml or ("authentication" in ml and "failed" in ml):
-                code = "unauthorized"
-                user_msg = "APIキーが無効または認証に失敗しました。"
-            elif "rate" in ml and "limit" in ml:
-                code = "rate_limited"
-                user_msg = "レート制限に達しました。しばらく待ってから再試行してください。"
-            elif "timeout" in ml:
-                code = "timeout"
-                user_msg = "リクエストがタイムアウトしました。"
-            elif "invalid" in ml and "request" in ml:
-                code = "invalid_request"
-                user_msg = "無効なリクエストです。"
-            elif ("not_found" in ml or "not found" in ml or "404" in ml) and ("model" in ml or "claude" in ml):
-                code = "model_not_found"
-                user_msg = (
-                    "指定のAnthropicモデルが見つかりません。例: 'claude-3-5-sonnet-latest' や "
-                    "'claude-3-haiku-20240307' を使用してください。"
-                )
-            else:
-                user_msg = msg
-            
-            logger.error(f"APIキー検証エラー: provider={provider}, model={model}, error={msg}")
-            return {"valid": False, "provider": provider, "model": model, "error_code": code, "message": user_msg}
+                        return {"valid": True, "provider": provider, "model": cand, "message": "OK (fallback)"}
+                    except Exception:  # noqa: BLE001
+                        continue
+                # フォールバック全滅なら元の例外を投げ直し → 上位で分類
+                raise
+            # その他のエラーはそのまま上位で分類
+            raise
+    
+    # プロバイダー名（小文字）-> 検証メソッド
+    _VERIFIERS = {
+        "openai": _verify_openai,
+        "google": _verify_google,
+        "anthropic": _verify_anthropic,
+    }
+    
+    def _classify_verify_error(self, provider: str, model: str, e: Exception) -> Dict[str, Any]:
+        """
+        APIキー検証時の例外をエラーコードとユーザー向けメッセージに分類する
+        
+        引数:
+            provider: プロバイダー名
+            model: 検証対象モデル
+            e: 発生した例外
+        戻り値:
+            { valid: False, provider: str, model: str, error_code: str, message: str }
+        """
+        # 代表的なエラーの文言を簡易マッピング（ルールは上から順に評価）
+        msg = str(e)
+        ml = msg.lower()
+        code, user_msg = "unknown_error", msg
+        for alternatives, rule_code, rule_msg in _VERIFY_ERROR_RULES:
+            if any(all(term in ml for term in terms) for terms in alternatives):
+                code, user_msg = rule_code, rule_msg
+                break
+        
+        # Anthropicの残高不足は専用メッセージ
+        if code == "insufficient_credits" and "Your credit balance is too low" in msg:
+            user_msg = "Anthropic APIの残高が不足しています。Plans & Billingでクレジットを追加してください。"
+        
+        logger.error(f"APIキー検証エラー: provider={provider}, model={model}, error={msg}")
+        return {"valid": False, "provider": provider, "model": model, "error_code": code, "message": user_msg}
     
     def _encrypt_api_key(self, api_key: str) -> str:
         """
@@ -263,15 +531,40 @@ class ApiKeyService:
             str: 暗号化されたAPIキー
         """
         try:
-            encrypted = self.cipher.encrypt(api_key.encode())
-            return base64.urlsafe_b64encode(encrypted).decode()
+            # 形式: base64(nonce(12バイト) + 暗号文 + 認証タグ)
+            nonce = os.urandom(_AESGCM_NONCE_SIZE)
+            encrypted = self._aead.encrypt(nonce, api_key.encode(), None)
+            return _b64url_encode(nonce + encrypted)
         except Exception as e:
             logger.error(f"APIキー暗号化エラー: {str(e)}")
             raise BusinessLogicError("APIキーの暗号化に失敗しました")
     
     def _decrypt_api_key(self, encrypted_api_key: str) -> str:
         """
-        APIキーを復号化
+        APIキーを復号化（暗号文単位でキャッシュ）
+        
+        引数:
+            encrypted_api_key: 暗号化されたAPIキー
+        戻り値:
+            str: 平文のAPIキー
+        """
+        now = time.monotonic()
+        cached = _decrypt_cache.get(encrypted_api_key)
+        if cached is not None:
+            if cached[0] > now:
+                _decrypt_cache.move_to_end(encrypted_api_key)
+                return cached[1]
+            del _decrypt_cache[encrypted_api_key]
+        
+        plaintext = self._decrypt_api_key_uncached(encrypted_api_key)
+        _decrypt_cache[encrypted_api_key] = (now + _DECRYPT_CACHE_TTL_SECONDS, plaintext)
+        if len(_decrypt_cache) > _DECRYPT_CACHE_MAX_SIZE:
+            _decrypt_cache.popitem(last=False)
+        return plaintext
+    
+    def _decrypt_api_key_uncached(self, encrypted_api_key: str) -> str:
+        """
+        APIキーを復号化（キャッシュを使用しない）
         
         引数:
             encrypted_api_key: 暗号化されたAPIキー
@@ -279,8 +572,15 @@ class ApiKeyService:
             str: 平文のAPIキー
         """
         try:
-            encrypted_bytes = base64.urlsafe_b64decode(encrypted_api_key.encode())
-            decrypted = self.cipher.decrypt(encrypted_bytes)
+            encrypted_bytes = _b64url_decode(encrypted_api_key)
+            # 旧形式（Fernetトークンをさらにbase64化したもの）はFernetで復号化
+            if encrypted_bytes.startswith(_FERNET_TOKEN_PREFIX):
+                try:
+                    return self.cipher.decrypt(encrypted_bytes).decode()
+                except InvalidToken:
+                    pass
+            nonce = encrypted_bytes[:_AESGCM_NONCE_SIZE]
+            decrypted = self._aead.decrypt(nonce, encrypted_bytes[_AESGCM_NONCE_SIZE:], None)
             return decrypted.decode()
         except Exception as e:
             logger.error(f"APIキー復号化エラー: {str(e)}")
@@ -290,173 +590,36 @@ class ApiKeyService:
         """
         APIキー作成
         
+        同一テナント・プロバイダー・モデルの有効なキーの重複は、部分ユニークインデックスと
+        ON CONFLICT DO NOTHING により同時実行時も含めてDB側で防ぎます。
+        
         引数:
             tenant_id: テナントID
             api_key_data: APIキー作成データ
         戻り値:
             ApiKey: 作成されたAPIキー
+        例外:
+            BusinessLogicError: 同じプロバイダー・モデルの有効なAPIキーが既に登録されている場合
         """
         try:
-            # 既存のAPIキーをチェック（同じプロバイダー + 同じモデル + is_active = true）
-            # model/model_nameカラムが存在しない可能性があるため、まずカラムの存在をチェック
-            check_columns_query = text("""
-                SELECT column_name 
-                FROM information_schema.columns 
-                WHERE table_name = 'api_keys' 
-                AND column_name IN ('model', 'model_name')
-            """)
-            columns_check = await self.db.execute(check_columns_query)
-            existing_columns = {row[0] for row in columns_check.fetchall()}
-            has_model = 'model' in existing_columns
-            has_model_name = 'model_name' in existing_columns
-            
-            # カラムに応じて重複チェッククエリを構築
-            if has_model and has_model_name:
-                # 両方のカラムが存在する場合、modelを優先
-                existing_query = text("""
-                    SELECT id FROM api_keys 
-                    WHERE tenant_id = :tid 
-                    AND provider = :provider 
-                    AND model = :model
-                    AND is_active = true
-                    LIMIT 1
-                """)
-                params = {"tid": tenant_id, "provider": api_key_data.provider, "model": api_key_data.model}
-            elif has_model:
-                # modelのみ存在する場合
-                existing_query = text("""
-                    SELECT id FROM api_keys 
-                    WHERE tenant_id = :tid 
-                    AND provider = :provider 
-                    AND model = :model
-                    AND is_active = true
-                    LIMIT 1
-                """)
-                params = {"tid": tenant_id, "provider": api_key_data.provider, "model": api_key_data.model}
-            elif has_model_name:
-                # model_nameのみ存在する場合
-                existing_query = text("""
-                    SELECT id FROM api_keys 
-                    WHERE tenant_id = :tid 
-                    AND provider = :provider 
-                    AND model_name = :model
-                    AND is_active = true
-                    LIMIT 1
-                """)
-                params = {"tid": tenant_id, "provider": api_key_data.provider, "model": api_key_data.model}
-            else:
-                # どちらも存在しない場合、プロバイダーのみでチェック
-                existing_query = text("""
-                    SELECT id FROM api_keys 
-                    WHERE tenant_id = :tid 
-                    AND provider = :provider 
-                    AND is_active = true
-                    LIMIT 1
-                """)
-                params = {"tid": tenant_id, "provider": api_key_data.provider}
-            
-            result = await self.db.execute(existing_query, params)
-            existing_row = result.first()
-            
-            if existing_row:
-                raise BusinessLogicError(f"プロバイダー {api_key_data.provider} のモデル {api_key_data.model} のAPIキーは既に登録されています")
-            
             # APIキーを暗号化
             encrypted_api_key = self._encrypt_api_key(api_key_data.api_key)
             
-            # APIキー作成
-            # model/model_nameカラムが存在しない可能性があるため、まずカラムの存在をチェック
-            check_columns_query = text("""
-                SELECT column_name 
-                FROM information_schema.columns 
-                WHERE table_name = 'api_keys' 
-                AND column_name IN ('model', 'model_name')
-            """)
-            columns_check = await self.db.execute(check_columns_query)
-            existing_columns = {row[0] for row in columns_check.fetchall()}
-            has_model = 'model' in existing_columns
-            has_model_name = 'model_name' in existing_columns
-            
-            # カラムに応じてINSERT文を構築
-            if has_model and has_model_name:
-                # 両方のカラムが存在する場合
-                insert_query = text("""
-                    INSERT INTO api_keys (tenant_id, provider, api_key, model, model_name, is_active, created_at, updated_at)
-                    VALUES (:tid, :provider, :api_key, :model, :model, true, NOW(), NOW())
-                    RETURNING id, tenant_id, provider, api_key, model, model_name, is_active, created_at, updated_at
-                """)
-                params = {
-                    "tid": tenant_id,
-                    "provider": api_key_data.provider,
-                    "api_key": encrypted_api_key,
-                    "model": api_key_data.model
-                }
-            elif has_model:
-                # modelのみ存在する場合
-                insert_query = text("""
-                    INSERT INTO api_keys (tenant_id, provider, api_key, model, is_active, created_at, updated_at)
-                    VALUES (:tid, :provider, :api_key, :model, true, NOW(), NOW())
-                    RETURNING id, tenant_id, provider, api_key, model, is_active, created_at, updated_at
-                """)
-                params = {
-                    "tid": tenant_id,
-                    "provider": api_key_data.provider,
-                    "api_key": encrypted_api_key,
-                    "model": api_key_data.model
-                }
-            elif has_model_name:
-                # model_nameのみ存在する場合
-                insert_query = text("""
-                    INSERT INTO api_keys (tenant_id, provider, api_key, model_name, is_active, created_at, updated_at)
-                    VALUES (:tid, :provider, :api_key, :model_name, true, NOW(), NOW())
-                    RETURNING id, tenant_id, provider, api_key, model_name, is_active, created_at, updated_at
-                """)
-                params = {
-                    "tid": tenant_id,
-                    "provider": api_key_data.provider,
-                    "api_key": encrypted_api_key,
-                    "model_name": api_key_data.model
-                }
-            else:
-                # どちらも存在しない場合
-                insert_query = text("""
-                    INSERT INTO api_keys (tenant_id, provider, api_key, is_active, created_at, updated_at)
-                    VALUES (:tid, :provider, :api_key, true, NOW(), NOW())
-                    RETURNING id, tenant_id, provider, api_key, is_active, created_at, updated_at
-                """)
-                params = {
-                    "tid": tenant_id,
-                    "provider": api_key_data.provider,
-                    "api_key": encrypted_api_key
-                }
-            
-            result = await self.db.execute(insert_query, params)
+            # 重複チェック（同じプロバイダー + 同じモデル + is_active = true）とINSERTを1回のクエリで実行
+            # 既存のAPIキーがある場合は行が返らない
+            result = await self.db.execute(_INSERT_STMT, {
+                "tid": tenant_id,
+                "provider": api_key_data.provider,
+                "api_key": encrypted_api_key,
+                "model": api_key_data.model,
+            })
             
             row_mapping = result.mappings().first()
             
-            # 結果からApiKeyオブジェクトを作成
             if not row_mapping:
-                raise BusinessLogicError("APIキーの作成に失敗しました")
-            
-            # model値の取得（model_nameが存在する場合はそれを使用、なければmodel、なければapi_key_data.model）
-            model_value = None
-            if 'model' in row_mapping:
-                model_value = row_mapping['model']
-            elif 'model_name' in row_mapping:
-                model_value = row_mapping['model_name']
-            else:
-                model_value = api_key_data.model  # メモリ上のみ保持
+                raise BusinessLogicError(f"プロバイダー {api_key_data.provider} のモデル {api_key_data.model} のAPIキーは既に登録されています")
             
-            db_api_key = ApiKey(
-                id=row_mapping['id'],
-                tenant_id=row_mapping['tenant_id'],
-                provider=row_mapping['provider'],
-                api_key=row_mapping['api_key'],
-                model_name=model_value,
-                is_active=row_mapping['is_active'],
-                created_at=row_mapping['created_at'],
-                updated_at=row_mapping['updated_at']
-            )
+            db_api_key = self._row_to_api_key(row_mapping)
             
             await self.db.commit()
             
@@ -474,6 +637,27 @@ class ApiKeyService:
             logger.error(f"APIキー作成エラー: {str(e)}")
             raise
     
+    @staticmethod
+    def _row_to_api_key(row) -> ApiKey:
+        """
+        api_keysテーブルの行（RowMapping）からApiKeyオブジェクトを構築
+        
+        引数:
+            row: _API_KEY_COLUMNS を取得したSELECT/RETURNINGの結果行
+        戻り値:
+            ApiKey: セッションに紐づかないApiKeyオブジェクト
+        """
+        return ApiKey(
+            id=row['id'],
+            tenant_id=row['tenant_id'],
+            provider=row['provider'],
+            api_key=row['api_key'],
+            model_name=row['model_name'] or "",
+            is_active=bool(row['is_active']),  # is_activeはNULL許容のためboolに正規化
+            created_at=row['created_at'],
+            updated_at=row['updated_at']
+        )
+    
     async def get_api_key(self, api_key_id: str, tenant_id: str) -> Optional[ApiKey]:
         """
         APIキー取得
@@ -485,50 +669,8 @@ class ApiKeyService:
             Optional[ApiKey]: APIキー情報（存在しない場合はNone）
         """
         try:
-            # model/model_nameカラムの存在をチェック
-            check_columns_query = text("""
-                SELECT column_name 
-                FROM information_schema.columns 
-                WHERE table_name = 'api_keys' 
-                AND column_name IN ('model', 'model_name')
-            """)
-            columns_check = await self.db.execute(check_columns_query)
-            existing_columns = {row[0] for row in columns_check.fetchall()}
-            has_model = 'model' in existing_columns
-            has_model_name = 'model_name' in existing_columns
-            
-            # カラムに応じてSELECT文を構築
-            if has_model and has_model_name:
-                # 両方のカラムが存在する場合、modelを優先
-                select_query = text("""
-                    SELECT id, tenant_id, provider, api_key, model, model_name, is_active, created_at, updated_at
-                    FROM api_keys
-                    WHERE id = :api_key_id AND tenant_id = :tid
-                """)
-            elif has_model:
-                # modelのみ存在する場合
-                select_query = text("""
-                    SELECT id, tenant_id, provider, api_key, model, is_active, created_at, updated_at
-                    FROM api_keys
-                    WHERE id = :api_key_id AND tenant_id = :tid
-                """)
-            elif has_model_name:
-                # model_nameのみ存在する場合
-                select_query = text("""
-                    SELECT id, tenant_id, provider, api_key, model_name, is_active, created_at, updated_at
-                    FROM api_keys
-                    WHERE id = :api_key_id AND tenant_id = :tid
-                """)
-            else:
-                # どちらも存在しない場合
-                select_query = text("""
-                    SELECT id, tenant_id, provider, api_key, is_active, created_at, updated_at
-                    FROM api_keys
-                    WHERE id = :api_key_id AND tenant_id = :tid
-                """)
-            
             result = await self.db.execute(
-                select_query,
+                _SELECT_BY_ID_STMT,
                 {"api_key_id": api_key_id, "tid": tenant_id}
             )
             row = result.mappings().first()
@@ -536,27 +678,7 @@ class ApiKeyService:
             if not row:
                 return None
             
-            # ApiKeyオブジェクトを構築
-            # モデル値の取得（modelを優先、なければmodel_name、なければ空文字列）
-            model_value = ""
-            if 'model' in row:
-                model_value = row['model'] or ""
-            elif 'model_name' in row:
-                model_value = row['model_name'] or ""
-            
-            # ApiKeyオブジェクトを作成
-            api_key = ApiKey(
-                id=row['id'],
-                tenant_id=row['tenant_id'],
-                provider=row['provider'],
-                api_key=row['api_key'],
-                model_name=model_value,  # カラムが存在しない場合は空文字列
-                is_active=bool(row['is_active']),
-                created_at=row['created_at'],
-                updated_at=row['updated_at']
-            )
-            
-            return api_key
+            return self._row_to_api_key(row)
             
         except Exception as e:
             logger.error(f"APIキー取得エラー: {str(e)}")
@@ -596,23 +718,6 @@ class ApiKeyService:
             Optional[ApiKey]: 更新されたAPIキー（存在しない場合はNone）
         """
         try:
-            # まずAPIキーの存在確認
-            api_key = await self.get_api_key(api_key_id, tenant_id)
-            if not api_key:
-                return None
-            
-            # model/model_nameカラムの存在をチェック
-            check_columns_query = text("""
-                SELECT column_name 
-                FROM information_schema.columns 
-                WHERE table_name = 'api_keys' 
-                AND column_name IN ('model', 'model_name')
-            """)
-            columns_check = await self.db.execute(check_columns_query)
-            existing_columns = {row[0] for row in columns_check.fetchall()}
-            has_model = 'model' in existing_columns
-            has_model_name = 'model_name' in existing_columns
-            
             # 更新フィールドを構築
             update_fields = []
             params = {"api_key_id": api_key_id, "tid": tenant_id}
@@ -623,31 +728,32 @@ class ApiKeyService:
                 params["api_key"] = encrypted_api_key
             
             if update_data.model is not None:
-                if has_model:
-                    update_fields.append("model = :model")
-                    params["model"] = update_data.model
-                elif has_model_name:
-                    update_fields.append("model_name = :model")
-                    params["model"] = update_data.model
-                # どちらも存在しない場合は何もしない
+                update_fields.append("model_name = :model")
+                params["model"] = update_data.model
             
             if update_data.is_active is not None:
                 update_fields.append("is_active = :is_active")
                 params["is_active"] = update_data.is_active
             
-            # 更新フィールドがある場合のみUPDATEを実行
-            if update_fields:
-                update_fields.append("updated_at = NOW()")
-                update_query = text(f"""
-                    UPDATE api_keys 
-                    SET {', '.join(update_fields)}
-                    WHERE id = :api_key_id AND tenant_id = :tid
-                """)
-                await self.db.execute(update_query, params)
+            # 更新フィールドがない場合は現在の値を返す
+            if not update_fields:
+                return await self.get_api_key(api_key_id, tenant_id)
+            
+            # UPDATEと更新後の値の取得を1回のクエリで実行（対象がない場合は行が返らない）
+            update_fields.append("updated_at = NOW()")
+            update_query = text(f"""
+                UPDATE api_keys 
+                SET {', '.join(update_fields)}
+                WHERE id = :api_key_id AND tenant_id = :tid
+                RETURNING {_API_KEY_COLUMNS}
+            """)
+            result = await self.db.execute(update_query, params)
+            row = result.mappings().first()
             await self.db.commit()
             
-            # 更新後に再度取得して返す
-            updated_api_key = await self.get_api_key(api_key_id, tenant_id)
+            if not row:
+                return None
+            updated_api_key = self._row_to_api_key(row)
             
             BusinessLogger.log_tenant_action(
                 tenant_id,
@@ -658,6 +764,11 @@ class ApiKeyService:
             logger.info(f"APIキー更新完了: tenant={tenant_id}, api_key_id={api_key_id}")
             return updated_api_key
             
+        except IntegrityError as e:
+            # 部分ユニークインデックス（同一テナント・プロバイダー・モデルの有効キーは1件）に違反
+            await self.db.rollback()
+            logger.warning(f"APIキー更新の重複: tenant={tenant_id}, api_key_id={api_key_id}, error={str(e)}")
+            raise BusinessLogicError("同じプロバイダー・モデルの有効なAPIキーは既に登録されています") from e
         except Exception as e:
             await self.db.rollback()
             logger.error(f"APIキー更新エラー: {str(e)}")
@@ -674,30 +785,25 @@ class ApiKeyService:
             bool: 削除成功時True
         """
         try:
-            # APIキー取得（存在確認用）
-            api_key = await self.get_api_key(api_key_id, tenant_id)
-            if not api_key:
-                return False
-            
-            # 生SQLでDELETEを実行（get_api_keyで作成したオブジェクトはセッションに紐づいていないため）
-            delete_query = text("""
-                DELETE FROM api_keys
-                WHERE id = :api_key_id AND tenant_id = :tid
-            """)
+            # DELETEと削除対象の取得を1回のクエリで実行
             result = await self.db.execute(
-                delete_query,
+                _DELETE_STMT,
                 {"api_key_id": api_key_id, "tid": tenant_id}
             )
+            deleted = result.mappings().first()
             await self.db.commit()
             
-            # 削除された行数が0の場合はFalseを返す
-            if result.rowcount == 0:
+            # 削除対象がない場合はFalseを返す
+            if not deleted:
                 return False
             
+            # 復号化キャッシュから削除
+            _decrypt_cache.pop(deleted['api_key'], None)
+            
             BusinessLogger.log_tenant_action(
                 tenant_id,
                 "delete_api_key",
-                {"api_key_id": api_key_id, "provider": api_key.provider}
+                {"api_key_id": api_key_id, "provider": deleted['provider']}
             )
             
             logger.info(f"APIキー削除完了: tenant={tenant_id}, api_key_id={api_key_id}")
@@ -719,54 +825,8 @@ class ApiKeyService:
             Optional[ApiKey]: アクティブなAPIキー（存在しない場合はNone）
         """
         try:
-            # model/model_nameカラムの存在をチェック
-            check_columns_query = text("""
-                SELECT column_name 
-                FROM information_schema.columns 
-                WHERE table_name = 'api_keys' 
-                AND column_name IN ('model', 'model_name')
-            """)
-            columns_check = await self.db.execute(check_columns_query)
-            existing_columns = {row[0] for row in columns_check.fetchall()}
-            has_model = 'model' in existing_columns
-            has_model_name = 'model_name' in existing_columns
-            
-            # カラムに応じてSELECT文を構築
-            if has_model and has_model_name:
-                # 両方のカラムが存在する場合、modelを優先
-                select_query = text("""
-                    SELECT id, tenant_id, provider, api_key, model, model_name, is_active, created_at, updated_at
-                    FROM api_keys
-                    WHERE tenant_id = :tid AND provider = :provider AND is_active = true
-                    LIMIT 1
-                """)
-            elif has_model:
-                # modelのみ存在する場合
-                select_query = text("""
-                    SELECT id, tenant_id, provider, api_key, model, is_active, created_at, updated_at
-                    FROM api_keys
-                    WHERE tenant_id = :tid AND provider = :provider AND is_active = true
-                    LIMIT 1
-                """)
-            elif has_model_name:
-                # model_nameのみ存在する場合
-                select_query = text("""
-                    SELECT id, tenant_id, provider, api_key, model_name, is_active, created_at, updated_at
-                    FROM api_keys
-                    WHERE tenant_id = :tid AND provider = :provider AND is_active = true
-                    LIMIT 1
-                """)
-            else:
-                # どちらも存在しない場合
-                select_query = text("""
-                    SELECT id, tenant_id, provider, api_key, is_active, created_at, updated_at
-                    FROM api_keys
-                    WHERE tenant_id = :tid AND provider = :provider AND is_active = true
-                    LIMIT 1
-                """)
-            
             result = await self.db.execute(
-                select_query,
+                _SELECT_ACTIVE_BY_PROVIDER_STMT,
                 {"tid": tenant_id, "provider": provider}
             )
             row = result.mappings().first()
@@ -774,25 +834,7 @@ class ApiKeyService:
             if not row:
                 return None
             
-            # 結果をApiKeyオブジェクトに変換
-            # カラム名の違いを吸収（model_name → model）
-            api_key_dict = dict(row)
-            if 'model_name' in api_key_dict and 'model' not in api_key_dict:
-                api_key_dict['model'] = api_key_dict.pop('model_name')
-            
-            # ApiKeyオブジェクトを作成（モデルに存在しないカラムはNoneに設定）
-            api_key_obj = ApiKey(
-                id=api_key_dict['id'],
-                tenant_id=api_key_dict['tenant_id'],
-                provider=api_key_dict['provider'],
-                api_key=api_key_dict['api_key'],
-                model_name=api_key_dict.get('model_name', api_key_dict.get('model', '')),
-                is_active=api_key_dict['is_active'],
-                created_at=api_key_dict['created_at'],
-                updated_at=api_key_dict['updated_at']
-            )
-            
-            return api_key_obj
+            return self._row_to_api_key(row)
             
         except Exception as e:
             logger.error(f"プロバイダー別APIキー取得エラー: {str(e)}")
@@ -6,14 +6,16 @@
 
 主な機能:
 - 監査ログの作成
+- 監査ログのキュー投入とバッチ書き込み
 - IPアドレスとUser-Agentの取得
 - テナント分離
 """
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from typing import Optional, Dict, Any
+from sqlalchemy import select, insert
+from typing import Optional, Dict, Any, List, Union
 from uuid import UUID
+import asyncio
 import uuid
 from fastapi import Request
 
@@ -22,6 +24,126 @@ from app.utils.logging import logger
 from app.utils.common import DateTimeUtils
 
 
+def _as_uuid(value: Union[str, UUID, None]) -> Optional[UUID]:
+    """
+    IDをUUIDに変換（UUIDオブジェクトはそのまま返し、文字列のみ解析する）
+    
+    引数:
+        value: UUIDまたはUUID文字列
+    戻り値:
+        Optional[UUID]: UUID（値がない場合はNone）
+    例外:
+        ValueError: UUID形式でない文字列の場合
+    """
+    if not value:
+        return None
+    if isinstance(value, UUID):
+        return value
+    return UUID(value)
+
+
+# 監査ログの書き込みキュー
+# リクエスト処理から監査ログのINSERT/COMMITを切り離し、バックグラウンドでまとめて書き込む
+# キューが満杯の場合は呼び出し側で直接書き込む（監査ログを欠落させない）
+_AUDIT_QUEUE_MAX_SIZE = 10000
+_AUDIT_BATCH_SIZE = 256
+_AUDIT_FLUSH_INTERVAL_SECONDS = 0.05
+_audit_queue: "Optional[asyncio.Queue[Dict[str, Any]]]" = None
+_audit_flusher_task: Optional[asyncio.Task] = None
+
+
+def _ensure_audit_flusher() -> "asyncio.Queue[Dict[str, Any]]":
+    """
+    実行中のイベントループ上に監査ログのキューと書き込みタスクを用意する
+    
+    戻り値:
+        asyncio.Queue: 監査ログ行のキュー
+    例外:
+        RuntimeError: 実行中のイベントループがない場合
+    """
+    global _audit_queue, _audit_flusher_task
+    loop = asyncio.get_running_loop()
+    if _audit_flusher_task is None or _audit_flusher_task.done() or _audit_flusher_task.get_loop() is not loop:
+        _audit_queue = asyncio.Queue(maxsize=_AUDIT_QUEUE_MAX_SIZE)
+        _audit_flusher_task = loop.create_task(_audit_flusher(_audit_queue))
+    return _audit_queue
+
+
+async def _audit_flusher(queue: "asyncio.Queue[Dict[str, Any]]") -> None:
+    """
+    キューから監査ログを取り出し、最大 _AUDIT_BATCH_SIZE 件または
+    _AUDIT_FLUSH_INTERVAL_SECONDS 秒ごとに1回のINSERTでまとめて書き込む
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        rows = [await queue.get()]
+        deadline = loop.time() + _AUDIT_FLUSH_INTERVAL_SECONDS
+        while len(rows) < _AUDIT_BATCH_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                rows.append(await asyncio.wait_for(queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        try:
+            await _write_audit_rows(rows)
+        finally:
+            for _ in rows:
+                queue.task_done()
+
+
+async def _write_audit_rows(rows: List[Dict[str, Any]]) -> None:
+    """
+    監査ログ行をまとめて書き込む
+    
+    一括INSERTに失敗した場合は1件ずつ書き込み、不正な行以外は保存する。
+    
+    引数:
+        rows: 監査ログ行のリスト
+    """
+    from app.core.database import AsyncSessionLocal
+    
+    try:
+        async with AsyncSessionLocal() as db:
+            await AuditLogService(db).create_audit_logs(rows)
+        return
+    except Exception as e:
+        logger.warning(f"監査ログの一括書き込みに失敗したため1件ずつ書き込みます: count={len(rows)}, error={str(e)}")
+    
+    for row in rows:
+        try:
+            async with AsyncSessionLocal() as db:
+                await AuditLogService(db).create_audit_logs([row])
+        except Exception as e:
+            logger.error(
+                f"監査ログの作成に失敗: action={row.get('action')}, resource_type={row.get('resource_type')}, "
+                f"tenant_id={row.get('tenant_id')}, error={str(e)}",
+                exc_info=True
+            )
+
+
+async def flush_audit_logs(timeout: float = 10.0) -> None:
+    """
+    キューに残っている監査ログの書き込みを待ち、書き込みタスクを停止する（シャットダウン時に使用）
+    
+    引数:
+        timeout: 書き込み完了を待つ最大秒数
+    """
+    global _audit_queue, _audit_flusher_task
+    task, queue = _audit_flusher_task, _audit_queue
+    _audit_flusher_task = _audit_queue = None
+    if task is None or queue is None:
+        return
+    if not task.done():
+        try:
+            await asyncio.wait_for(queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"監査ログの書き込みが時間内に完了しませんでした: 残り{queue.qsize()}件")
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+
 class AuditLogService:
     """
     監査ログサービス
@@ -59,16 +181,17 @@ class AuditLogService:
         if not request:
             return "0.0.0.0"
         
+        headers = request.headers
         # X-Forwarded-Forヘッダーを確認（プロキシ経由の場合）
-        forwarded_for = request.headers.get("X-Forwarded-For")
+        forwarded_for = headers.get("X-Forwarded-For")
         if forwarded_for:
-            # カンマ区切りの場合は最初のIPを使用
-            ip = forwarded_for.split(",")[0].strip()
+            # カンマ区切りの場合は最初のIPを使用（全要素のリストは作らない）
+            ip = forwarded_for.partition(",")[0].strip()
             if ip:
                 return ip
         
         # X-Real-IPヘッダーを確認
-        real_ip = request.headers.get("X-Real-IP")
+        real_ip = headers.get("X-Real-IP")
         if real_ip:
             return real_ip
         
@@ -94,13 +217,78 @@ class AuditLogService:
         
         return request.headers.get("User-Agent")
     
+    @classmethod
+    def enqueue_audit_log(
+        cls,
+        tenant_id: Union[str, UUID],
+        action: str,
+        resource_type: str,
+        user_id: Union[str, UUID, None] = None,
+        resource_id: Union[str, UUID, None] = None,
+        request: Optional[Request] = None,
+        details: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """
+        監査ログを書き込みキューに追加（書き込みはバックグラウンドでまとめて実行）
+        
+        引数は create_audit_log と同じ。
+        
+        戻り値:
+            bool: キューに追加できた場合True。キューが満杯、または実行中のイベントループがない場合False
+                  （呼び出し側で create_audit_log により直接書き込む）
+        例外:
+            ValueError: IDがUUID形式でない場合
+        """
+        row = {
+            "id": uuid.uuid4(),
+            "tenant_id": _as_uuid(tenant_id),
+            "user_id": _as_uuid(user_id),
+            "action": action,
+            "resource_type": resource_type,
+            "resource_id": _as_uuid(resource_id),
+            "ip_address": cls.get_client_ip(request),
+            "user_agent": cls.get_user_agent(request),
+            "details": details or {},
+            # キュー滞留分の遅延が記録日時に入らないよう、発生時刻を設定
+            "created_at": DateTimeUtils.now(),
+        }
+        try:
+            queue = _ensure_audit_flusher()
+            queue.put_nowait(row)
+            return True
+        except (RuntimeError, asyncio.QueueFull):
+            return False
+    
+    async def create_audit_logs(self, entries: List[Dict[str, Any]]) -> None:
+        """
+        複数の監査ログを1回のINSERT（executemany）と1回のコミットで作成
+        
+        1つの処理で複数の監査イベントを記録する場合に使用します。
+        
+        引数:
+            entries: 監査ログ行のリスト（AuditLogのカラム名をキーとする辞書。
+                     idを省略した場合は生成し、created_atを省略した場合はDB側の既定値を使用）
+        
+        例外:
+            Exception: データベース操作エラー（ロールバックして再送出）
+        """
+        if not entries:
+            return
+        rows = [entry if "id" in entry else {**entry, "id": uuid.uuid4()} for entry in entries]
+        try:
+            await self.db.execute(insert(AuditLog), rows)
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            raise
+    
     async def create_audit_log(
         self,
-        tenant_id: str,
+        tenant_id: Union[str, UUID],
         action: str,
         resource_type: str,
-        user_id: Optional[str] = None,
-        resource_id: Optional[str] = None,
+        user_id: Union[str, UUID, None] = None,
+        resource_id: Union[str, UUID, None] = None,
         request: Optional[Request] = None,
         details: Optional[Dict[str, Any]] = None
     ) -> AuditLog:
@@ -110,11 +298,11 @@ class AuditLogService:
         システム操作の監査記録をデータベースに保存します。
         
         引数:
-            tenant_id: テナントID（必須）
+            tenant_id: テナントID（必須。UUIDまたはUUID文字列）
             action: アクション名（例: "login", "create_user"）
             resource_type: リソースタイプ（例: "user", "content", "tenant"）
-            user_id: ユーザーID（オプション）
-            resource_id: リソースID（オプション）
+            user_id: ユーザーID（オプション。UUIDまたはUUID文字列）
+            resource_id: リソースID（オプション。UUIDまたはUUID文字列）
             request: FastAPIのRequestオブジェクト（IPアドレスとUser-Agent取得用）
             details: 追加の詳細情報（JSON形式）
         
@@ -130,9 +318,9 @@ class AuditLogService:
             user_agent = self.get_user_agent(request)
             
             # UUIDに変換
-            tenant_uuid = UUID(tenant_id) if tenant_id else None
-            user_uuid = UUID(user_id) if user_id else None
-            resource_uuid = UUID(resource_id) if resource_id else None
+            tenant_uuid = _as_uuid(tenant_id)
+            user_uuid = _as_uuid(user_id)
+            resource_uuid = _as_uuid(resource_id)
             
             # 監査ログオブジェクトを作成
             audit_log = AuditLog(
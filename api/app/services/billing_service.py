@@ -17,7 +17,8 @@ import uuid
 from app.core.config import settings
 from app.utils.logging import BusinessLogger, ErrorLogger, logger
 from app.models.billing import BillingInfo, Invoice
-from sqlalchemy import select
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 
 class BillingService:
@@ -55,10 +56,19 @@ class BillingService:
         info = result.scalar_one_or_none()
         if info:
             return info
-        info = BillingInfo(id=uuid.uuid4(), tenant_id=tenant_uuid, billing_email=billing_email or "")
-        self.db.add(info)
+        # 同時の初回アクセスで重複作成しないよう、tenant_idの一意制約で競合した場合は何もしない
+        result = await self.db.execute(
+            pg_insert(BillingInfo)
+            .values(id=uuid.uuid4(), tenant_id=tenant_uuid, billing_email=billing_email or "")
+            .on_conflict_do_nothing(index_elements=[BillingInfo.tenant_id])
+            .returning(BillingInfo)
+        )
+        info = result.scalar_one_or_none()
         await self.db.commit()
-        await self.db.refresh(info)
+        if info is None:
+            # 他のリクエストが先に作成した場合は作成済みの行を返す
+            result = await self.db.execute(select(BillingInfo).where(BillingInfo.tenant_id == tenant_uuid))
+            return result.scalar_one()
         logger.info(f"BillingInfo作成: tenant={tenant_id}")
         return info
 
@@ -72,12 +82,20 @@ class BillingService:
         戻り値:
             なし
         """
-        result = await self.db.execute(select(BillingInfo).where(BillingInfo.tenant_id == tenant_id))
-        info = result.scalar_one_or_none()
-        if not info:
+        from uuid import UUID as UUIDType
+        tenant_uuid = UUIDType(tenant_id) if isinstance(tenant_id, str) else tenant_id
+        if data:
+            # 存在確認と更新を1回のUPDATE ... RETURNINGで行う
+            result = await self.db.execute(
+                update(BillingInfo)
+                .where(BillingInfo.tenant_id == tenant_uuid)
+                .values(**data)
+                .returning(BillingInfo.id)
+            )
+        else:
+            result = await self.db.execute(select(BillingInfo.id).where(BillingInfo.tenant_id == tenant_uuid))
+        if result.first() is None:
             raise ValueError("billing_infoが存在しません")
-        for k, v in data.items():
-            setattr(info, k, v)
         await self.db.commit()
         logger.info(f"課金情報更新: tenant={tenant_id}, fields={list(data.keys())}")
 
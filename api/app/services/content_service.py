@@ -14,26 +14,322 @@
 """
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, or_
-from sqlalchemy.orm import selectinload
-from typing import Optional, List, Dict, Any
-from datetime import datetime
+from sqlalchemy import select, func, and_, or_, tuple_, bindparam, literal_column, literal, true
+from sqlalchemy.orm import selectinload, defer
+from typing import Optional, List, Dict, Any, Tuple
+from datetime import datetime, timedelta
 import uuid
 import base64
+import httpx
 from app.models.file import File, FileType, FileStatus
 from app.models.chunk import Chunk
 from app.schemas.content import (
     ContentCreate, ContentUpdate, ContentSearchParams,
     ContentSearchResult, ChunkCreate, ChunkUpdate
 )
-from app.utils.common import StringUtils, ValidationUtils, FileUtils, DateTimeUtils
+from app.utils.common import StringUtils, ValidationUtils, FileUtils, DateTimeUtils, HTTP2_AVAILABLE
 from app.utils.logging import BusinessLogger, ErrorLogger, logger
 from app.services.storage_service import StorageServiceFactory
 from app.core.database import AsyncSessionLocal
 import asyncio
+import time
 from app.core.exceptions import ConflictError
 from app.services.tenant_service import TenantService
-from sqlalchemy import delete
+from sqlalchemy import delete, update
+
+
+# 頻繁に実行するクエリはモジュール読み込み時に一度だけ構築し、bindparamで値を渡す
+# （リクエスト毎の構築を省き、SQLAlchemyのコンパイルキャッシュを確実に再利用する）
+_SELECT_FILE_BY_ID = select(File).where(
+    and_(
+        File.id == bindparam("content_id"),
+        File.tenant_id == bindparam("tenant_id"),
+        File.deleted_at.is_(None)
+    )
+)
+_SELECT_FILE_BY_ID_WITH_CHUNKS = _SELECT_FILE_BY_ID.options(selectinload(File.chunks))
+# 同一ファイル名の存在確認（行全体は取得せず、1件見つかった時点で打ち切る）
+_SELECT_FILE_NAME_EXISTS = select(File.id).where(
+    and_(
+        File.tenant_id == bindparam("tenant_id"),
+        File.file_name == bindparam("file_name"),
+        File.deleted_at.is_(None)
+    )
+).limit(1)
+# テナントのファイル件数・サイズを(ステータス, ファイルタイプ)別に1回で集計
+_SELECT_TENANT_FILE_AGGREGATES = select(
+    File.status,
+    File.file_type,
+    func.count(File.id).label("count"),
+    func.coalesce(func.sum(File.size_bytes), 0).label("size_bytes")
+).where(
+    and_(
+        File.tenant_id == bindparam("tenant_id"),
+        File.deleted_at.is_(None)
+    )
+).group_by(File.status, File.file_type)
+# コンテンツ統計用: ファイル集計にテナントの総チャンク数（スカラーサブクエリ）を加えて1回で取得
+# ファイルがないテナントでも総チャンク数の1行が返るよう、1行の導出表に集計結果を外部結合する
+_tenant_file_groups = _SELECT_TENANT_FILE_AGGREGATES.subquery()
+_SELECT_TENANT_CONTENT_STATS = select(
+    _tenant_file_groups,
+    select(func.count(Chunk.id)).where(
+        Chunk.tenant_id == bindparam("tenant_id")
+    ).scalar_subquery().label("total_chunks")
+).select_from(
+    select(literal(1).label("one")).subquery().outerjoin(_tenant_file_groups, true())
+)
+
+# Idempotency-Key照会用の式（ix_files_tenant_idempotency_keyの式と一致させるため、キー名はバインド変数ではなくリテラルにする）
+_FILE_IDEMPOTENCY_KEY = File.metadata_json.op("->>")(literal_column("'idempotency_key'"))
+
+# OFFSETでの読み飛ばし件数がこの値以上の場合は、キーセットページネーション（cursor）への移行を促す警告を出す
+_DEEP_OFFSET_WARNING_THRESHOLD = 1000
+
+# 更新スキーマのフィールド名 -> 更新対象カラム（スキーマとモデルで名前が異なるものを含む）
+_CONTENT_UPDATE_COLUMNS = {
+    "title": File.title,
+    "description": File.description,
+    "tags": File.tags,
+    "metadata": File.metadata_json,
+}
+_CHUNK_UPDATE_COLUMNS = {
+    "content": Chunk.chunk_text,
+    "metadata": Chunk.metadata_json,
+}
+
+# テナント別のファイル集計結果のキャッシュ（テナントID -> (有効期限, 集計結果)）
+# ダッシュボードの統計・ストレージ使用量の同時取得やポーリングで同じ集計を繰り返さないよう短時間だけ保持する
+# このプロセスでのファイル作成・削除・再インデックス時は該当テナントのエントリを破棄する
+_FILE_AGGREGATES_TTL_SECONDS = 5
+_FILE_AGGREGATES_CACHE_MAX_SIZE = 1024
+_file_aggregates_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+# テナント別の総チャンク数のキャッシュ（テナントID -> (有効期限, チャンク数)）
+# ファイル集計と同じ期間だけ保持し、このプロセスでのチャンク作成・削除時は該当テナントのエントリを破棄する
+# （バックグラウンド処理によるチャンク登録は有効期限の経過で反映される）
+_chunk_count_cache: Dict[str, Tuple[float, int]] = {}
+
+# URLからのファイル取得で共有するHTTPクライアント
+# 同一ホストからの取得でTCP/TLS接続を再利用する（アプリ終了時にclose_download_http_clientで閉じる）
+_DOWNLOAD_TIMEOUT_SECONDS = 30.0
+_download_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_download_http_client() -> httpx.AsyncClient:
+    """
+    URLからのファイル取得用の共有HTTPクライアントを取得
+    
+    戻り値:
+        httpx.AsyncClient: 共有HTTPクライアント
+    """
+    global _download_http_client
+    if _download_http_client is None or _download_http_client.is_closed:
+        _download_http_client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            timeout=_DOWNLOAD_TIMEOUT_SECONDS,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=100, keepalive_expiry=30),
+        )
+    return _download_http_client
+
+
+async def close_download_http_client() -> None:
+    """
+    URLからのファイル取得用の共有HTTPクライアントを閉じる（アプリ終了時に呼び出す）
+    """
+    global _download_http_client
+    if _download_http_client is not None:
+        await _download_http_client.aclose()
+        _download_http_client = None
+
+# アップロード後のバックグラウンド処理（RAGパイプライン）のタイムアウト（秒）
+# この時間を超えてPROCESSINGのままのファイルは処理が中断されたものとみなせる
+BACKGROUND_PROCESS_TIMEOUT_SECONDS = 1800.0
+# 実行中のバックグラウンド処理タスク
+# イベントループはタスクを弱参照でしか保持しないため、完了まで参照を保持して途中で破棄されないようにする
+_background_tasks: "set[asyncio.Task]" = set()
+
+
+async def _mark_processing_failed(db_bg: AsyncSession, file_id: str, error_message: str, reason: str) -> None:
+    """
+    バックグラウンド処理に失敗したファイルをFAILEDに更新し、アップロードユーザーへメールで通知
+    
+    メール送信の失敗はログのみで継続する
+    
+    引数:
+        db_bg: バックグラウンド処理用のセッション
+        file_id: ファイルID
+        error_message: ファイルに記録するエラーメッセージ
+        reason: ログ出力用の失敗理由（タイムアウト / 処理エラー）
+    """
+    try:
+        result = await db_bg.execute(
+            select(File).where(File.id == uuid.UUID(file_id))
+        )
+        file_obj = result.scalar_one_or_none()
+        if not file_obj:
+            return
+        file_obj.status = FileStatus.FAILED
+        file_obj.error_message = error_message
+        await db_bg.commit()
+        _invalidate_file_aggregates(file_obj.tenant_id)
+        
+        # メール通知を送信（非同期、エラーはログのみ）
+        try:
+            from app.services.email_service import EmailService
+            from app.models.user import User
+            
+            user_result = await db_bg.execute(
+                select(User).where(User.id == file_obj.uploaded_by)
+            )
+            user = user_result.scalar_one_or_none()
+            
+            if user and user.email:
+                await EmailService.send_content_processing_failure_email(
+                    to_email=user.email,
+                    username=user.username,
+                    file_title=file_obj.title,
+                    file_name=file_obj.file_name,
+                    error_message=error_message
+                )
+        except Exception as email_error:
+            logger.error(f"メール送信エラー（{reason}）: {str(email_error)}")
+    except Exception as update_error:
+        logger.error(f"{reason}時のステータス更新エラー: file_id={file_id}, error={str(update_error)}", exc_info=True)
+        await db_bg.rollback()
+
+
+async def _process_file_in_background(file_id: str, tenant_id: str, chunk_size: int, chunk_overlap: int) -> None:
+    """
+    バックグラウンドでRAGパイプラインを実行
+    
+    セッションはバックグラウンド処理専用に新規作成し、完了後自動クローズする。
+    タイムアウト・エラー時はファイルをFAILEDに更新してアップロードユーザーへ通知する。
+    
+    引数:
+        file_id: ファイルID
+        tenant_id: テナントID
+        chunk_size: チャンクサイズ
+        chunk_overlap: チャンクのオーバーラップ
+    """
+    from app.services.rag_pipeline import RAGPipeline
+    
+    logger.info(f"BG処理開始: file_id={file_id}")
+    
+    # セッションを直接コンテキストマネージャーとして使用（get_db()と同じパターン）
+    async with AsyncSessionLocal() as db_bg:
+        try:
+            rag_pipeline = RAGPipeline(db_bg)
+            await asyncio.wait_for(
+                rag_pipeline.process_file(
+                    file_id,
+                    tenant_id,
+                    chunk_size=chunk_size,
+                    chunk_overlap=chunk_overlap
+                ),
+                timeout=BACKGROUND_PROCESS_TIMEOUT_SECONDS
+            )
+            logger.info(f"BG処理完了: file_id={file_id}")
+        except asyncio.TimeoutError:
+            logger.error(f"BG処理タイムアウト: file_id={file_id}")
+            await _mark_processing_failed(db_bg, file_id, "処理がタイムアウトしました（30分）", "タイムアウト")
+        except Exception as e:
+            logger.error(f"BG処理エラー: file_id={file_id}, error={str(e)}", exc_info=True)
+            await _mark_processing_failed(db_bg, file_id, f"処理エラー: {str(e)}", "処理エラー")
+
+
+def _start_background_processing(file_id: str, tenant_id: str, chunk_size: int, chunk_overlap: int) -> None:
+    """
+    RAGパイプラインのバックグラウンド処理を開始
+    
+    引数:
+        file_id: ファイルID
+        tenant_id: テナントID
+        chunk_size: チャンクサイズ
+        chunk_overlap: チャンクのオーバーラップ
+    """
+    task = asyncio.create_task(
+        _process_file_in_background(file_id, tenant_id, chunk_size, chunk_overlap)
+    )
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+async def fail_stale_processing_files() -> int:
+    """
+    タイムアウト時間を超えてPROCESSINGのままのファイルをFAILEDに更新
+    
+    バックグラウンド処理はAPIプロセス内のタスクのため、処理中にプロセスが再起動すると
+    ステータスがPROCESSINGのまま残る。起動時にこれらを失敗扱いにして再インデックスできるようにする。
+    
+    戻り値:
+        int: 更新したファイル数
+    """
+    threshold = DateTimeUtils.now() - timedelta(seconds=BACKGROUND_PROCESS_TIMEOUT_SECONDS)
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            update(File)
+            .where(
+                and_(
+                    File.status == FileStatus.PROCESSING,
+                    File.updated_at < threshold,
+                    File.deleted_at.is_(None)
+                )
+            )
+            .values(status=FileStatus.FAILED, error_message="処理が中断されました。再インデックスしてください")
+            .returning(File.tenant_id)
+        )
+        failed_tenant_ids = result.scalars().all()
+        await db.commit()
+    for tenant_id in set(failed_tenant_ids):
+        _invalidate_file_aggregates(tenant_id)
+    return len(failed_tenant_ids)
+
+
+def _build_file_aggregates(rows) -> Dict[str, Any]:
+    """
+    (ステータス, ファイルタイプ, 件数, サイズ)別の集計行をテナント全体の集計結果にまとめる
+    
+    引数:
+        rows: _SELECT_TENANT_FILE_AGGREGATES の結果行
+    戻り値:
+        Dict[str, Any]: total_files, total_size_bytes, status_counts（ステータス別件数）,
+                        file_types（ファイルタイプ別件数）
+    """
+    total_files = 0
+    total_size_bytes = 0
+    status_counts = {status.value: 0 for status in FileStatus}
+    file_types = {file_type.value: 0 for file_type in FileType}
+    for status, file_type, count, size_bytes in rows:
+        total_files += count
+        total_size_bytes += size_bytes
+        status_counts[status.value] += count
+        file_types[file_type.value] += count
+    return {
+        "total_files": total_files,
+        "total_size_bytes": total_size_bytes,
+        "status_counts": status_counts,
+        "file_types": file_types,
+    }
+
+
+def _invalidate_file_aggregates(tenant_id: Optional[str]) -> None:
+    """
+    テナントのファイル集計キャッシュを破棄
+    
+    引数:
+        tenant_id: テナントID
+    """
+    _file_aggregates_cache.pop(str(tenant_id), None)
+
+
+def _invalidate_chunk_count(tenant_id: Optional[str]) -> None:
+    """
+    テナントの総チャンク数キャッシュを破棄
+    
+    引数:
+        tenant_id: テナントID
+    """
+    _chunk_count_cache.pop(str(tenant_id), None)
 
 
 class ContentService:
@@ -58,13 +354,14 @@ class ContentService:
         """
         self.db = db
 
-    async def get_by_id(self, content_id: str, tenant_id: str) -> Optional[File]:
+    async def get_by_id(self, content_id: str, tenant_id: str, load_chunks: bool = False) -> Optional[File]:
         """
         コンテンツIDでコンテンツ情報を取得
         
         引数:
             content_id: コンテンツの一意識別子
             tenant_id: テナントID（テナント分離用）
+            load_chunks: チャンクも同時に読み込むか（既定では読み込まない）
             
         戻り値:
             File: コンテンツ情報、存在しない場合はNone
@@ -77,17 +374,8 @@ class ContentService:
                 logger.warning(f"無効なパラメータ: content_id={content_id}, tenant_id={tenant_id}")
                 return None
                 
-            result = await self.db.execute(
-                select(File)
-                .options(selectinload(File.chunks))
-                .where(
-                    and_(
-                        File.id == content_id,
-                        File.tenant_id == tenant_id,
-                        File.deleted_at.is_(None)
-                    )
-                )
-            )
+            query = _SELECT_FILE_BY_ID_WITH_CHUNKS if load_chunks else _SELECT_FILE_BY_ID
+            result = await self.db.execute(query, {"content_id": content_id, "tenant_id": tenant_id})
             content = result.scalar_one_or_none()
             
             if content:
@@ -99,7 +387,6 @@ class ContentService:
         except Exception as e:
             logger.error(f"コンテンツ取得エラー: {str(e)}")
             raise
-        return result.scalar_one_or_none()
 
     async def get_all_contents(
         self,
@@ -108,9 +395,14 @@ class ContentService:
         limit: int = 100,
         file_type: Optional[FileType] = None,
         status: Optional[FileStatus] = None,
-        search_query: Optional[str] = None
+        search_query: Optional[str] = None,
+        cursor: Optional[Tuple[datetime, uuid.UUID]] = None
     ) -> List[File]:
-        """コンテンツ一覧取得（ページネーション対応）"""
+        """
+        コンテンツ一覧取得（ページネーション対応）
+        
+        cursor（前ページ最後の(created_at, id)）を指定した場合はキーセット方式で取得し、skipは無視します。
+        """
         # プラットフォーム管理者（全テナント横断）の場合はテナント条件を外す
         if tenant_id == "system":
             query = select(File).where(
@@ -138,11 +430,38 @@ class ContentService:
                 )
             )
         
-        query = query.order_by(File.created_at.desc()).offset(skip).limit(limit)
+        query = self._paginate(query, skip, limit, cursor)
         
         result = await self.db.execute(query)
         return result.scalars().all()
 
+    @staticmethod
+    def _paginate(query, skip: int, limit: int, cursor: Optional[Tuple[datetime, uuid.UUID]]):
+        """
+        作成日時の降順でページネーションを適用
+        
+        cursorを指定した場合はOFFSETで読み飛ばさず、(created_at, id)がcursorより前の行から取得する
+        （ix_files_tenant_created_id_activeインデックスを使用）
+        
+        引数:
+            query: ファイル検索クエリ
+            skip: 読み飛ばす件数（cursor未指定時のみ使用）
+            limit: 取得件数
+            cursor: 前ページ最後の(created_at, id)
+        戻り値:
+            ページネーションを適用したクエリ
+        """
+        query = query.order_by(File.created_at.desc(), File.id.desc())
+        if cursor is not None:
+            query = query.where(tuple_(File.created_at, File.id) < tuple_(*cursor))
+        else:
+            if skip >= _DEEP_OFFSET_WARNING_THRESHOLD:
+                logger.warning(
+                    f"OFFSETによる深いページの取得: skip={skip}（読み飛ばし件数に比例して遅くなるため、cursorの利用を推奨）"
+                )
+            query = query.offset(skip)
+        return query.limit(limit)
+
     async def check_duplicate_filename(self, file_name: str, tenant_id: str) -> bool:
         """
         ファイル名の重複チェック
@@ -159,17 +478,11 @@ class ContentService:
         """
         try:
             result = await self.db.execute(
-                select(File).where(
-                    and_(
-                        File.tenant_id == tenant_id,
-                        File.file_name == file_name,
-                        File.deleted_at.is_(None)
-                    )
-                )
+                _SELECT_FILE_NAME_EXISTS,
+                {"tenant_id": tenant_id, "file_name": file_name}
             )
-            existing_file = result.scalar_one_or_none()
             
-            if existing_file:
+            if result.scalar() is not None:
                 raise ConflictError(f"同一ファイル名のファイルが既に存在します: {file_name}")
             
             return False
@@ -179,6 +492,81 @@ class ContentService:
             logger.error(f"ファイル名重複チェックエラー: {str(e)}")
             raise
 
+    async def _find_idempotent_upload(self, file_name: str, tenant_id: str, idempotency_key: str) -> Optional[File]:
+        """
+        Idempotency-Key一致の既存ファイルの照会とファイル名の重複チェックを1回のクエリで行う
+        
+        引数:
+            file_name: アップロードするファイル名
+            tenant_id: テナントID
+            idempotency_key: 冪等性キー
+        戻り値:
+            File: Idempotency-Keyが一致する既存ファイル、存在しない場合はNone
+        例外:
+            ConflictError: Idempotency-Keyが一致せず、同一ファイル名のファイルが存在する場合
+        """
+        result = await self.db.execute(
+            select(File).where(
+                and_(
+                    File.tenant_id == tenant_id,
+                    File.deleted_at.is_(None),
+                    or_(
+                        _FILE_IDEMPOTENCY_KEY == idempotency_key,
+                        File.file_name == file_name
+                    )
+                )
+            )
+        )
+        files = result.scalars().all()
+        for file in files:
+            if (file.metadata_json or {}).get('idempotency_key') == idempotency_key:
+                return file
+        if files:
+            raise ConflictError(f"同一ファイル名のファイルが既に存在します: {file_name}")
+        return None
+
+    @staticmethod
+    async def _upload_file_content(file_content: bytes, file_name: str, tenant_id: str, file_type: FileType) -> str:
+        """
+        ファイル内容をストレージに保存
+        
+        引数:
+            file_content: ファイルのバイト内容
+            file_name: ファイル名
+            tenant_id: テナントID
+            file_type: ファイルタイプ
+        戻り値:
+            str: ストレージ内のファイルパス/URL（s3_keyに保存する値）
+        """
+        storage_service = StorageServiceFactory.create()
+        return await storage_service.upload_file(
+            file_content=file_content,
+            file_name=file_name,
+            tenant_id=tenant_id,
+            content_type=f"application/{file_type.value.lower()}"
+        )
+
+    async def _resolve_chunk_settings(self, content_data: ContentCreate, tenant_id: str) -> Tuple[int, int]:
+        """
+        自動処理のチャンク設定を決定
+        
+        決定順序: 1) ContentCreate指定値 > 2) テナント設定 > 3) コード既定値
+        両方指定されている場合はテナント設定を参照しない
+        
+        引数:
+            content_data: コンテンツ作成データ
+            tenant_id: テナントID
+        戻り値:
+            Tuple[int, int]: (chunk_size, chunk_overlap)
+        """
+        tenant_chunk_size, tenant_chunk_overlap = None, None
+        if not (content_data.chunk_size and content_data.chunk_overlap):
+            tenant_chunk_size, tenant_chunk_overlap = await TenantService(self.db).get_chunk_settings(tenant_id)
+        return (
+            content_data.chunk_size or tenant_chunk_size or 1024,
+            content_data.chunk_overlap or tenant_chunk_overlap or 200,
+        )
+
     async def create_content(
         self,
         content_data: ContentCreate,
@@ -207,26 +595,6 @@ class ContentService:
         from app.core.config import settings
         is_test_environment = "pytest" in sys.modules or settings.ENVIRONMENT == "test"
         
-        # 冪等性キーが指定された場合、既存を返す
-        try:
-            if idempotency_key:
-                from sqlalchemy import and_
-                result = await self.db.execute(
-                    select(File).where(
-                        and_(
-                            File.tenant_id == tenant_id,
-                            File.metadata_json['idempotency_key'].astext == idempotency_key,
-                            File.deleted_at.is_(None)
-                        )
-                    )
-                )
-                existing = result.scalar_one_or_none()
-                if existing:
-                    logger.info(f"Idempotency-Key一致の既存ファイルを返却: key={idempotency_key}, file_id={existing.id}")
-                    return existing
-        except Exception as e:
-            logger.warning(f"Idempotencyキー照会でエラーが発生しました（処理は継続）: {str(e)}")
-
         # ファイル名の決定
         # 優先順位:
         # 1) original_file_name（アップロード時の実ファイル名）
@@ -255,47 +623,76 @@ class ContentService:
         else:
             file_name = f"{content_data.title}.{content_data.content_type.value.lower()}"
         
-        # ファイル名の重複チェック
-        await self.check_duplicate_filename(file_name, tenant_id)
+        # 冪等性キーが指定された場合は既存を返し、なければファイル名の重複をチェック
+        if idempotency_key:
+            existing = await self._find_idempotent_upload(file_name, tenant_id, idempotency_key)
+            if existing:
+                logger.info(f"Idempotency-Key一致の既存ファイルを返却: key={idempotency_key}, file_id={existing.id}")
+                return existing
+        else:
+            await self.check_duplicate_filename(file_name, tenant_id)
         
         # ファイルサイズチェックとファイル内容の準備
         file_content_bytes = None
         if content_data.file_content:
-            file_content_bytes = base64.b64decode(content_data.file_content)
+            encoded = content_data.file_content
+            # 改行を含まないbase64はデコード後のサイズを文字数から算出できるため、
+            # 上限超過のデータはデコード（大きなバッファの確保）前に拒否する
+            if "\n" not in encoded:
+                estimated_size = len(encoded) * 3 // 4 - encoded.count("=", -2)
+                if not ValidationUtils.validate_file_size(estimated_size):
+                    raise ValueError("ファイルサイズが制限を超えています")
+            # 大きなペイロードのデコードでイベントループを塞がないようスレッドで実行する
+            file_content_bytes = await asyncio.to_thread(base64.b64decode, encoded)
             file_size = len(file_content_bytes)
             if not ValidationUtils.validate_file_size(file_size):
                 raise ValueError("ファイルサイズが制限を超えています")
         elif content_data.file_url:
             # URLからファイルをダウンロード
             try:
-                import httpx
-                async with httpx.AsyncClient() as client:
-                    response = await client.get(content_data.file_url, timeout=30.0)
+                client = _get_download_http_client()
+                # レスポンス全体を一度に読み込まず、ストリームで受信しながらサイズ上限を確認する
+                async with client.stream("GET", content_data.file_url) as response:
                     response.raise_for_status()
-                    file_content_bytes = response.content
-                    file_size = len(file_content_bytes)
+                    content_length = response.headers.get("content-length", "")
+                    if content_length.isdigit() and not ValidationUtils.validate_file_size(int(content_length)):
+                        raise ValueError("ファイルサイズが制限を超えています")
+                    received_chunks = []
+                    file_size = 0
+                    async for chunk in response.aiter_bytes():
+                        file_size += len(chunk)
+                        if not ValidationUtils.validate_file_size(file_size):
+                            raise ValueError("ファイルサイズが制限を超えています")
+                        received_chunks.append(chunk)
+                file_content_bytes = b"".join(received_chunks)
+            except ValueError:
+                raise
             except Exception as e:
                 logger.error(f"URLからのファイル取得エラー: {str(e)}")
                 raise ValueError(f"URLからのファイル取得に失敗しました: {str(e)}")
         else:
             file_size = 0
         
-        # ストレージサービスへのファイル保存
-        storage_service = StorageServiceFactory.create()
+        # 自動処理（ファイル内容がある場合のみ）のチャンク設定を取得してからストレージへ保存する
+        # 設定の取得は短時間キャッシュされるため軽量。保存処理と並行させると、保存の失敗時に
+        # self.dbのクエリが実行中・失敗のままセッションが残るため、順に実行する
+        # 設定の取得はセーブポイント内で行い、失敗時もセッション全体はロールバックしない
+        # （呼び出し側が同じセッションで読み込んだcurrent_user等を期限切れにしないため）
         s3_key = None
+        resolved_chunk_size = content_data.chunk_size or 1024
+        resolved_chunk_overlap = content_data.chunk_overlap or 200
         if file_content_bytes:
             try:
-                content_type = f"application/{content_data.content_type.value.lower()}"
-                s3_key = await storage_service.upload_file(
-                    file_content=file_content_bytes,
-                    file_name=file_name,
-                    tenant_id=tenant_id,
-                    content_type=content_type
-                )
-                logger.info(f"ファイルをストレージに保存: {s3_key}")
+                async with self.db.begin_nested():
+                    resolved_chunk_size, resolved_chunk_overlap = await self._resolve_chunk_settings(content_data, tenant_id)
+            except Exception as e:
+                logger.error(f"テナントのチャンク設定取得エラー（既定値を使用）: tenant_id={tenant_id}, error={str(e)}")
+            try:
+                s3_key = await self._upload_file_content(file_content_bytes, file_name, tenant_id, content_data.content_type)
             except Exception as e:
                 logger.error(f"ストレージへのファイル保存エラー: {str(e)}")
                 raise ValueError(f"ファイルの保存に失敗しました: {str(e)}")
+            logger.info(f"ファイルをストレージに保存: {s3_key}")
         # ファイル内容がない場合（URLのみ）は一時的に空のキーを設定
         if not s3_key:
             s3_key = f"tenant/{tenant_id}/files/{uuid.uuid4()}"
@@ -308,6 +705,7 @@ class ContentService:
             metadata['idempotency_key'] = idempotency_key
         
         # ファイル作成
+        # 自動処理を行う場合は作成時からPROCESSINGにする（一覧で進行中表示、INSERTとステータス更新を1回のコミットにまとめる）
         db_file = File(
             id=str(uuid.uuid4()),
             tenant_id=tenant_id,
@@ -319,41 +717,19 @@ class ContentService:
             uploaded_by=user_id,
             description=content_data.description,
             tags=content_data.tags,
-            metadata_json=metadata
+            metadata_json=metadata,
+            status=FileStatus.PROCESSING if file_content_bytes else FileStatus.UPLOADED
         )
         
+        # サーバー側の既定値（created_at等）はINSERT ... RETURNINGで取得され、
+        # セッションはexpire_on_commit=Falseのためコミット後のrefresh（再SELECT）は不要
         self.db.add(db_file)
         await self.db.commit()
-        await self.db.refresh(db_file)
+        _invalidate_file_aggregates(tenant_id)
         
         # 自動処理はバックグラウンドで実行（ファイル内容がある場合のみ）
         if file_content_bytes:
             try:
-                # チャンク設定の決定順序:
-                # 1) ContentCreate指定値 > 2) テナント設定 > 3) コード既定値
-                tenant_service = TenantService(self.db)
-                tenant = await tenant_service.get_by_id(tenant_id)
-                tenant_settings = tenant.settings if tenant and tenant.settings else {}
-
-                resolved_chunk_size = (
-                    content_data.chunk_size
-                    or tenant_settings.get('chunk_size')
-                    or 1024
-                )
-                resolved_chunk_overlap = (
-                    content_data.chunk_overlap
-                    or tenant_settings.get('chunk_overlap')
-                    or 200
-                )
-
-                # 即時にPROCESSINGへ更新（一覧で進行中表示）
-                db_file.status = FileStatus.PROCESSING
-                await self.db.commit()
-                # 非同期セッションではcommit時に属性がexpireされるため、
-                # レスポンス生成時の属性アクセスでMissingGreenletが発生しないよう
-                # ここで明示的にrefreshして値をロードしておく
-                await self.db.refresh(db_file)
-
                 file_id_str = str(db_file.id)
 
                 # BG開始ログ
@@ -365,117 +741,12 @@ class ContentService:
                 )
                 
                 if not is_test_environment:
-                    # 本番環境でのみ_bg_process関数を定義し、バックグラウンドで実行
-                    async def _bg_process(file_id: str, tenant_id_bg: str, chunk_size_bg: int, chunk_overlap_bg: int) -> None:
-                        """
-                        バックグラウンドでRAGパイプラインを実行する補助関数。
-                        セッションはBG専用に新規作成し、完了後自動クローズする。
-                        """
-                        from app.services.rag_pipeline import RAGPipeline
-                        from app.models.file import FileStatus, File
-                        from app.core.database import AsyncSessionLocal
-                        from sqlalchemy import select
-                        import uuid
-                        import asyncio
-                        
-                        logger.info(f"BG処理開始: file_id={file_id}")
-                        
-                        # セッションを直接コンテキストマネージャーとして使用（get_db()と同じパターン）
-                        async with AsyncSessionLocal() as db_bg:
-                            try:
-                                # タイムアウトを設定（30分）
-                                rag_pipeline = RAGPipeline(db_bg)
-                                await asyncio.wait_for(
-                                    rag_pipeline.process_file(
-                                        file_id,
-                                        tenant_id_bg,
-                                        chunk_size=chunk_size_bg,
-                                        chunk_overlap=chunk_overlap_bg
-                                    ),
-                                    timeout=1800.0  # 30分
-                                )
-                                logger.info(f"BG処理完了: file_id={file_id}")
-                            except asyncio.TimeoutError:
-                                logger.error(f"BG処理タイムアウト: file_id={file_id}")
-                                # タイムアウト時はステータスをFAILEDに更新
-                                try:
-                                    result = await db_bg.execute(
-                                        select(File).where(File.id == uuid.UUID(file_id))
-                                    )
-                                    file_obj = result.scalar_one_or_none()
-                                    if file_obj:
-                                        file_obj.status = FileStatus.FAILED
-                                        file_obj.error_message = "処理がタイムアウトしました（30分）"
-                                        await db_bg.commit()
-                                        
-                                        # メール通知を送信（非同期、エラーはログのみ）
-                                        try:
-                                            from app.services.email_service import EmailService
-                                            from app.models.user import User
-                                            
-                                            user_result = await db_bg.execute(
-                                                select(User).where(User.id == file_obj.uploaded_by)
-                                            )
-                                            user = user_result.scalar_one_or_none()
-                                            
-                                            if user and user.email:
-                                                await EmailService.send_content_processing_failure_email(
-                                                    to_email=user.email,
-                                                    username=user.username,
-                                                    file_title=file_obj.title,
-                                                    file_name=file_obj.file_name,
-                                                    error_message="処理がタイムアウトしました（30分）"
-                                                )
-                                        except Exception as email_error:
-                                            logger.error(f"メール送信エラー（タイムアウト）: {str(email_error)}")
-                                except Exception as update_error:
-                                    logger.error(f"タイムアウト時のステータス更新エラー: file_id={file_id}, error={str(update_error)}", exc_info=True)
-                                    await db_bg.rollback()
-                            except Exception as e:
-                                logger.error(f"BG処理エラー: file_id={file_id}, error={str(e)}", exc_info=True)
-                                # エラー時はステータスをFAILEDに更新
-                                try:
-                                    result = await db_bg.execute(
-                                        select(File).where(File.id == uuid.UUID(file_id))
-                                    )
-                                    file_obj = result.scalar_one_or_none()
-                                    if file_obj:
-                                        file_obj.status = FileStatus.FAILED
-                                        file_obj.error_message = f"処理エラー: {str(e)}"
-                                        await db_bg.commit()
-                                        
-                                        # メール通知を送信（非同期、エラーはログのみ）
-                                        try:
-                                            from app.services.email_service import EmailService
-                                            from app.models.user import User
-                                            
-                                            user_result = await db_bg.execute(
-                                                select(User).where(User.id == file_obj.uploaded_by)
-                                            )
-                                            user = user_result.scalar_one_or_none()
-                                            
-                                            if user and user.email:
-                                                await EmailService.send_content_processing_failure_email(
-                                                    to_email=user.email,
-                                                    username=user.username,
-                                                    file_title=file_obj.title,
-                                                    file_name=file_obj.file_name,
-                                                    error_message=f"処理エラー: {str(e)}"
-                                                )
-                                        except Exception as email_error:
-                                            logger.error(f"メール送信エラー（処理エラー）: {str(email_error)}")
-                                except Exception as update_error:
-                                    logger.error(f"ステータス更新エラー: file_id={file_id}, error={str(update_error)}", exc_info=True)
-                                    await db_bg.rollback()
-
                     # 本番環境ではバックグラウンドタスクとして実行
-                    asyncio.create_task(
-                        _bg_process(
-                            file_id_str,
-                            tenant_id,
-                            resolved_chunk_size,
-                            resolved_chunk_overlap
-                        )
+                    _start_background_processing(
+                        file_id_str,
+                        tenant_id,
+                        resolved_chunk_size,
+                        resolved_chunk_overlap
                     )
                 else:
                     # テスト環境ではバックグラウンド処理の代わりに同期的にRAGパイプラインを実行し、
@@ -514,19 +785,34 @@ class ContentService:
         tenant_id: str
     ) -> Optional[File]:
         """コンテンツ更新"""
-        content = await self.get_by_id(content_id, tenant_id)
-        if not content:
+        values = {
+            _CONTENT_UPDATE_COLUMNS[field]: value
+            for field, value in content_update.dict(exclude_unset=True).items()
+            if field in _CONTENT_UPDATE_COLUMNS
+        }
+        if not values:
+            return await self.get_by_id(content_id, tenant_id)
+        if not content_id or not tenant_id:
             return None
         
-        update_data = content_update.dict(exclude_unset=True)
-        
-        for field, value in update_data.items():
-            setattr(content, field, value)
-        
-        content.updated_at = DateTimeUtils.now()
-        
+        # 取得と更新を1回のUPDATE ... RETURNINGで行う（updated_atはモデルのonupdateでDB側のnow()が設定される）
+        result = await self.db.execute(
+            update(File)
+            .where(
+                and_(
+                    File.id == content_id,
+                    File.tenant_id == tenant_id,
+                    File.deleted_at.is_(None)
+                )
+            )
+            .values(values)
+            .returning(File)
+            .execution_options(populate_existing=True)
+        )
+        content = result.scalar_one_or_none()
+        if not content:
+            return None
         await self.db.commit()
-        await self.db.refresh(content)
         
         BusinessLogger.log_content_action(
             content_id,
@@ -544,24 +830,76 @@ class ContentService:
         ストレージからもファイルを削除し、関連チャンクおよびベクターストアのベクトルも削除します。
         いずれかの削除に失敗してもログを記録して処理を継続します（最終的にDB側はソフトデリート）。
         """
-        content = await self.get_by_id(content_id, tenant_id)
+        if not content_id or not tenant_id:
+            return False
+        
+        # ソフトデリートと削除対象の取得を1回のUPDATE ... RETURNINGで行う（コミットは最後に1回）
+        result = await self.db.execute(
+            update(File)
+            .where(
+                and_(
+                    File.id == content_id,
+                    File.tenant_id == tenant_id,
+                    File.deleted_at.is_(None)
+                )
+            )
+            .values(deleted_at=func.now())
+            .returning(File.s3_key, File.uploaded_by)
+        )
+        content = result.first()
         if not content:
             return False
         
-        # ストレージからファイルを削除（失敗してもログのみで継続）
-        if content.s3_key:
-            try:
-                storage_service = StorageServiceFactory.create()
-                deleted = await storage_service.delete_file(content.s3_key)
-                if deleted:
-                    logger.info(f"ストレージからファイルを削除: {content.s3_key}")
-                else:
-                    logger.warning(f"ストレージファイルの削除に失敗（ファイルが存在しない可能性）: {content.s3_key}")
-            except Exception as e:
-                logger.error(f"ストレージファイル削除エラー: {str(e)}, s3_key={content.s3_key}")
-                # エラーが発生してもDB削除は継続
+        # ストレージ・ベクターストア・DBチャンクの削除は互いに独立しているため並行して実行する
+        # （いずれも失敗してもログのみで継続し、ファイルのソフトデリートと同じトランザクションでコミットする）
+        await asyncio.gather(
+            self._delete_storage_file(content.s3_key),
+            self._delete_file_vectors(tenant_id, content_id),
+            self._delete_file_chunks(content_id, tenant_id),
+        )
 
-        # ベクターストアから削除（tenant_id + file_id 指定）
+        await self.db.commit()
+        _invalidate_file_aggregates(tenant_id)
+        _invalidate_chunk_count(tenant_id)
+        
+        BusinessLogger.log_content_action(
+            content_id,
+            "content_deleted",
+            str(content.uploaded_by),
+            tenant_id
+        )
+        
+        return True
+
+    @staticmethod
+    async def _delete_storage_file(s3_key: Optional[str]) -> None:
+        """
+        ストレージからファイルを削除（失敗してもログのみで継続）
+        
+        引数:
+            s3_key: ストレージ上のキー
+        """
+        if not s3_key:
+            return
+        try:
+            storage_service = StorageServiceFactory.create()
+            deleted = await storage_service.delete_file(s3_key)
+            if deleted:
+                logger.info(f"ストレージからファイルを削除: {s3_key}")
+            else:
+                logger.warning(f"ストレージファイルの削除に失敗（ファイルが存在しない可能性）: {s3_key}")
+        except Exception as e:
+            logger.error(f"ストレージファイル削除エラー: {str(e)}, s3_key={s3_key}")
+
+    @staticmethod
+    async def _delete_file_vectors(tenant_id: str, content_id: str) -> None:
+        """
+        ベクターストアからファイルのベクトルを削除（tenant_id + file_id 指定、失敗してもログのみで継続）
+        
+        引数:
+            tenant_id: テナントID
+            content_id: コンテンツID
+        """
         try:
             from app.services.vector_db_service import VectorDBService
             vdb = VectorDBService()
@@ -573,7 +911,14 @@ class ContentService:
         except Exception as e:
             logger.error(f"ベクターストア削除エラー: {str(e)}")
 
-        # チャンクをDBから削除（ファイルIDで一括）
+    async def _delete_file_chunks(self, content_id: str, tenant_id: str) -> None:
+        """
+        ファイルのチャンクをDBから一括削除（コミットは呼び出し側、失敗してもログのみで継続）
+        
+        引数:
+            content_id: コンテンツID
+            tenant_id: テナントID
+        """
         try:
             await self.db.execute(
                 delete(Chunk).where(
@@ -587,19 +932,6 @@ class ContentService:
         except Exception as e:
             logger.error(f"チャンク削除エラー: file_id={content_id}, error={str(e)}")
 
-        content.deleted_at = DateTimeUtils.now()
-        
-        await self.db.commit()
-        
-        BusinessLogger.log_content_action(
-            content_id,
-            "content_deleted",
-            str(content.uploaded_by),
-            tenant_id
-        )
-        
-        return True
-
     async def get_content_chunks(
         self, 
         content_id: str, 
@@ -607,9 +939,15 @@ class ContentService:
         skip: int = 0,
         limit: int = 100
     ) -> List[Chunk]:
-        """コンテンツのチャンク一覧取得"""
+        """
+        コンテンツのチャンク一覧取得
+        
+        埋め込みベクトル（1536次元）は一覧表示で使用しないため読み込まない
+        （参照した場合は遅延読み込みせずにエラーとする）
+        """
         result = await self.db.execute(
             select(Chunk)
+            .options(defer(Chunk.embedding, raiseload=True))
             .where(
                 and_(
                     Chunk.file_id == content_id,
@@ -649,6 +987,7 @@ class ContentService:
         
         self.db.add(db_chunk)
         await self.db.commit()
+        _invalidate_chunk_count(tenant_id)
         await self.db.refresh(db_chunk)
         
         return db_chunk
@@ -660,44 +999,51 @@ class ContentService:
         tenant_id: str
     ) -> Optional[Chunk]:
         """チャンク更新"""
+        values = {
+            _CHUNK_UPDATE_COLUMNS[field]: value
+            for field, value in chunk_update.dict(exclude_unset=True).items()
+            if field in _CHUNK_UPDATE_COLUMNS
+        }
+        where_clause = and_(
+            Chunk.id == chunk_id,
+            Chunk.tenant_id == tenant_id
+        )
+        if not values:
+            result = await self.db.execute(select(Chunk).where(where_clause))
+            return result.scalar_one_or_none()
+        
+        # 取得と更新を1回のUPDATE ... RETURNINGで行う
         result = await self.db.execute(
-            select(Chunk).where(
-                and_(
-                    Chunk.id == chunk_id,
-                    Chunk.tenant_id == tenant_id
-                )
-            )
+            update(Chunk)
+            .where(where_clause)
+            .values(values)
+            .returning(Chunk)
+            .execution_options(populate_existing=True)
         )
         chunk = result.scalar_one_or_none()
         if not chunk:
             return None
-        
-        update_data = chunk_update.dict(exclude_unset=True)
-        
-        for field, value in update_data.items():
-            setattr(chunk, field, value)
-        
         await self.db.commit()
-        await self.db.refresh(chunk)
         
         return chunk
 
     async def delete_chunk(self, chunk_id: str, tenant_id: str) -> bool:
         """チャンク削除"""
+        # 存在確認と削除を1回のDELETE ... RETURNINGで行う
         result = await self.db.execute(
-            select(Chunk).where(
+            delete(Chunk)
+            .where(
                 and_(
                     Chunk.id == chunk_id,
                     Chunk.tenant_id == tenant_id
                 )
             )
+            .returning(Chunk.id)
         )
-        chunk = result.scalar_one_or_none()
-        if not chunk:
+        if result.scalar_one_or_none() is None:
             return False
-        
-        await self.db.delete(chunk)
         await self.db.commit()
+        _invalidate_chunk_count(tenant_id)
         
         return True
 
@@ -707,7 +1053,15 @@ class ContentService:
         tenant_id: str
     ) -> List[ContentSearchResult]:
         """コンテンツ検索"""
-        query = select(File).where(
+        # 検索結果に必要なカラムのみを取得する（metadata等の大きなカラムは読み込まない）
+        query = select(
+            File.id,
+            File.title,
+            File.file_type,
+            File.description,
+            File.tags,
+            File.created_at
+        ).where(
             and_(
                 File.tenant_id == tenant_id,
                 File.deleted_at.is_(None)
@@ -718,10 +1072,9 @@ class ContentService:
         if search_params.file_types:
             query = query.where(File.file_type.in_(search_params.file_types))
         
-        # タグフィルタ
+        # タグフィルタ（指定タグをすべて含む。JSONBの包含演算子@>を1回で評価する）
         if search_params.tags:
-            for tag in search_params.tags:
-                query = query.where(File.tags.contains([tag]))
+            query = query.where(File.tags.contains(list(search_params.tags)))
         
         # 日付フィルタ
         if search_params.date_from:
@@ -739,11 +1092,10 @@ class ContentService:
                 )
             )
         
-        query = query.order_by(File.created_at.desc())
-        query = query.offset(search_params.offset).limit(search_params.limit)
+        query = self._paginate(query, search_params.offset, search_params.limit, search_params.cursor)
         
         result = await self.db.execute(query)
-        files = result.scalars().all()
+        files = result.all()
         
         # 検索結果をContentSearchResultに変換
         search_results = []
@@ -770,96 +1122,116 @@ class ContentService:
 
     async def get_content_stats(self, tenant_id: str) -> Dict[str, Any]:
         """コンテンツ統計取得"""
-        # 総ファイル数
-        total_files_result = await self.db.execute(
-            select(func.count(File.id)).where(
-                and_(
-                    File.tenant_id == tenant_id,
-                    File.deleted_at.is_(None)
-                )
-            )
-        )
-        total_files = total_files_result.scalar() or 0
+        aggregates, total_chunks = await self._get_content_stats_aggregates(tenant_id)
         
-        # ステータス別ファイル数
-        status_counts = {}
-        for status in FileStatus:
-            count_result = await self.db.execute(
-                select(func.count(File.id)).where(
-                    and_(
-                        File.tenant_id == tenant_id,
-                        File.status == status,
-                        File.deleted_at.is_(None)
-                    )
-                )
-            )
-            status_counts[status.value] = count_result.scalar() or 0
+        return {
+            "total_files": aggregates["total_files"],
+            "status_counts": dict(aggregates["status_counts"]),
+            "total_chunks": total_chunks,
+            "total_size_mb": FileUtils.get_file_size_mb(aggregates["total_size_bytes"]),
+            "file_types": dict(aggregates["file_types"])
+        }
+
+    async def _get_content_stats_aggregates(self, tenant_id: str) -> Tuple[Dict[str, Any], int]:
+        """
+        テナントのファイル集計と総チャンク数を取得（短時間キャッシュ）
         
-        # 総チャンク数
-        total_chunks_result = await self.db.execute(
-            select(func.count(Chunk.id)).where(Chunk.tenant_id == tenant_id)
-        )
-        total_chunks = total_chunks_result.scalar() or 0
+        いずれかのキャッシュが切れている場合は、self.dbで1回のクエリにまとめて両方を取得し直す
         
-        # 総ストレージサイズ
-        total_size_result = await self.db.execute(
-            select(func.sum(File.size_bytes)).where(
-                and_(
-                    File.tenant_id == tenant_id,
-                    File.deleted_at.is_(None)
-                )
-            )
+        引数:
+            tenant_id: テナントID
+        戻り値:
+            Tuple[Dict[str, Any], int]: (_get_file_aggregates と同じ形式の集計結果, 総チャンク数)
+        """
+        key = str(tenant_id)
+        now = time.monotonic()
+        cached_aggregates = _file_aggregates_cache.get(key)
+        cached_chunks = _chunk_count_cache.get(key)
+        if (
+            cached_aggregates is not None and cached_aggregates[0] > now
+            and cached_chunks is not None and cached_chunks[0] > now
+        ):
+            return cached_aggregates[1], cached_chunks[1]
+        
+        result = await self.db.execute(_SELECT_TENANT_CONTENT_STATS, {"tenant_id": tenant_id})
+        rows = result.all()
+        # 外部結合のため、ファイルがない場合はステータスがNULLの1行のみ
+        total_chunks = rows[0].total_chunks or 0
+        aggregates = _build_file_aggregates(
+            row[:4] for row in rows if row.status is not None
         )
-        total_size_bytes = total_size_result.scalar() or 0
         
-        return {
-            "total_files": total_files,
-            "status_counts": status_counts,
-            "total_chunks": total_chunks,
-            "total_size_mb": FileUtils.get_file_size_mb(total_size_bytes),
-            "file_types": {
-                file_type.value: await self._get_file_type_count(tenant_id, file_type)
-                for file_type in FileType
-            }
-        }
+        if len(_file_aggregates_cache) >= _FILE_AGGREGATES_CACHE_MAX_SIZE:
+            _file_aggregates_cache.clear()
+        _file_aggregates_cache[key] = (now + _FILE_AGGREGATES_TTL_SECONDS, aggregates)
+        if len(_chunk_count_cache) >= _FILE_AGGREGATES_CACHE_MAX_SIZE:
+            _chunk_count_cache.clear()
+        _chunk_count_cache[key] = (now + _FILE_AGGREGATES_TTL_SECONDS, total_chunks)
+        return aggregates, total_chunks
+
+    async def _get_file_aggregates(self, tenant_id: str) -> Dict[str, Any]:
+        """
+        テナントのファイル件数・サイズの集計を取得（短時間キャッシュ）
+        
+        引数:
+            tenant_id: テナントID
+        戻り値:
+            Dict[str, Any]: _build_file_aggregates の集計結果。キャッシュを共有するため変更しないこと
+        """
+        key = str(tenant_id)
+        now = time.monotonic()
+        cached = _file_aggregates_cache.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        
+        result = await self.db.execute(_SELECT_TENANT_FILE_AGGREGATES, {"tenant_id": tenant_id})
+        aggregates = _build_file_aggregates(result.all())
+        if len(_file_aggregates_cache) >= _FILE_AGGREGATES_CACHE_MAX_SIZE:
+            _file_aggregates_cache.clear()
+        _file_aggregates_cache[key] = (now + _FILE_AGGREGATES_TTL_SECONDS, aggregates)
+        return aggregates
 
-    async def _get_file_type_count(self, tenant_id: str, file_type: FileType) -> int:
-        """ファイルタイプ別件数取得"""
+    async def reindex_content(self, content_id: str, tenant_id: str) -> bool:
+        """コンテンツ再インデックス"""
+        if not content_id or not tenant_id:
+            return False
+        
+        # ステータスをPROCESSINGに更新（存在確認を兼ねる）
         result = await self.db.execute(
-            select(func.count(File.id)).where(
+            update(File)
+            .where(
                 and_(
+                    File.id == content_id,
                     File.tenant_id == tenant_id,
-                    File.file_type == file_type,
                     File.deleted_at.is_(None)
                 )
             )
+            .values(status=FileStatus.PROCESSING, error_message=None)
+            .returning(File.uploaded_by)
         )
-        return result.scalar() or 0
-
-    async def reindex_content(self, content_id: str, tenant_id: str) -> bool:
-        """コンテンツ再インデックス"""
-        content = await self.get_by_id(content_id, tenant_id)
-        if not content:
+        row = result.first()
+        if not row:
             return False
         
-        # ステータスをPROCESSINGに更新
-        content.status = FileStatus.PROCESSING
-        content.error_message = None
-        
         await self.db.commit()
+        _invalidate_file_aggregates(tenant_id)
         
         # TODO: 実際のインデックス処理を実装
         # ここでは仮に成功として処理
         
-        content.status = FileStatus.INDEXED
-        content.indexed_at = DateTimeUtils.now()
+        await self.db.execute(
+            update(File)
+            .where(File.id == content_id)
+            .values(status=FileStatus.INDEXED, indexed_at=DateTimeUtils.now())
+        )
         
         await self.db.commit()
+        _invalidate_file_aggregates(tenant_id)
         
         BusinessLogger.log_content_action(
             content_id,
             "content_reindexed",
-            str(content.uploaded_by),
+            str(row.uploaded_by),
             tenant_id
         )
         
@@ -868,15 +1240,7 @@ class ContentService:
     async def get_storage_usage(self, tenant_id: str) -> Dict[str, Any]:
         """ストレージ使用量取得"""
         # 総サイズ
-        total_size_result = await self.db.execute(
-            select(func.sum(File.size_bytes)).where(
-                and_(
-                    File.tenant_id == tenant_id,
-                    File.deleted_at.is_(None)
-                )
-            )
-        )
-        total_size_bytes = total_size_result.scalar() or 0
+        total_size_bytes = (await self._get_file_aggregates(tenant_id))["total_size_bytes"]
         
         # TODO: テナントの制限値を取得
         limit_bytes = 100 * 1024 * 1024  # 100MB
@@ -5,7 +5,8 @@
 領収書送信、使用量警告、月次レポート等の送信機能を提供します。
 """
 
-from typing import Optional, Dict, Any
+import asyncio
+from typing import Optional, Dict, Any, List, Callable, Awaitable, Tuple
 from app.core.config import settings
 from app.utils.logging import BusinessLogger, ErrorLogger, logger
 
@@ -15,6 +16,77 @@ except Exception:  # ランタイム依存を緩和
     resend = None  # type: ignore
 
 
+# メール送信キュー
+# リクエスト処理からResend APIの呼び出し（数秒かかる場合がある）を切り離し、送信ワーカーでバックグラウンド送信する
+# キューが満杯の場合は呼び出し側で直接送信する
+_EMAIL_QUEUE_MAX_SIZE = 1000
+_EMAIL_WORKER_COUNT = 4
+_email_queue: "Optional[asyncio.Queue[Tuple[Callable[..., Awaitable[bool]], tuple, dict]]]" = None
+_email_worker_tasks: List[asyncio.Task] = []
+
+
+def _ensure_email_workers() -> "asyncio.Queue[Tuple[Callable[..., Awaitable[bool]], tuple, dict]]":
+    """
+    実行中のイベントループ上にメール送信キューと送信ワーカーを用意する
+    
+    戻り値:
+        asyncio.Queue: メール送信ジョブのキュー
+    例外:
+        RuntimeError: 実行中のイベントループがない場合
+    """
+    global _email_queue, _email_worker_tasks
+    loop = asyncio.get_running_loop()
+    if (
+        not _email_worker_tasks
+        or any(task.done() for task in _email_worker_tasks)
+        or _email_worker_tasks[0].get_loop() is not loop
+    ):
+        for task in _email_worker_tasks:
+            task.cancel()
+        _email_queue = asyncio.Queue(maxsize=_EMAIL_QUEUE_MAX_SIZE)
+        _email_worker_tasks = [
+            loop.create_task(_email_worker(_email_queue)) for _ in range(_EMAIL_WORKER_COUNT)
+        ]
+    return _email_queue
+
+
+async def _email_worker(queue: "asyncio.Queue[Tuple[Callable[..., Awaitable[bool]], tuple, dict]]") -> None:
+    """
+    キューからメール送信ジョブを取り出して送信する（失敗はログのみで継続）
+    """
+    while True:
+        send, args, kwargs = await queue.get()
+        try:
+            if not await send(*args, **kwargs):
+                logger.warning(f"キューからのメール送信に失敗: {getattr(send, '__name__', send)}")
+        except Exception as e:
+            logger.error(f"キューからのメール送信エラー: {getattr(send, '__name__', send)}, error={str(e)}", exc_info=True)
+        finally:
+            queue.task_done()
+
+
+async def flush_email_queue(timeout: float = 30.0) -> None:
+    """
+    キューに残っているメールの送信を待ち、送信ワーカーを停止する（シャットダウン時に使用）
+    
+    引数:
+        timeout: 送信完了を待つ最大秒数
+    """
+    global _email_queue, _email_worker_tasks
+    tasks, queue = _email_worker_tasks, _email_queue
+    _email_worker_tasks, _email_queue = [], None
+    if not tasks or queue is None:
+        return
+    if not all(task.done() for task in tasks):
+        try:
+            await asyncio.wait_for(queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"メール送信が時間内に完了しませんでした: 残り{queue.qsize()}件")
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
 class EmailService:
     """
     メール送信サービス
@@ -27,6 +99,25 @@ class EmailService:
         if resend and settings.RESEND_API_KEY:
             resend.api_key = settings.RESEND_API_KEY
 
+    @staticmethod
+    def enqueue_email(send: Callable[..., Awaitable[bool]], *args: Any, **kwargs: Any) -> bool:
+        """
+        メール送信をキューに登録し、送信ワーカーでバックグラウンド送信する
+        
+        送信結果は待たない（失敗はワーカーでログに記録する）
+        
+        引数:
+            send: 送信メソッド（EmailService.send_*_email）
+            *args, **kwargs: 送信メソッドの引数
+        戻り値:
+            bool: キューに登録できた場合True（満杯・イベントループ外の場合はFalseのため、呼び出し側で直接送信する）
+        """
+        try:
+            _ensure_email_workers().put_nowait((send, args, kwargs))
+            return True
+        except (RuntimeError, asyncio.QueueFull):
+            return False
+
     @staticmethod
     async def send_receipt_email(to_email: str, subject: str, html: str) -> bool:
         """
@@ -111,7 +202,11 @@ class EmailService:
                 "html": html,
             }
             
-            response = resend.Emails.send(params)  # type: ignore
+            # イベントループを塞がないようスレッドで実行（タイムアウト設定付き）
+            response = await asyncio.wait_for(
+                asyncio.to_thread(resend.Emails.send, params),  # type: ignore
+                timeout=30.0  # 30秒のタイムアウト
+            )
             
             if response and hasattr(response, 'id'):
                 BusinessLogger.info(f"パスワードリセットメール送信完了: {response.id}")
@@ -6,6 +6,7 @@
 """
 
 import os
+import asyncio
 import logging
 from abc import ABC, abstractmethod
 from typing import Optional
@@ -153,10 +154,11 @@ class LocalFileStorage(StorageService):
         注意: LocalFileStorageではadd_random_suffix_paramは無視されます
         """
         try:
-            file_path = self._get_file_path(tenant_id, file_name)
+            # ファイル操作は同期I/Oのため、イベントループを塞がないようスレッドで実行する
+            file_path = await asyncio.to_thread(self._get_file_path, tenant_id, file_name)
             
             # ファイルを書き込み
-            file_path.write_bytes(file_content)
+            await asyncio.to_thread(file_path.write_bytes, file_content)
             
             # 相対パスを返す（tenant_id/file_name形式）
             storage_key = f"{tenant_id}/{file_name}"
@@ -176,7 +178,7 @@ class LocalFileStorage(StorageService):
             if not file_path.exists():
                 raise FileNotFoundError(f"File not found: {storage_key}")
             
-            return file_path.read_bytes()
+            return await asyncio.to_thread(file_path.read_bytes)
             
         except Exception as e:
             logger.error(f"Local file get error: {str(e)}")
@@ -15,9 +15,10 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 from sqlalchemy.orm import selectinload
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime, timedelta
 from app.core.constants import ReminderSettings, SystemMessages
+import time
 import uuid
 from app.models.tenant import Tenant
 from app.models.user import User, UserRole
@@ -29,6 +30,23 @@ from app.services.user_service import UserService
 from app.utils.common import StringUtils, ValidationUtils, DateTimeUtils
 from app.utils.logging import BusinessLogger, SecurityLogger, logger
 
+# テナントのチャンク設定のキャッシュ（テナントID -> (有効期限, (chunk_size, chunk_overlap))）
+# コンテンツのアップロード毎にテナントを読み込まないよう保持する
+# このプロセスでのテナント設定更新時は該当テナントのエントリを破棄する
+_CHUNK_SETTINGS_TTL_SECONDS = 60
+_CHUNK_SETTINGS_CACHE_MAX_SIZE = 1024
+_chunk_settings_cache: Dict[str, Tuple[float, Tuple[Optional[int], Optional[int]]]] = {}
+
+
+def _invalidate_chunk_settings(tenant_id: Optional[str]) -> None:
+    """
+    テナントのチャンク設定キャッシュを破棄
+    
+    引数:
+        tenant_id: テナントID
+    """
+    _chunk_settings_cache.pop(str(tenant_id), None)
+
 
 class TenantService:
     """
@@ -257,6 +275,7 @@ class TenantService:
         )
         
         await self.db.commit()
+        _invalidate_chunk_settings(tenant_id)
         await self.db.refresh(tenant)
         
         logger.debug(
@@ -346,6 +365,33 @@ class TenantService:
             last_activity=None  # TODO: 実装
         )
 
+    async def get_chunk_settings(self, tenant_id: str) -> Tuple[Optional[int], Optional[int]]:
+        """
+        テナントのチャンク設定を取得（短時間キャッシュ）
+        
+        引数:
+            tenant_id: テナントID
+        戻り値:
+            Tuple[Optional[int], Optional[int]]: (chunk_size, chunk_overlap)。未設定の項目はNone
+        """
+        key = str(tenant_id)
+        now = time.monotonic()
+        cached = _chunk_settings_cache.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        
+        # 設定カラムのみを取得する
+        result = await self.db.execute(
+            select(Tenant.settings).where(Tenant.id == tenant_id)
+        )
+        tenant_settings = result.scalar_one_or_none() or {}
+        chunk_settings = (tenant_settings.get('chunk_size'), tenant_settings.get('chunk_overlap'))
+        
+        if len(_chunk_settings_cache) >= _CHUNK_SETTINGS_CACHE_MAX_SIZE:
+            _chunk_settings_cache.clear()
+        _chunk_settings_cache[key] = (now + _CHUNK_SETTINGS_TTL_SECONDS, chunk_settings)
+        return chunk_settings
+
     async def update_tenant_settings(self, tenant_id: str, settings: TenantSettings) -> bool:
         """
         テナント設定更新
@@ -378,6 +424,7 @@ class TenantService:
         tenant.updated_at = DateTimeUtils.now()
         
         await self.db.commit()
+        _invalidate_chunk_settings(tenant_id)
         
         BusinessLogger.log_tenant_action(
             tenant_id,
@@ -420,6 +467,7 @@ class TenantService:
         # 明示的にフラッシュして変更を確認
         await self.db.flush()
         await self.db.commit()
+        _invalidate_chunk_settings(tenant_id)
         
         BusinessLogger.log_tenant_action(
             tenant_id,
@@ -12,6 +12,7 @@
 """
 
 from typing import List, Dict, Any, Optional
+import asyncio
 import os
 from app.utils.logging import PerformanceLogger, ErrorLogger, logger
 
@@ -102,7 +103,8 @@ class VectorDBService:
                 index = self._pc.Index(index_name)
                 # metadata で file_id 一致を削除
                 # v5: delete(filter={ "file_id": file_id })
-                index.delete(filter={"file_id": file_id})
+                # SDKは同期I/Oのため、イベントループを塞がないようスレッドで実行する
+                await asyncio.to_thread(index.delete, filter={"file_id": file_id})
             else:
                 PerformanceLogger.log_api_performance(
                     "vector_delete_stub",
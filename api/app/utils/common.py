@@ -12,6 +12,13 @@ from functools import wraps
 import asyncio
 from contextlib import asynccontextmanager
 
+# HTTP/2（httpx[http2]導入時のみ有効）。共有HTTPクライアントを生成する各サービスで参照する
+try:
+    import h2  # type: ignore  # noqa: F401
+    HTTP2_AVAILABLE = True
+except Exception:
+    HTTP2_AVAILABLE = False
+
 
 class ValidationError(Exception):
     """バリデーションエラー"""
@@ -384,6 +384,19 @@ class BusinessLogger:
             from app.services.audit_log_service import AuditLogService
             from app.core.database import AsyncSessionLocal
             
+            # 書き込みキューに追加（バックグラウンドでまとめて書き込む）
+            if AuditLogService.enqueue_audit_log(
+                tenant_id=tenant_id,
+                action=action,
+                resource_type=resource_type,
+                user_id=user_id,
+                resource_id=resource_id,
+                request=request,
+                details=details
+            ):
+                return
+            
+            # キューが満杯の場合は直接書き込む
             async with AsyncSessionLocal() as db:
                 audit_service = AuditLogService(db)
                 await audit_service.create_audit_log(
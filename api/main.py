@@ -1,4 +1,5 @@
 from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 from contextlib import asynccontextmanager
@@ -23,9 +24,29 @@ async def lifespan(app: FastAPI):
                 pass
             else:
                 raise
+        # 前回のプロセス終了で中断され、PROCESSINGのまま残ったファイルを失敗扱いにする
+        from app.utils.logging import logger
+        try:
+            from app.services.content_service import fail_stale_processing_files
+            failed_count = await fail_stale_processing_files()
+            if failed_count:
+                logger.warning(f"中断されたファイル処理をFAILEDに更新: {failed_count}件")
+        except Exception as e:
+            logger.error(f"中断されたファイル処理の確認に失敗: {str(e)}")
     yield
     # Shutdown
-    pass
+    # キューに残っている監査ログを書き込む
+    from app.services.audit_log_service import flush_audit_logs
+    await flush_audit_logs()
+    # キューに残っているメールを送信する
+    from app.services.email_service import flush_email_queue
+    await flush_email_queue()
+    # URLからのファイル取得用の共有HTTPクライアントを閉じる
+    from app.services.content_service import close_download_http_client
+    await close_download_http_client()
+    # APIキー検証用の共有HTTPクライアントを閉じる
+    from app.services.api_key_service import close_verify_http_clients
+    await close_verify_http_clients()
 
 
 def create_app() -> FastAPI:
@@ -39,6 +60,8 @@ def create_app() -> FastAPI:
         description="AI Chatbot API",
         openapi_url=f"{settings.API_V1_STR}/openapi.json",
         lifespan=lifespan,
+        # レスポンスのJSONエンコードはorjsonで行う（標準jsonエンコーダを経由しない）
+        default_response_class=ORJSONResponse,
     )
 
     # ロガーを先に定義
@@ -138,6 +161,8 @@ def create_app() -> FastAPI:
             "Content-Length",
             "Content-Type",
             "X-Request-Id",
+            "X-Next-Cursor-Created-At",  # コンテンツ一覧・検索のキーセットページネーション用
+            "X-Next-Cursor-Id",
         ],
     )
 
@@ -4,22 +4,26 @@ APIキーサービス単体テストファイル
 このファイルはApiKeyServiceのビジネスロジックをテストします。
 """
 
+import asyncio
+import base64
 import pytest
 import uuid
+from sqlalchemy import delete
 from sqlalchemy.ext.asyncio import AsyncSession
 from unittest.mock import patch, AsyncMock
+from app.services import api_key_service
 from app.services.api_key_service import ApiKeyService
+from app.models.api_key import ApiKey
 from app.models.tenant import Tenant
 from app.schemas.tenant import TenantStatus
-from app.schemas.api_key import ApiKeyCreate
+from app.schemas.api_key import ApiKeyCreate, ApiKeyUpdate
+from app.core.exceptions import BusinessLogicError
 
 
-@pytest.mark.asyncio
-async def test_create_api_key_success(db_session: AsyncSession):
+async def create_tenant(db_session: AsyncSession) -> Tenant:
     """
-    正常系テスト: APIキー作成
+    テスト用のテナントを作成するヘルパー関数
     """
-    # テナントを作成
     tenant = Tenant(
         name="Test Tenant",
         domain=f"test-tenant-{uuid.uuid4()}",
@@ -28,6 +32,24 @@ async def test_create_api_key_success(db_session: AsyncSession):
     db_session.add(tenant)
     await db_session.commit()
     await db_session.refresh(tenant)
+    return tenant
+
+
+async def cleanup_tenant(db_session: AsyncSession, tenant: Tenant):
+    """
+    テナントと登録したAPIキーを削除するヘルパー関数
+    """
+    await db_session.execute(delete(ApiKey).where(ApiKey.tenant_id == tenant.id))
+    await db_session.delete(tenant)
+    await db_session.commit()
+
+
+@pytest.mark.asyncio
+async def test_create_api_key_success(db_session: AsyncSession):
+    """
+    正常系テスト: APIキー作成
+    """
+    tenant = await create_tenant(db_session)
     
     try:
         service = ApiKeyService(db_session)
@@ -43,17 +65,7 @@ async def test_create_api_key_success(db_session: AsyncSession):
         assert api_key.provider == api_key_data.provider
         assert api_key.tenant_id == tenant.id
     finally:
-        # クリーンアップ
-        from app.models.api_key import ApiKey
-        from sqlalchemy import select
-        result = await db_session.execute(
-            select(ApiKey).where(ApiKey.tenant_id == tenant.id)
-        )
-        api_keys = result.scalars().all()
-        for ak in api_keys:
-            await db_session.delete(ak)
-        await db_session.delete(tenant)
-        await db_session.commit()
+        await cleanup_tenant(db_session, tenant)
 
 
 @pytest.mark.asyncio
@@ -70,3 +82,354 @@ async def test_verify_api_key_success(mock_verify: AsyncMock, db_session: AsyncS
     assert result["valid"] is True
     mock_verify.assert_called_once()
 
+
+class _FakeTransport:
+    """close の呼び出しを記録するgRPCトランスポートのスタブ"""
+
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class _FakeGenerativeServiceClient:
+    """generate_content の呼び出しを記録するGoogle生成クライアントのスタブ"""
+
+    calls = []
+    instances = []
+
+    def __init__(self, client_options):
+        self.api_key = client_options["api_key"]
+        self.transport = _FakeTransport()
+        _FakeGenerativeServiceClient.instances.append(self)
+
+    def generate_content(self, model, contents):
+        _FakeGenerativeServiceClient.calls.append((self.api_key, model))
+        if model == "models/gemini-missing" or self.api_key == "no-model-key":
+            raise Exception("404 model not found")
+        return "pong"
+
+
+class _FakeModelServiceClient:
+    """生成を記録するGoogleモデル一覧クライアントのスタブ"""
+
+    instances = []
+
+    def __init__(self, client_options):
+        self.transport = _FakeTransport()
+        _FakeModelServiceClient.instances.append(self)
+
+
+class _FakeGlm:
+    GenerativeServiceClient = _FakeGenerativeServiceClient
+    ModelServiceClient = _FakeModelServiceClient
+
+    @staticmethod
+    def Content(parts):
+        return parts
+
+    @staticmethod
+    def Part(text):
+        return text
+
+
+class _FakeGenai:
+    @staticmethod
+    def configure(api_key):
+        raise AssertionError("検証でグローバル設定を変更してはいけません")
+
+    @staticmethod
+    def list_models(client):
+        assert isinstance(client, _FakeModelServiceClient)
+        return []
+
+
+def reset_fake_google_clients():
+    """
+    Google SDKスタブの記録をリセットするヘルパー関数
+    """
+    _FakeGenerativeServiceClient.calls = []
+    _FakeGenerativeServiceClient.instances = []
+    _FakeModelServiceClient.instances = []
+
+
+@pytest.mark.asyncio
+async def test_verify_google_stops_at_first_available_model():
+    """
+    正常系テスト: Googleのモデル候補は1件ずつ試行し、最初の成功で打ち切る
+    """
+    reset_fake_google_clients()
+    with patch('app.services.api_key_service.genai', _FakeGenai), \
+            patch('app.services.api_key_service.glm', _FakeGlm):
+        service = ApiKeyService(None)
+        result = await service._verify_google("google", "test-google-key", "gemini-missing")
+
+    assert result["valid"] is True
+    assert result["model"] == "gemini-1.5-flash-latest"
+    # 成功以降の候補には生成リクエストを送らない
+    assert _FakeGenerativeServiceClient.calls == [
+        ("test-google-key", "models/gemini-missing"),
+        ("test-google-key", "models/gemini-1.5-flash-latest"),
+    ]
+    # モデル一覧用のクライアントは生成せず、生成クライアントは閉じる
+    assert _FakeModelServiceClient.instances == []
+    assert all(client.transport.closed for client in _FakeGenerativeServiceClient.instances)
+
+
+@pytest.mark.asyncio
+async def test_verify_google_uses_per_key_clients():
+    """
+    正常系テスト: 異なるキーの検証はそれぞれのキーのクライアントで並行に実行される
+    """
+    reset_fake_google_clients()
+    with patch('app.services.api_key_service.genai', _FakeGenai), \
+            patch('app.services.api_key_service.glm', _FakeGlm):
+        service = ApiKeyService(None)
+        results = await asyncio.gather(
+            service._verify_google("google", "key-a", "gemini-1.5-flash"),
+            service._verify_google("google", "key-b", "gemini-1.5-pro"),
+        )
+
+    assert all(r["valid"] for r in results)
+    assert sorted(_FakeGenerativeServiceClient.calls) == [
+        ("key-a", "models/gemini-1.5-flash"),
+        ("key-b", "models/gemini-1.5-pro"),
+    ]
+    assert len(_FakeGenerativeServiceClient.instances) == 2
+    assert all(client.transport.closed for client in _FakeGenerativeServiceClient.instances)
+
+
+@pytest.mark.asyncio
+async def test_verify_google_closes_clients_after_model_list_fallback():
+    """
+    異常系テスト: 全候補が見つからない場合はモデル一覧で探索し、両方のクライアントを閉じる
+    """
+    reset_fake_google_clients()
+    with patch('app.services.api_key_service.genai', _FakeGenai), \
+            patch('app.services.api_key_service.glm', _FakeGlm):
+        service = ApiKeyService(None)
+        result = await service._verify_google("google", "no-model-key", "gemini-missing")
+
+    assert result["valid"] is False
+    assert result["error_code"] == "model_not_found"
+    assert len(_FakeModelServiceClient.instances) == 1
+    assert _FakeModelServiceClient.instances[0].transport.closed
+    assert _FakeGenerativeServiceClient.instances[0].transport.closed
+
+
+@pytest.mark.asyncio
+async def test_update_api_key_duplicate_active_model(db_session: AsyncSession):
+    """
+    異常系テスト: 更新で有効なキーのプロバイダー・モデルが重複する場合はBusinessLogicError
+    """
+    tenant = await create_tenant(db_session)
+    try:
+        service = ApiKeyService(db_session)
+        await service.create_api_key(
+            str(tenant.id),
+            ApiKeyCreate(provider="openai", api_key="sk-test-key-1234567890", model="gpt-4")
+        )
+        other = await service.create_api_key(
+            str(tenant.id),
+            ApiKeyCreate(provider="openai", api_key="sk-test-key-0987654321", model="gpt-3.5-turbo")
+        )
+
+        # 既存の有効キーと同じモデルへの変更はユニークインデックス違反となる
+        with pytest.raises(BusinessLogicError):
+            await service.update_api_key(str(other.id), str(tenant.id), ApiKeyUpdate(model="gpt-4"))
+
+        # ロールバック後もセッションは利用可能で、対象のキーは変更されていない
+        current = await service.get_api_key(str(other.id), str(tenant.id))
+        assert current.model_name == "gpt-3.5-turbo"
+    finally:
+        await cleanup_tenant(db_session, tenant)
+
+
+@pytest.mark.asyncio
+async def test_create_api_key_duplicate(db_session: AsyncSession):
+    """
+    異常系テスト: 同じプロバイダー・モデルの有効なキーの重複作成はBusinessLogicError（ON CONFLICT DO NOTHING）
+    """
+    tenant = await create_tenant(db_session)
+    try:
+        service = ApiKeyService(db_session)
+        data = ApiKeyCreate(provider="openai", api_key="sk-test-key-1234567890", model="gpt-4")
+        await service.create_api_key(str(tenant.id), data)
+        
+        with pytest.raises(BusinessLogicError):
+            await service.create_api_key(str(tenant.id), data)
+        
+        keys = await service.get_api_keys_by_tenant(str(tenant.id))
+        assert len(keys) == 1
+    finally:
+        await cleanup_tenant(db_session, tenant)
+
+
+@pytest.mark.asyncio
+async def test_create_api_key_after_deactivate_and_reactivate(db_session: AsyncSession):
+    """
+    正常系・異常系テスト: 無効化したキーと同じモデルのキーは作成でき、
+    その状態で古いキーを再有効化するとBusinessLogicError
+    """
+    tenant = await create_tenant(db_session)
+    try:
+        service = ApiKeyService(db_session)
+        data = ApiKeyCreate(provider="openai", api_key="sk-test-key-1234567890", model="gpt-4")
+        old_key = await service.create_api_key(str(tenant.id), data)
+        await service.update_api_key(str(old_key.id), str(tenant.id), ApiKeyUpdate(is_active=False))
+        
+        # 無効なキーは部分ユニークインデックスの対象外のため、同じモデルで新規作成できる
+        new_key = await service.create_api_key(
+            str(tenant.id),
+            ApiKeyCreate(provider="openai", api_key="sk-test-key-0987654321", model="gpt-4")
+        )
+        assert new_key.is_active is True
+        
+        with pytest.raises(BusinessLogicError):
+            await service.update_api_key(str(old_key.id), str(tenant.id), ApiKeyUpdate(is_active=True))
+        
+        current = await service.get_api_key(str(old_key.id), str(tenant.id))
+        assert current.is_active is False
+    finally:
+        await cleanup_tenant(db_session, tenant)
+
+
+@pytest.mark.asyncio
+async def test_create_api_key_concurrent(db_session: AsyncSession):
+    """
+    異常系テスト: 別セッションからの同時作成でも有効なキーは1件のみ作成される
+    """
+    from app.core.database import AsyncSessionLocal
+    tenant = await create_tenant(db_session)
+    try:
+        data = ApiKeyCreate(provider="openai", api_key="sk-test-key-1234567890", model="gpt-4")
+        
+        async def create_in_new_session():
+            async with AsyncSessionLocal() as session:
+                return await ApiKeyService(session).create_api_key(str(tenant.id), data)
+        
+        results = await asyncio.gather(
+            create_in_new_session(),
+            create_in_new_session(),
+            return_exceptions=True
+        )
+        
+        created = [r for r in results if not isinstance(r, BaseException)]
+        errors = [r for r in results if isinstance(r, BaseException)]
+        assert len(created) == 1
+        assert len(errors) == 1
+        assert isinstance(errors[0], BusinessLogicError)
+        
+        keys = await ApiKeyService(db_session).get_api_keys_by_tenant(str(tenant.id))
+        assert len(keys) == 1
+    finally:
+        await cleanup_tenant(db_session, tenant)
+
+
+def test_encrypt_decrypt_api_key_round_trip():
+    """
+    正常系テスト: AES-GCMで暗号化したAPIキーを復号化できる（暗号化毎にnonceが変わる）
+    """
+    service = ApiKeyService(None)
+    
+    with patch.dict(api_key_service._decrypt_cache, clear=True):
+        encrypted = service._encrypt_api_key("sk-test-key-1234567890")
+        encrypted_again = service._encrypt_api_key("sk-test-key-1234567890")
+        
+        assert "sk-test-key-1234567890" not in encrypted
+        assert encrypted != encrypted_again
+        assert service._decrypt_api_key(encrypted) == "sk-test-key-1234567890"
+        assert service._decrypt_api_key(encrypted_again) == "sk-test-key-1234567890"
+
+
+def test_decrypt_tampered_api_key():
+    """
+    異常系テスト: 改ざんされた暗号文はBusinessLogicError
+    """
+    service = ApiKeyService(None)
+    raw = bytearray(base64.urlsafe_b64decode(service._encrypt_api_key("sk-test-key-1234567890")))
+    raw[-1] ^= 0x01
+    tampered = base64.urlsafe_b64encode(bytes(raw)).decode()
+    
+    with patch.dict(api_key_service._decrypt_cache, clear=True):
+        with pytest.raises(BusinessLogicError):
+            service._decrypt_api_key(tampered)
+
+
+def test_decrypt_legacy_fernet_api_key():
+    """
+    正常系テスト: 旧形式（Fernetトークンをさらにbase64化したもの）のAPIキーを復号化できる
+    """
+    service = ApiKeyService(None)
+    legacy = base64.urlsafe_b64encode(
+        api_key_service._LEGACY_CIPHER.encrypt(b"sk-legacy-key-1234567890")
+    ).decode()
+    
+    with patch.dict(api_key_service._decrypt_cache, clear=True):
+        assert service._decrypt_api_key(legacy) == "sk-legacy-key-1234567890"
+
+
+def test_decrypt_api_key_cache_ttl():
+    """
+    正常系テスト: 復号化結果はTTLの間キャッシュされ、期限切れ後は復号化し直す
+    """
+    service = ApiKeyService(None)
+    encrypted = service._encrypt_api_key("sk-test-key-1234567890")
+    
+    with patch.dict(api_key_service._decrypt_cache, clear=True), \
+            patch.object(service, '_decrypt_api_key_uncached', wraps=service._decrypt_api_key_uncached) as uncached:
+        assert service._decrypt_api_key(encrypted) == "sk-test-key-1234567890"
+        assert service._decrypt_api_key(encrypted) == "sk-test-key-1234567890"
+        assert uncached.call_count == 1
+        
+        with patch.object(api_key_service, '_DECRYPT_CACHE_TTL_SECONDS', 0):
+            api_key_service._decrypt_cache.clear()
+            service._decrypt_api_key(encrypted)
+            service._decrypt_api_key(encrypted)
+        assert uncached.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_verify_api_key_caches_only_valid_results():
+    """
+    正常系テスト: 検証成功の結果のみキャッシュし、失敗は毎回検証し直す
+    """
+    service = ApiKeyService(None)
+    valid = AsyncMock(return_value={"valid": True, "provider": "openai", "model": "gpt-4"})
+    invalid = AsyncMock(return_value={"valid": False, "provider": "openai", "model": "gpt-4", "error_code": "invalid_api_key"})
+    
+    with patch.dict(api_key_service._verify_cache, clear=True):
+        with patch.dict(ApiKeyService._VERIFIERS, {"openai": valid}):
+            first = await service.verify_api_key("openai", "sk-valid-key", "gpt-4")
+            second = await service.verify_api_key("openai", "sk-valid-key", "gpt-4")
+        assert first == second
+        assert valid.await_count == 1
+        
+        with patch.dict(ApiKeyService._VERIFIERS, {"openai": invalid}):
+            await service.verify_api_key("openai", "sk-invalid-key", "gpt-4")
+            await service.verify_api_key("openai", "sk-invalid-key", "gpt-4")
+        assert invalid.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_close_verify_http_clients():
+    """
+    正常系テスト: シャットダウン時に検証用の共有HTTPクライアントを閉じ、SDKクライアントのプールを空にする
+    """
+    shared = api_key_service._get_shared_http_client()
+    openai_client = api_key_service._get_openai_http_client()
+    api_key_service._client_pool[("openai", "test-key-hash")] = object()
+    
+    await api_key_service.close_verify_http_clients()
+    
+    assert shared.is_closed
+    assert openai_client.is_closed
+    assert api_key_service._shared_http_client is None
+    assert api_key_service._openai_http_client is None
+    assert len(api_key_service._client_pool) == 0
+    
+    # 閉じた後の取得では新しいクライアントを生成する
+    reopened = api_key_service._get_shared_http_client()
+    assert reopened is not shared
+    await api_key_service.close_verify_http_clients()
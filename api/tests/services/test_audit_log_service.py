@@ -0,0 +1,41 @@
+"""
+監査ログサービス単体テストファイル
+
+このファイルはAuditLogServiceの書き込みキューをテストします。
+"""
+
+import pytest
+import uuid
+from unittest.mock import patch, AsyncMock
+from app.services import audit_log_service
+from app.services.audit_log_service import AuditLogService, flush_audit_logs
+
+
+def test_enqueue_audit_log_without_running_loop():
+    """
+    異常系テスト: イベントループ外ではキューに登録せずFalseを返す（呼び出し側で直接書き込む）
+    """
+    assert AuditLogService.enqueue_audit_log(str(uuid.uuid4()), "create", "file") is False
+
+
+@pytest.mark.asyncio
+async def test_flush_audit_logs_writes_queued_rows():
+    """
+    正常系テスト: シャットダウン時にキューに残っている監査ログを全て書き込んでから停止する
+    """
+    await flush_audit_logs()
+    tenant_id = uuid.uuid4()
+    write = AsyncMock()
+
+    with patch.object(audit_log_service, '_write_audit_rows', write):
+        for i in range(3):
+            assert AuditLogService.enqueue_audit_log(
+                tenant_id, "create", "file", resource_id=str(uuid.uuid4()), details={"index": i}
+            ) is True
+        await flush_audit_logs()
+
+    written = [row for call in write.await_args_list for row in call.args[0]]
+    assert [row["details"]["index"] for row in written] == [0, 1, 2]
+    assert all(row["tenant_id"] == tenant_id for row in written)
+    assert audit_log_service._audit_flusher_task is None
+    assert audit_log_service._audit_queue is None
@@ -4,6 +4,7 @@
 このファイルはBillingServiceのビジネスロジックをテストします。
 """
 
+import asyncio
 import pytest
 import uuid
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -49,3 +50,43 @@ async def test_get_or_create_billing_info_success(db_session: AsyncSession):
         await db_session.delete(tenant)
         await db_session.commit()
 
+
+@pytest.mark.asyncio
+async def test_get_or_create_billing_info_concurrent(db_session: AsyncSession):
+    """
+    正常系テスト: 同時の初回アクセスでも課金情報は1件のみ作成され、同じ行を返す（ON CONFLICT DO NOTHING）
+    """
+    from app.core.database import AsyncSessionLocal
+    from app.models.billing import BillingInfo
+    from sqlalchemy import select, delete
+    
+    tenant = Tenant(
+        name="Test Tenant",
+        domain=f"test-tenant-{uuid.uuid4()}",
+        status=TenantStatus.ACTIVE
+    )
+    db_session.add(tenant)
+    await db_session.commit()
+    await db_session.refresh(tenant)
+    
+    async def get_or_create_in_new_session():
+        async with AsyncSessionLocal() as session:
+            info = await BillingService(session).get_or_create_billing_info(str(tenant.id), "test@example.com")
+            return info.id
+    
+    try:
+        ids = await asyncio.gather(*(get_or_create_in_new_session() for _ in range(3)))
+        
+        assert len(set(ids)) == 1
+        result = await db_session.execute(
+            select(BillingInfo).where(BillingInfo.tenant_id == tenant.id)
+        )
+        assert len(result.scalars().all()) == 1
+        
+        # 2回目以降は作成済みの行を返す
+        again = await BillingService(db_session).get_or_create_billing_info(str(tenant.id))
+        assert again.id == ids[0]
+    finally:
+        await db_session.execute(delete(BillingInfo).where(BillingInfo.tenant_id == tenant.id))
+        await db_session.delete(tenant)
+        await db_session.commit()
@@ -0,0 +1,252 @@
+"""
+コンテンツサービス単体テストファイル
+
+このファイルはContentServiceのビジネスロジックをテストします。
+"""
+
+import base64
+import pytest
+import uuid
+from datetime import timedelta
+from unittest.mock import patch, AsyncMock, MagicMock
+from sqlalchemy import delete, select, func, inspect, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.security import get_password_hash
+from app.models.chunk import Chunk
+from app.models.file import File, FileStatus, FileType
+from app.models.tenant import Tenant
+from app.models.user import User, UserRole
+from app.schemas.content import ContentCreate
+from app.schemas.tenant import TenantStatus
+from app.services import content_service
+from app.services.content_service import ContentService, fail_stale_processing_files
+from app.utils.common import DateTimeUtils
+
+
+async def create_tenant_with_user(db_session: AsyncSession) -> tuple[Tenant, User]:
+    """
+    テスト用のテナントと所属ユーザーを作成するヘルパー関数
+    
+    引数:
+        db_session: データベースセッション
+        
+    戻り値:
+        tuple: (Tenant, User)
+    """
+    unique_id = str(uuid.uuid4())[:8]
+    tenant = Tenant(
+        name=f"Content Service Tenant {unique_id}",
+        domain=f"content-service-{unique_id}",
+        status=TenantStatus.ACTIVE
+    )
+    db_session.add(tenant)
+    await db_session.commit()
+    await db_session.refresh(tenant)
+    
+    user = User(
+        email=f"content-service-{unique_id}@example.com",
+        username=f"contentservice{unique_id}",
+        hashed_password=get_password_hash("ContentService1"),
+        role=UserRole.TENANT_ADMIN,
+        tenant_id=tenant.id,
+        is_active=True,
+        is_verified=True,
+    )
+    db_session.add(user)
+    await db_session.commit()
+    await db_session.refresh(user)
+    return tenant, user
+
+
+async def cleanup_tenant(db_session: AsyncSession, tenant: Tenant, user: User):
+    """
+    create_tenant_with_user で作成したデータを削除するヘルパー関数
+    
+    引数:
+        db_session: データベースセッション
+        tenant: テナント
+        user: ユーザー
+    """
+    try:
+        await db_session.execute(delete(Chunk).where(Chunk.tenant_id == tenant.id))
+        await db_session.execute(delete(File).where(File.tenant_id == tenant.id))
+        await db_session.delete(user)
+        await db_session.delete(tenant)
+        await db_session.commit()
+    except Exception:
+        await db_session.rollback()
+        raise
+
+
+def make_file(tenant: Tenant, user: User, status: FileStatus = FileStatus.INDEXED, size_bytes: int = 1024) -> File:
+    """
+    テスト用のFileオブジェクトを生成するヘルパー関数
+    """
+    return File(
+        id=uuid.uuid4(),
+        tenant_id=tenant.id,
+        title="テストファイル",
+        file_name="test.txt",
+        file_type=FileType.TXT,
+        size_bytes=size_bytes,
+        status=status,
+        s3_key=f"test/{uuid.uuid4()}.txt",
+        uploaded_by=user.id,
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_content_stats_without_files(db_session: AsyncSession):
+    """
+    境界値テスト: ファイルがないテナントでも統計を取得できる
+    """
+    tenant, user = await create_tenant_with_user(db_session)
+    try:
+        service = ContentService(db_session)
+        stats = await service.get_content_stats(str(tenant.id))
+        
+        assert stats["total_files"] == 0
+        assert stats["total_chunks"] == 0
+        assert stats["total_size_mb"] == 0
+        assert all(count == 0 for count in stats["status_counts"].values())
+    finally:
+        await cleanup_tenant(db_session, tenant, user)
+
+
+@pytest.mark.asyncio
+async def test_get_content_stats_single_query_and_cache(db_session: AsyncSession):
+    """
+    正常系テスト: ファイル集計と総チャンク数は同じセッションの1回のクエリで取得し、短時間キャッシュする
+    """
+    tenant, user = await create_tenant_with_user(db_session)
+    try:
+        indexed = make_file(tenant, user, FileStatus.INDEXED, size_bytes=1024 * 1024)
+        failed = make_file(tenant, user, FileStatus.FAILED, size_bytes=1024 * 1024)
+        db_session.add_all([indexed, failed])
+        await db_session.commit()
+        db_session.add_all([
+            Chunk(file_id=indexed.id, tenant_id=tenant.id, chunk_index=i, chunk_text=f"chunk {i}")
+            for i in range(3)
+        ])
+        await db_session.commit()
+        
+        service = ContentService(db_session)
+        with patch.object(db_session, "execute", wraps=db_session.execute) as mock_execute:
+            stats = await service.get_content_stats(str(tenant.id))
+            assert mock_execute.call_count == 1
+            
+            # キャッシュの有効期間内はクエリを実行しない
+            cached_stats = await service.get_content_stats(str(tenant.id))
+            assert mock_execute.call_count == 1
+        
+        assert stats == cached_stats
+        assert stats["total_files"] == 2
+        assert stats["total_chunks"] == 3
+        assert stats["status_counts"]["INDEXED"] == 1
+        assert stats["status_counts"]["FAILED"] == 1
+        assert stats["file_types"]["TXT"] == 2
+        assert stats["total_size_mb"] == 2
+    finally:
+        content_service._invalidate_file_aggregates(tenant.id)
+        content_service._invalidate_chunk_count(tenant.id)
+        await cleanup_tenant(db_session, tenant, user)
+
+
+def make_content_create(title: str) -> ContentCreate:
+    """
+    ファイル内容付きのContentCreateを生成するヘルパー関数
+    """
+    return ContentCreate(
+        title=title,
+        content_type="TXT",
+        file_content=base64.b64encode("テストコンテンツ".encode("utf-8")).decode("utf-8"),
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_content_uses_defaults_when_chunk_settings_fail(db_session: AsyncSession):
+    """
+    異常系テスト: テナントのチャンク設定の取得に失敗しても既定値で作成を続行し、
+    同じセッションで読み込み済みのユーザー・テナントは期限切れにならない
+    """
+    tenant, user = await create_tenant_with_user(db_session)
+    
+    async def failing_settings_query(tenant_id):
+        # クエリの失敗でトランザクションが中断される状況を再現する
+        await db_session.execute(text("SELECT 1 / 0"))
+    
+    try:
+        mock_pipeline = MagicMock()
+        mock_pipeline.return_value.process_file = AsyncMock()
+        with patch('app.services.tenant_service.TenantService.get_chunk_settings', new_callable=AsyncMock) as mock_settings, \
+                patch('app.services.content_service.ContentService._upload_file_content', new_callable=AsyncMock) as mock_upload, \
+                patch('app.services.rag_pipeline.RAGPipeline', mock_pipeline):
+            mock_settings.side_effect = failing_settings_query
+            mock_upload.return_value = f"tenant/{tenant.id}/files/test.txt"
+            
+            service = ContentService(db_session)
+            db_file = await service.create_content(make_content_create("設定取得失敗"), str(tenant.id), str(user.id))
+        
+        # 設定の取得後にストレージへ保存し、既定値で自動処理を実行する
+        mock_upload.assert_awaited_once()
+        assert db_file.s3_key == f"tenant/{tenant.id}/files/test.txt"
+        process_kwargs = mock_pipeline.return_value.process_file.call_args.kwargs
+        assert process_kwargs["chunk_size"] == 1024
+        assert process_kwargs["chunk_overlap"] == 200
+        # セーブポイントのみロールバックされ、エンドポイントが使うcurrent_userは遅延読み込みなしで参照できる
+        assert not inspect(user).expired_attributes
+        assert not inspect(tenant).expired_attributes
+        assert str(user.id)
+    finally:
+        await cleanup_tenant(db_session, tenant, user)
+
+
+@pytest.mark.asyncio
+async def test_create_content_upload_failure_leaves_session_usable(db_session: AsyncSession):
+    """
+    異常系テスト: ストレージへの保存に失敗した場合はValueErrorとなり、ファイルは作成されずセッションは再利用できる
+    """
+    tenant, user = await create_tenant_with_user(db_session)
+    try:
+        with patch('app.services.content_service.ContentService._upload_file_content', new_callable=AsyncMock) as mock_upload:
+            mock_upload.side_effect = Exception("storage unavailable")
+            
+            service = ContentService(db_session)
+            with pytest.raises(ValueError):
+                await service.create_content(make_content_create("保存失敗"), str(tenant.id), str(user.id))
+        
+        result = await db_session.execute(
+            select(func.count(File.id)).where(File.tenant_id == tenant.id)
+        )
+        assert result.scalar() == 0
+    finally:
+        await cleanup_tenant(db_session, tenant, user)
+
+
+@pytest.mark.asyncio
+async def test_fail_stale_processing_files(db_session: AsyncSession):
+    """
+    正常系テスト: タイムアウト時間を超えてPROCESSINGのままのファイルのみFAILEDに更新する
+    """
+    tenant, user = await create_tenant_with_user(db_session)
+    try:
+        stale = make_file(tenant, user, status=FileStatus.PROCESSING)
+        stale.updated_at = DateTimeUtils.now() - timedelta(
+            seconds=content_service.BACKGROUND_PROCESS_TIMEOUT_SECONDS + 60
+        )
+        fresh = make_file(tenant, user, status=FileStatus.PROCESSING)
+        db_session.add_all([stale, fresh])
+        await db_session.commit()
+        
+        updated = await fail_stale_processing_files()
+        
+        assert updated >= 1
+        result = await db_session.execute(
+            select(File.id, File.status, File.error_message).where(File.tenant_id == tenant.id)
+        )
+        rows = {row.id: row for row in result}
+        assert rows[stale.id].status == FileStatus.FAILED
+        assert rows[stale.id].error_message
+        assert rows[fresh.id].status == FileStatus.PROCESSING
+    finally:
+        await cleanup_tenant(db_session, tenant, user)
@@ -0,0 +1,62 @@
+"""
+メールサービス単体テストファイル
+
+このファイルはEmailServiceの送信キューをテストします。
+"""
+
+import asyncio
+import pytest
+from unittest.mock import patch, AsyncMock
+from app.services import email_service
+from app.services.email_service import EmailService, flush_email_queue
+
+
+def test_enqueue_email_without_running_loop():
+    """
+    異常系テスト: イベントループ外ではキューに登録せずFalseを返す（呼び出し側で直接送信）
+    """
+    send = AsyncMock(return_value=True)
+
+    assert EmailService.enqueue_email(send, "user@example.com") is False
+    send.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_enqueue_email_queue_full():
+    """
+    異常系テスト: キューが満杯の場合はFalseを返す
+    """
+    await flush_email_queue()
+    send = AsyncMock(return_value=True)
+
+    with patch.object(email_service, '_EMAIL_QUEUE_MAX_SIZE', 1):
+        try:
+            # ワーカーが動く前（awaitなし）に連続登録するため2件目は満杯になる
+            assert EmailService.enqueue_email(send, "first@example.com") is True
+            assert EmailService.enqueue_email(send, "second@example.com") is False
+        finally:
+            await flush_email_queue()
+
+    send.assert_awaited_once_with("first@example.com")
+
+
+@pytest.mark.asyncio
+async def test_flush_email_queue_sends_queued_emails():
+    """
+    正常系テスト: シャットダウン時にキューに残っているメールを全て送信してから送信ワーカーを停止する
+    """
+    await flush_email_queue()
+    sent = []
+
+    async def send(to_email: str) -> bool:
+        await asyncio.sleep(0.01)
+        sent.append(to_email)
+        return True
+
+    for i in range(10):
+        assert EmailService.enqueue_email(send, f"user{i}@example.com") is True
+    await flush_email_queue()
+
+    assert sorted(sent) == sorted(f"user{i}@example.com" for i in range(10))
+    assert email_service._email_worker_tasks == []
+    assert email_service._email_queue is None
@@ -7,9 +7,11 @@
 import pytest
 import uuid
 from sqlalchemy.ext.asyncio import AsyncSession
+from unittest.mock import patch
+from app.services import tenant_service
 from app.services.tenant_service import TenantService
 from app.models.tenant import Tenant
-from app.schemas.tenant import TenantStatus
+from app.schemas.tenant import TenantStatus, TenantSettings
 from app.models.user import User, UserRole
 from app.core.security import get_password_hash
 
@@ -167,3 +169,34 @@ async def test_validate_tenant_access_failed(db_session: AsyncSession):
         await db_session.delete(tenant2)
         await db_session.commit()
 
+
+@pytest.mark.asyncio
+async def test_get_chunk_settings_cache(db_session: AsyncSession):
+    """
+    正常系テスト: チャンク設定はキャッシュされ、テナント設定の更新でキャッシュが破棄される
+    """
+    tenant = Tenant(
+        name="Test Tenant",
+        domain=f"test-tenant-{uuid.uuid4()}",
+        status=TenantStatus.ACTIVE,
+        settings={"chunk_size": 512, "chunk_overlap": 50}
+    )
+    db_session.add(tenant)
+    await db_session.commit()
+    await db_session.refresh(tenant)
+    
+    try:
+        service = TenantService(db_session)
+        with patch.dict(tenant_service._chunk_settings_cache, clear=True):
+            with patch.object(db_session, 'execute', wraps=db_session.execute) as execute:
+                assert await service.get_chunk_settings(str(tenant.id)) == (512, 50)
+                assert await service.get_chunk_settings(str(tenant.id)) == (512, 50)
+                assert execute.call_count == 1
+            
+            await service.update_tenant_settings(
+                str(tenant.id), TenantSettings(chunk_size=800, chunk_overlap=100)
+            )
+            assert str(tenant.id) not in tenant_service._chunk_settings_cache
+    finally:
+        await db_session.delete(tenant)
+        await db_session.commit()
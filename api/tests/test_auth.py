@@ -15,7 +15,7 @@ from app.models.user import User
 from app.models.tenant import Tenant
 from app.core.security import verify_password, get_password_hash
 from app.services.email_service import EmailService
-from unittest.mock import patch, AsyncMock
+from unittest.mock import patch, AsyncMock, MagicMock
 
 # テナントとユーザーを登録するヘルパー関数
 def register_user_and_tenant(client: TestClient, email: str, password: str, tenant_name: str, tenant_domain: str, admin_username: str = None):
@@ -662,8 +662,9 @@ async def cleanup_user(db_session: AsyncSession, email: str):
 
 
 @pytest.mark.asyncio
+@patch('app.services.email_service.EmailService.enqueue_email', return_value=True)
 @patch('app.services.email_service.EmailService.send_user_registration_email', new_callable=AsyncMock)
-async def test_register_user_success(mock_send_email: AsyncMock, client: TestClient, db_session: AsyncSession):
+async def test_register_user_success(mock_send_email: AsyncMock, mock_enqueue: MagicMock, client: TestClient, db_session: AsyncSession):
     """
     正常系テスト: 有効なユーザー情報で単体ユーザー登録
     """
@@ -687,7 +688,34 @@ async def test_register_user_success(mock_send_email: AsyncMock, client: TestCli
         assert verify_password(password, user.hashed_password)
         assert user.username == username
         
-        mock_send_email.assert_called_once()
+        # 確認メールはキューに登録され、リクエスト内では送信しない
+        mock_enqueue.assert_called_once()
+        assert mock_enqueue.call_args.args[0] is mock_send_email
+        assert mock_enqueue.call_args.args[1] == email
+        mock_send_email.assert_not_called()
+    finally:
+        await cleanup_user(db_session, email)
+
+
+@pytest.mark.asyncio
+@patch('app.services.email_service.EmailService.enqueue_email', return_value=False)
+@patch('app.services.email_service.EmailService.send_user_registration_email', new_callable=AsyncMock)
+async def test_register_user_email_fallback_when_queue_unavailable(mock_send_email: AsyncMock, mock_enqueue: MagicMock, client: TestClient, db_session: AsyncSession):
+    """
+    正常系テスト: キューに登録できない場合（満杯・イベントループ外）は確認メールを直接送信する
+    """
+    unique_id = str(uuid.uuid4())[:8]
+    email = f"register-fallback-{unique_id}@example.com"
+    password = "RegisterUserPassword1"
+    username = f"registerfallback{unique_id}"
+    
+    try:
+        response = register_user(client, email, password, username)
+        assert response.status_code == 200, f"登録が失敗しました: {response.json()}"
+        
+        mock_enqueue.assert_called_once()
+        mock_send_email.assert_awaited_once()
+        assert mock_send_email.call_args.args[0] == email
     finally:
         await cleanup_user(db_session, email)
 
@@ -16,7 +16,7 @@ from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.core.config import settings
-from app.models.file import File, FileStatus
+from app.models.file import File, FileStatus, FileType
 from tests.test_auth import register_user_and_tenant, cleanup_test_data, get_authenticated_client
 
 
@@ -179,6 +179,231 @@ async def test_get_contents_list_pagination(client: TestClient, db_session: Asyn
         await cleanup_test_data(db_session, email, tenant_domain)
 
 
+async def insert_keyset_test_files(db_session: AsyncSession, email: str, title_prefix: str) -> list:
+    """
+    キーセットページネーション検証用のファイルを直接登録するヘルパー関数
+    
+    5件のうち3件は作成日時が同じ（2ページ目の境界をまたぐ同値）になるように登録する
+    
+    引数:
+        db_session: データベースセッション
+        email: 登録済みユーザーのメールアドレス
+        title_prefix: タイトルの接頭辞（検索用）
+        
+    戻り値:
+        list: 登録したファイルのID（作成日時・IDの降順）
+    """
+    from datetime import datetime, timedelta, timezone
+    from app.models.user import User
+    user_result = await db_session.execute(select(User).where(User.email == email))
+    user = user_result.scalar_one()
+    base_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    created_ats = [
+        base_time + timedelta(minutes=3),
+        base_time + timedelta(minutes=2),
+        base_time + timedelta(minutes=2),
+        base_time + timedelta(minutes=2),
+        base_time + timedelta(minutes=1),
+    ]
+    files = []
+    for i, created_at in enumerate(created_ats):
+        files.append(File(
+            id=uuid.uuid4(),
+            tenant_id=user.tenant_id,
+            title=f"{title_prefix} {i}",
+            file_name=f"keyset-{i}.txt",
+            file_type=FileType.TXT,
+            size_bytes=10,
+            status=FileStatus.INDEXED,
+            s3_key=f"test/keyset-{uuid.uuid4()}.txt",
+            uploaded_by=user.id,
+            created_at=created_at,
+        ))
+    db_session.add_all(files)
+    await db_session.commit()
+    files.sort(key=lambda f: (f.created_at, f.id), reverse=True)
+    return [str(f.id) for f in files]
+
+
+async def delete_test_files(db_session: AsyncSession, file_ids: list):
+    """
+    ヘルパー関数で登録したファイルを削除する
+    
+    引数:
+        db_session: データベースセッション
+        file_ids: 削除するファイルのID
+    """
+    from sqlalchemy import delete
+    await db_session.execute(delete(File).where(File.id.in_([uuid.UUID(i) for i in file_ids])))
+    await db_session.commit()
+
+
+def next_cursor_params(response) -> dict:
+    """
+    レスポンスヘッダーの次ページカーソルをクエリパラメータに変換する（最終ページの場合は空）
+    """
+    created_at = response.headers.get("X-Next-Cursor-Created-At")
+    cursor_id = response.headers.get("X-Next-Cursor-Id")
+    if created_at is None or cursor_id is None:
+        return {}
+    return {"cursor_created_at": created_at, "cursor_id": cursor_id}
+
+
+@pytest.mark.asyncio
+async def test_get_contents_keyset_pagination(client: TestClient, db_session: AsyncSession):
+    """
+    正常系テスト: カーソル（X-Next-Cursor-*ヘッダー）をたどって全件を重複・欠落なく取得できる
+    （作成日時が同じファイルがページ境界をまたぐ場合を含む）
+    """
+    unique_id = str(uuid.uuid4())[:8]
+    email = f"keyset-contents-{unique_id}@example.com"
+    password = "KeysetContentsPassword1"
+    tenant_name = f"Keyset Contents Tenant {unique_id}"
+    tenant_domain = f"keyset-contents-tenant-{unique_id}"
+    file_ids = []
+    
+    try:
+        register_user_and_tenant(client, email, password, tenant_name, tenant_domain)
+        _, access_token = get_authenticated_client(client, email, password)
+        file_ids = await insert_keyset_test_files(db_session, email, f"Keyset {unique_id}")
+        
+        pages = []
+        params = {"limit": 2}
+        while True:
+            response = client.get(
+                f"{settings.API_V1_STR}/contents/",
+                params=params,
+                headers={"Authorization": f"Bearer {access_token}"}
+            )
+            assert response.status_code == 200
+            pages.append([item["id"] for item in response.json()])
+            cursor = next_cursor_params(response)
+            if not cursor:
+                break
+            # カーソルは最後の要素のcreated_at/id
+            assert cursor["cursor_id"] == pages[-1][-1]
+            params = {"limit": 2, **cursor}
+        
+        # 2件, 2件, 1件（limit未満の最終ページにはカーソルを返さない）
+        assert [len(page) for page in pages] == [2, 2, 1]
+        assert [i for page in pages for i in page] == file_ids
+    finally:
+        await delete_test_files(db_session, file_ids)
+        await cleanup_test_data(db_session, email, tenant_domain)
+
+
+@pytest.mark.asyncio
+async def test_get_contents_cursor_last_page_boundary(client: TestClient, db_session: AsyncSession):
+    """
+    境界値テスト: 残り件数がlimitと同じ場合はカーソルが返り、次ページは空でカーソルなし
+    """
+    unique_id = str(uuid.uuid4())[:8]
+    email = f"keyset-boundary-{unique_id}@example.com"
+    password = "KeysetBoundaryPassword1"
+    tenant_name = f"Keyset Boundary Tenant {unique_id}"
+    tenant_domain = f"keyset-boundary-tenant-{unique_id}"
+    file_ids = []
+    
+    try:
+        register_user_and_tenant(client, email, password, tenant_name, tenant_domain)
+        _, access_token = get_authenticated_client(client, email, password)
+        file_ids = await insert_keyset_test_files(db_session, email, f"Keyset {unique_id}")
+        
+        response = client.get(
+            f"{settings.API_V1_STR}/contents/",
+            params={"limit": 5},
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json()] == file_ids
+        cursor = next_cursor_params(response)
+        assert cursor["cursor_id"] == file_ids[-1]
+        
+        response = client.get(
+            f"{settings.API_V1_STR}/contents/",
+            params={"limit": 5, **cursor},
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+        assert response.status_code == 200
+        assert response.json() == []
+        assert next_cursor_params(response) == {}
+    finally:
+        await delete_test_files(db_session, file_ids)
+        await cleanup_test_data(db_session, email, tenant_domain)
+
+
+@pytest.mark.asyncio
+async def test_search_contents_keyset_pagination(client: TestClient, db_session: AsyncSession):
+    """
+    正常系テスト: 検索APIもX-Next-Cursor-*ヘッダーのカーソルで次ページを取得できる
+    """
+    unique_id = str(uuid.uuid4())[:8]
+    email = f"keyset-search-{unique_id}@example.com"
+    password = "KeysetSearchPassword1"
+    tenant_name = f"Keyset Search Tenant {unique_id}"
+    tenant_domain = f"keyset-search-tenant-{unique_id}"
+    file_ids = []
+    
+    try:
+        register_user_and_tenant(client, email, password, tenant_name, tenant_domain)
+        _, access_token = get_authenticated_client(client, email, password)
+        file_ids = await insert_keyset_test_files(db_session, email, f"KeysetSearch{unique_id}")
+        
+        found = []
+        body = {"query": f"KeysetSearch{unique_id}", "limit": 2}
+        while True:
+            response = client.post(
+                f"{settings.API_V1_STR}/contents/search",
+                json=body,
+                headers={"Authorization": f"Bearer {access_token}"}
+            )
+            assert response.status_code == 200
+            found.extend(item["id"] for item in response.json())
+            cursor = next_cursor_params(response)
+            if not cursor:
+                break
+            body = {"query": f"KeysetSearch{unique_id}", "limit": 2, **cursor}
+        
+        assert found == file_ids
+    finally:
+        await delete_test_files(db_session, file_ids)
+        await cleanup_test_data(db_session, email, tenant_domain)
+
+
+@pytest.mark.asyncio
+async def test_partial_cursor_rejected(client: TestClient, db_session: AsyncSession):
+    """
+    異常系テスト: cursor_created_at/cursor_idの片方のみの指定は一覧・検索の両方で422
+    """
+    unique_id = str(uuid.uuid4())[:8]
+    email = f"partial-cursor-{unique_id}@example.com"
+    password = "PartialCursorPassword1"
+    tenant_name = f"Partial Cursor Tenant {unique_id}"
+    tenant_domain = f"partial-cursor-tenant-{unique_id}"
+    
+    try:
+        register_user_and_tenant(client, email, password, tenant_name, tenant_domain)
+        _, access_token = get_authenticated_client(client, email, password)
+        
+        response = client.get(
+            f"{settings.API_V1_STR}/contents/",
+            params={"cursor_id": str(uuid.uuid4())},
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+        assert response.status_code == 422
+        assert "cursor_created_atとcursor_idは両方指定する必要があります" in str(response.json())
+        
+        response = client.post(
+            f"{settings.API_V1_STR}/contents/search",
+            json={"query": "test", "cursor_created_at": "2024-01-01T00:00:00+00:00"},
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+        assert response.status_code == 422
+        assert "cursor_created_atとcursor_idは両方指定する必要があります" in str(response.json())
+    finally:
+        await cleanup_test_data(db_session, email, tenant_domain)
+
+
 @pytest.mark.asyncio
 async def test_get_contents_list_filtering(client: TestClient, db_session: AsyncSession):
     """
@@ -0,0 +1,56 @@
+"""
+データベース設定テストファイル
+
+このファイルはDB接続プールの設定値と、RLS用テナントコンテキストの有効範囲をテストします。
+"""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import Settings, DB_POOL_DEFAULTS
+from app.repositories.base import BaseRepository
+
+
+def test_db_pool_defaults_by_environment():
+    """
+    正常系テスト: 未設定の場合はENVIRONMENT別の既定値を使用する
+    """
+    production = Settings(ENVIRONMENT="production", DB_POOL_SIZE=None, DB_MAX_OVERFLOW=None, DB_POOL_TIMEOUT=None)
+    development = Settings(ENVIRONMENT="development", DB_POOL_SIZE=None, DB_MAX_OVERFLOW=None, DB_POOL_TIMEOUT=None)
+    unknown = Settings(ENVIRONMENT="preview", DB_POOL_SIZE=None, DB_MAX_OVERFLOW=None, DB_POOL_TIMEOUT=None)
+
+    assert production.get_db_pool_settings() == DB_POOL_DEFAULTS["production"]
+    assert development.get_db_pool_settings() == DB_POOL_DEFAULTS["development"]
+    # 未知の環境は開発環境の既定値
+    assert unknown.get_db_pool_settings() == DB_POOL_DEFAULTS["development"]
+
+
+def test_db_pool_settings_override():
+    """
+    正常系テスト: 環境変数で指定した項目のみ既定値を上書きする（0でプール無効）
+    """
+    overridden = Settings(ENVIRONMENT="production", DB_POOL_SIZE=0, DB_MAX_OVERFLOW=None, DB_POOL_TIMEOUT=5)
+
+    assert overridden.get_db_pool_settings() == {
+        "pool_size": 0,
+        "max_overflow": DB_POOL_DEFAULTS["production"]["max_overflow"],
+        "pool_timeout": 5,
+    }
+
+
+@pytest.mark.asyncio
+async def test_tenant_context_is_transaction_local(db_session: AsyncSession):
+    """
+    正常系テスト: RLS用のテナントIDはトランザクション内のみ有効で、プールへ返却される接続に残らない
+    """
+    repository = BaseRepository(db_session)
+    try:
+        await repository.set_tenant_context("11111111-1111-1111-1111-111111111111")
+        result = await db_session.execute(text("SELECT current_setting('app.tenant_id', true)"))
+        assert result.scalar() == "11111111-1111-1111-1111-111111111111"
+        
+        await db_session.commit()
+        result = await db_session.execute(text("SELECT current_setting('app.tenant_id', true)"))
+        assert result.scalar() in (None, "")
+    finally:
+        await db_session.rollback()
@@ -0,0 +1,116 @@
+"""
+マイグレーションテストファイル
+
+このファイルはデータ移行を伴うマイグレーション（APIキーの再暗号化・モデル列の統一）をテストします。
+"""
+
+import base64
+import importlib.util
+import logging
+from pathlib import Path
+from unittest.mock import patch, MagicMock
+from app.services import api_key_service
+from app.services.api_key_service import ApiKeyService
+
+
+MIGRATIONS_DIR = Path(__file__).resolve().parent.parent / "alembic" / "versions"
+
+
+def load_migration(file_name: str):
+    """
+    マイグレーションのモジュールを読み込むヘルパー関数
+    
+    引数:
+        file_name: alembic/versions内のファイル名
+    """
+    spec = importlib.util.spec_from_file_location(file_name.removesuffix(".py"), MIGRATIONS_DIR / file_name)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class FakeConnection:
+    """
+    api_keysテーブルの行をメモリ上に保持する接続のスタブ
+    """
+
+    def __init__(self, rows):
+        self.rows = dict(rows)
+
+    def execute(self, statement, params=None):
+        if params is not None:
+            self.rows[params["id"]] = params["api_key"]
+            return None
+        rows = list(self.rows.items())
+
+        class Result:
+            def fetchall(self):
+                return rows
+
+        return Result()
+
+
+def test_reencrypt_migration_upgrade_and_downgrade():
+    """
+    正常系テスト: 旧形式のAPIキーのみAES-GCM形式に再暗号化し、downgradeで旧形式に戻す
+    """
+    migration = load_migration("e3f4a5b6c7d8_reencrypt_legacy_api_keys_with_aesgcm.py")
+    service = ApiKeyService(None)
+    legacy = base64.urlsafe_b64encode(
+        api_key_service._LEGACY_CIPHER.encrypt(b"sk-legacy-key-1234567890")
+    ).decode()
+    current = service._encrypt_api_key("sk-current-key-1234567890")
+    conn = FakeConnection({"legacy": legacy, "current": current})
+
+    with patch.object(migration.op, "get_bind", return_value=conn, create=True), \
+            patch.dict(api_key_service._decrypt_cache, clear=True):
+        migration.upgrade()
+
+        assert conn.rows["legacy"] != legacy
+        assert not base64.urlsafe_b64decode(conn.rows["legacy"]).startswith(b"gAAAAA")
+        assert len(conn.rows["legacy"]) < len(legacy)
+        assert service._decrypt_api_key(conn.rows["legacy"]) == "sk-legacy-key-1234567890"
+        # AES-GCM形式の行は変更しない
+        assert conn.rows["current"] == current
+
+        migration.downgrade()
+
+        assert base64.urlsafe_b64decode(conn.rows["legacy"]).startswith(b"gAAAAA")
+        assert base64.urlsafe_b64decode(conn.rows["current"]).startswith(b"gAAAAA")
+        assert service._decrypt_api_key(conn.rows["legacy"]) == "sk-legacy-key-1234567890"
+        assert service._decrypt_api_key(conn.rows["current"]) == "sk-current-key-1234567890"
+
+
+def test_normalize_model_column_logs_deactivated_keys(caplog):
+    """
+    正常系テスト: モデル列の統一で非アクティブ化したAPIキーの件数をログに記録する
+    """
+    migration = load_migration("c8d9e0f1a2b3_normalize_api_keys_model_column.py")
+    conn = MagicMock()
+    conn.execute.return_value.rowcount = 2
+
+    with patch.object(migration, "op") as op, \
+            patch.object(migration, "_api_key_columns", return_value={"model", "model_name"}), \
+            caplog.at_level(logging.WARNING, logger="alembic.runtime.migration"):
+        op.get_bind.return_value = conn
+        migration.upgrade()
+
+    op.drop_column.assert_called_once_with("api_keys", "model")
+    assert "2件" in caplog.text
+
+
+def test_normalize_model_column_downgrade_restores_model():
+    """
+    正常系テスト: downgradeはNULL許可のmodel列を再作成し、model_nameの値で埋める
+    """
+    migration = load_migration("c8d9e0f1a2b3_normalize_api_keys_model_column.py")
+
+    with patch.object(migration, "op") as op, \
+            patch.object(migration, "_api_key_columns", return_value={"model_name"}):
+        migration.downgrade()
+
+    table, column = op.add_column.call_args.args
+    assert table == "api_keys"
+    assert column.name == "model"
+    assert column.nullable is True
+    op.execute.assert_called_once_with("UPDATE api_keys SET model = model_name")
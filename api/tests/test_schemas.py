@@ -0,0 +1,347 @@
+"""
+スキーマバリデーションテストファイル
+
+このファイルは共通の制約付き型（app/schemas/common.py）を使うスキーマの
+バリデーションとエラーメッセージをテストします。
+"""
+
+import orjson
+import pytest
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from fastapi.responses import ORJSONResponse
+from pydantic import ValidationError
+from app.models.file import FileStatus, FileType
+from app.schemas.content import ContentCreate, ContentInDB, IndexingJobUpdate, ContentSearchParams
+from app.schemas.stats import UsageStats, TopQuery, MonitoringConfig
+from app.schemas.chat import ChatRequest
+from app.schemas.tenant import TenantCreate, TenantSettings, TenantUpdate
+from app.schemas.tenant_registration import TenantRegistrationData
+
+
+def assert_error_message(exc_info, message: str):
+    """
+    ValidationErrorに指定した日本語メッセージが含まれることを確認するヘルパー関数
+    
+    引数:
+        exc_info: pytest.raisesのExceptionInfo
+        message: 期待するエラーメッセージ
+    """
+    messages = [error["msg"] for error in exc_info.value.errors()]
+    assert any(message in m for m in messages), messages
+
+
+def usage_stats_data(**overrides):
+    """
+    UsageStatsの有効な入力データを生成するヘルパー関数
+    
+    引数:
+        **overrides: 上書きする項目
+    戻り値:
+        dict: 入力データ
+    """
+    data = {
+        "tenant_id": "test-tenant",
+        "metric_type": "queries",
+        "granularity": "day",
+        "start_date": datetime(2024, 1, 1),
+        "end_date": datetime(2024, 1, 31),
+    }
+    data.update(overrides)
+    return data
+
+
+def test_chunk_settings_boundary_values():
+    """
+    境界値テスト: チャンクサイズ・オーバーラップの上下限は許可される
+    """
+    settings_min = TenantSettings(chunk_size=256, chunk_overlap=0)
+    settings_max = TenantSettings(chunk_size=4096, chunk_overlap=512)
+
+    assert settings_min.chunk_size == 256
+    assert settings_min.chunk_overlap == 0
+    assert settings_max.chunk_size == 4096
+    assert settings_max.chunk_overlap == 512
+
+
+@pytest.mark.parametrize("chunk_size", [255, 4097])
+def test_chunk_size_out_of_range(chunk_size: int):
+    """
+    異常系テスト: 範囲外のチャンクサイズは日本語メッセージで拒否される
+    """
+    with pytest.raises(ValidationError) as exc_info:
+        TenantSettings(chunk_size=chunk_size)
+    assert_error_message(exc_info, "チャンクサイズは256-4096の範囲である必要があります")
+
+
+def test_chunk_overlap_out_of_range():
+    """
+    異常系テスト: 範囲外のチャンクオーバーラップは日本語メッセージで拒否される
+    """
+    with pytest.raises(ValidationError) as exc_info:
+        ContentCreate(title="test", content_type="PDF", chunk_overlap=513)
+    assert_error_message(exc_info, "チャンクオーバーラップは0-512の範囲である必要があります")
+
+
+def test_file_content_size_limit():
+    """
+    境界値テスト: Base64のファイル内容は50MBまで許可し、超過は日本語メッセージで拒否される
+    """
+    limit = 50 * 1024 * 1024
+    content = ContentCreate(title="test", content_type="TXT", file_content="A" * limit)
+    assert len(content.file_content) == limit
+
+    with pytest.raises(ValidationError) as exc_info:
+        ContentCreate(title="test", content_type="TXT", file_content="A" * (limit + 1))
+    assert_error_message(exc_info, "ファイルサイズは50MB以内である必要があります")
+
+
+def test_optional_chunk_settings_accept_none():
+    """
+    正常系テスト: 省略可能なチャンク設定・進捗はNoneを許可する
+    """
+    content = ContentCreate(title="test", content_type="PDF")
+    job = IndexingJobUpdate()
+
+    assert content.chunk_size is None
+    assert content.chunk_overlap is None
+    assert content.file_content is None
+    assert job.progress is None
+
+
+def test_progress_out_of_range():
+    """
+    異常系テスト: 範囲外の進捗は日本語メッセージで拒否される
+    """
+    with pytest.raises(ValidationError) as exc_info:
+        IndexingJobUpdate(progress=101)
+    assert_error_message(exc_info, "進捗は0-100の範囲である必要があります")
+
+
+def test_rate_out_of_range():
+    """
+    異常系テスト: 範囲外の比率は項目ごとの日本語メッセージで拒否される
+    """
+    with pytest.raises(ValidationError) as exc_info:
+        UsageStats(**usage_stats_data(feedback_rate=1.5))
+    assert_error_message(exc_info, "評価率は0-1の範囲である必要があります")
+
+    with pytest.raises(ValidationError) as exc_info:
+        TopQuery(query="q", count=1, like_rate=-0.1, avg_response_time_ms=0.0)
+    assert_error_message(exc_info, "いいね率は0-1の範囲である必要があります")
+
+
+def test_non_negative_fields_reject_negative_values():
+    """
+    異常系テスト: 負の件数・数値は項目ごとの日本語メッセージで拒否される
+    """
+    with pytest.raises(ValidationError) as exc_info:
+        UsageStats(**usage_stats_data(total_queries=-1))
+    assert_error_message(exc_info, "総質問数は0以上である必要があります")
+
+    with pytest.raises(ValidationError) as exc_info:
+        UsageStats(**usage_stats_data(avg_response_time_ms=-0.5))
+    assert_error_message(exc_info, "平均応答時間は0以上である必要があります")
+
+    with pytest.raises(ValidationError) as exc_info:
+        TenantSettings(max_storage_mb=-1)
+    assert_error_message(exc_info, "最大ストレージサイズは0以上である必要があります")
+
+
+def test_temperature_and_max_tokens_ranges():
+    """
+    境界値テスト: temperature・max_tokensの範囲と日本語メッセージ
+    """
+    settings = TenantSettings(temperature=2.0, max_tokens=4000)
+    assert settings.temperature == 2.0
+    assert settings.max_tokens == 4000
+
+    with pytest.raises(ValidationError) as exc_info:
+        TenantSettings(temperature=2.1)
+    assert_error_message(exc_info, "temperatureは0.0-2.0の範囲である必要があります")
+
+    with pytest.raises(ValidationError) as exc_info:
+        TenantSettings(max_tokens=0)
+    assert_error_message(exc_info, "max_tokensは1-4000の範囲である必要があります")
+
+    with pytest.raises(ValidationError) as exc_info:
+        ChatRequest(query="hello", temperature=-0.1)
+    assert_error_message(exc_info, "temperatureは0.0-2.0の範囲である必要があります")
+
+
+def test_check_interval_out_of_range():
+    """
+    異常系テスト: 範囲外のチェック間隔は日本語メッセージで拒否される
+    """
+    with pytest.raises(ValidationError) as exc_info:
+        MonitoringConfig(tenant_id="test-tenant", check_interval_minutes=1441)
+    assert_error_message(exc_info, "チェック間隔は1-1440分の範囲である必要があります")
+
+
+def tenant_registration_data(**overrides):
+    """
+    TenantRegistrationDataの有効な入力データを生成するヘルパー関数
+    
+    引数:
+        **overrides: 上書きする項目
+    戻り値:
+        dict: 入力データ
+    """
+    data = {
+        "tenant_name": "Test Tenant",
+        "tenant_domain": "test-tenant",
+        "admin_email": "admin@example.com",
+        "admin_username": "test_admin",
+        "admin_password": "SecurePassword1",
+    }
+    data.update(overrides)
+    return data
+
+
+def test_tenant_registration_normalizes_strings():
+    """
+    正常系テスト: 前後の空白を除去し、テナント識別子は小文字に正規化する
+    """
+    data = TenantRegistrationData(**tenant_registration_data(
+        tenant_name="  Test Tenant  ",
+        tenant_domain=" Test-Tenant_01 ",
+        admin_username=" test_admin ",
+    ))
+
+    assert data.tenant_name == "Test Tenant"
+    assert data.tenant_domain == "test-tenant_01"
+    assert data.admin_username == "test_admin"
+
+
+@pytest.mark.parametrize("field,value,message", [
+    ("tenant_name", " a ", "テナント名は2文字以上である必要があります"),
+    ("tenant_name", "a" * 256, "テナント名は255文字以内である必要があります"),
+    ("tenant_domain", "ab", "テナント識別子は3文字以上である必要があります"),
+    ("tenant_domain", "test tenant", "テナント識別子は英数字、ハイフン、アンダースコアのみ使用可能です"),
+    ("admin_username", "ab", "ユーザー名は3文字以上である必要があります"),
+    ("admin_username", "a" * 101, "ユーザー名は100文字以内である必要があります"),
+    ("admin_username", "test-admin", "ユーザー名は英数字とアンダースコアのみ使用可能です"),
+])
+def test_tenant_registration_string_errors(field: str, value: str, message: str):
+    """
+    異常系テスト: 登録時の文字列制約違反は日本語メッセージで拒否される
+    """
+    with pytest.raises(ValidationError) as exc_info:
+        TenantRegistrationData(**tenant_registration_data(**{field: value}))
+    assert_error_message(exc_info, message)
+
+
+def test_tenant_create_and_update_normalize_like_registration():
+    """
+    正常系テスト: テナント作成・更新でも登録時と同じく前後の空白を除去し、識別子を小文字に正規化する
+    """
+    registration = TenantRegistrationData(**tenant_registration_data(
+        tenant_name="  Test Tenant  ",
+        tenant_domain=" Test-Tenant_01 ",
+    ))
+    created = TenantCreate(name="  Test Tenant  ", domain=" Test-Tenant_01 ")
+    updated = TenantUpdate(name="  Test Tenant  ", domain=" Test-Tenant_01 ")
+
+    assert created.name == updated.name == registration.tenant_name == "Test Tenant"
+    assert created.domain == updated.domain == registration.tenant_domain == "test-tenant_01"
+    assert TenantUpdate().domain is None
+
+    with pytest.raises(ValidationError) as exc_info:
+        TenantUpdate(domain="test tenant")
+    assert_error_message(exc_info, "テナント識別子は英数字、ハイフン、アンダースコアのみ使用可能です")
+
+
+def test_username_rejects_non_ascii_letters():
+    """
+    異常系テスト: ユーザー名はフロントエンドと同じASCIIの英数字・アンダースコアのみ許可する
+    （str.isalnumで許可されていた全角文字・非ASCII文字は拒否される）
+    """
+    for username in ["山田_太郎", "ｔｅｓｔ_user", "josé_admin"]:
+        with pytest.raises(ValidationError) as exc_info:
+            TenantRegistrationData(**tenant_registration_data(admin_username=username))
+        assert_error_message(exc_info, "ユーザー名は英数字とアンダースコアのみ使用可能です")
+
+
+def test_search_cursor_requires_both_fields():
+    """
+    異常系テスト: 検索のカーソルは created_at と id の両方が必要
+    """
+    with pytest.raises(ValidationError) as exc_info:
+        ContentSearchParams(query="test", cursor_created_at=datetime(2024, 1, 1))
+    assert_error_message(exc_info, "cursor_created_atとcursor_idは両方指定する必要があります")
+
+    params = ContentSearchParams(query="test")
+    assert params.cursor is None
+
+    cursor_id = uuid.uuid4()
+    params = ContentSearchParams(query="test", cursor_created_at=datetime(2024, 1, 1), cursor_id=cursor_id)
+    assert params.cursor == (datetime(2024, 1, 1), cursor_id)
+
+
+def make_file_row(**overrides):
+    """
+    Fileモデルと同じ属性を持つテスト用オブジェクトを生成するヘルパー関数
+    """
+    now = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+    row = dict(
+        id=uuid.uuid4(),
+        tenant_id=uuid.uuid4(),
+        title="テストファイル",
+        file_type=FileType.PDF,
+        description=None,
+        tags=None,
+        metadata_json=None,
+        file_name="test.pdf",
+        size_bytes=2048,
+        status=FileStatus.INDEXED,
+        uploaded_at=now,
+        indexed_at=now,
+        created_at=now,
+        updated_at=now,
+    )
+    row.update(overrides)
+    return SimpleNamespace(**row)
+
+
+def test_content_build_trusted_matches_from_orm():
+    """
+    正常系テスト: build_trustedはバリデーションありの変換と同じ値・型を返す
+    """
+    row = make_file_row(tags=["a", "b"], metadata_json={"source": "upload"}, description="説明")
+    
+    trusted = ContentInDB.build_trusted(row)
+    validated = ContentInDB.from_orm(row)
+    
+    assert trusted.model_dump() == validated.model_dump()
+    assert type(trusted.content_type) is type(validated.content_type)
+    assert type(trusted.status) is type(validated.status)
+    assert trusted.model_dump_json() == validated.model_dump_json()
+
+
+def test_content_build_trusted_defaults():
+    """
+    正常系テスト: tags・metadataが未設定の行は空のリスト・辞書になる
+    """
+    trusted = ContentInDB.build_trusted(make_file_row())
+    
+    assert trusted.tags == []
+    assert trusted.metadata == {}
+    assert trusted.id == str(trusted.id)
+
+
+def test_orjson_response_renders_content():
+    """
+    正常系テスト: ORJSONResponseがスキーマのダンプ結果（UUID文字列・datetime・日本語）をJSONに変換できる
+    """
+    row = make_file_row()
+    content = ContentInDB.build_trusted(row).model_dump()
+    
+    response = ORJSONResponse([content])
+    body = orjson.loads(response.body)
+    
+    assert response.media_type == "application/json"
+    assert "テストファイル".encode() in response.body
+    assert body[0]["id"] == str(row.id)
+    assert body[0]["created_at"] == "2026-01-01T12:00:00+00:00"
+    assert body[0]["content_type"] == FileType.PDF.value